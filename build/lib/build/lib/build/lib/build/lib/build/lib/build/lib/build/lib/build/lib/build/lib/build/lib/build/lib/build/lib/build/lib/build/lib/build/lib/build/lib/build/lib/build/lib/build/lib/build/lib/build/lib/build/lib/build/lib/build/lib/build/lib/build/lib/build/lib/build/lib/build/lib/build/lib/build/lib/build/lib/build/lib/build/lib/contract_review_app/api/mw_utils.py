@@ -1,7 +1,8 @@
 from starlette.responses import Response
-import json
 from typing import Tuple
 
+from contract_review_app.core import json_codec
+
 async def capture_response(response) -> Tuple[bytes, dict, str]:
     chunks = []
     async for section in response.body_iterator:
@@ -15,9 +16,12 @@ def normalize_status_if_json(body: bytes, media_type: str) -> bytes:
     if not body or not media_type.startswith("application/json"):
         return body
     try:
-        payload = json.loads(body)
+        payload = json_codec.loads(body)
         if isinstance(payload, dict) and isinstance(payload.get("status"), str):
-            payload["status"] = payload["status"].lower()
-        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            status = payload["status"]
+            if status != status.lower():
+                payload["status"] = status.lower()
+                return json_codec.dumps_envelope(payload)
+        return body
     except Exception:
         return body
@@ -0,0 +1,53 @@
+"""JSON response class used for API envelopes."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+from contract_review_app.core import json_codec
+from contract_review_app.metrics import latency
+
+
+class FastJSONResponse(JSONResponse):
+    """:class:`JSONResponse` rendered through :mod:`core.json_codec`.
+
+    Lists shared between envelope keys (``findings``/``clauses``/
+    ``analysis.findings``) are encoded once.  With ``stage`` set, encoding
+    time is recorded as that latency stage.  The content object is left in
+    the request state as ``response_content`` for the response trace.
+    """
+
+    # the full signature is kept: FastAPI reads the status_code default from it
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        stage: Optional[str] = None,
+    ) -> None:
+        self.stage = stage
+        self.content = content
+        super().__init__(content, status_code, headers, media_type, background)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # ApiRequestMiddleware traces this object instead of re-parsing the body
+        scope.setdefault("state", {})["response_content"] = self.content
+        await super().__call__(scope, receive, send)
+
+    def render(self, content: Any) -> bytes:
+        if self.stage is None:
+            return json_codec.dumps_envelope(content)
+        start = time.perf_counter()
+        raw = json_codec.dumps_envelope(content)
+        latency.record(self.stage, (time.perf_counter() - start) * 1000.0)
+        return raw
+
+
+__all__ = ["FastJSONResponse"]
@@ -0,0 +1 @@
+from .policy_packs.yaml_runtime import *  # noqa: F401,F403
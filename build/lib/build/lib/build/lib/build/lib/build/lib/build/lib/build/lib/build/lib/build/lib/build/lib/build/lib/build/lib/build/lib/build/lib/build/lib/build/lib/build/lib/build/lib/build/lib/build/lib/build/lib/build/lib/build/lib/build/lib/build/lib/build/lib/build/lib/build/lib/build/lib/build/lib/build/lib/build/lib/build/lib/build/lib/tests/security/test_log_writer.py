@@ -0,0 +1,94 @@
+import queue
+
+from cryptography.fernet import Fernet
+
+from contract_review_app.security import log_writer, secure_store
+from contract_review_app.security.log_writer import BatchedLogWriter
+
+
+def _use_key(monkeypatch):
+    key = Fernet.generate_key()
+    monkeypatch.setenv("CR_ATREST_KEY", key.decode())
+    monkeypatch.setattr(secure_store, "_cipher", None)
+    return Fernet(key)
+
+
+def test_batched_lines_stay_individually_encrypted(tmp_path, monkeypatch):
+    cipher = _use_key(monkeypatch)
+    path = tmp_path / "logs" / "audit.log"
+    writer = BatchedLogWriter(batch_size=4, flush_interval_s=0.05)
+
+    assert writer.submit(path, "early") is False
+    writer.start()
+    for idx in range(10):
+        assert writer.submit(path, f'{{"n": {idx}}}')
+    writer.flush()
+    assert len(path.read_bytes().splitlines()) == 10
+    writer.submit(path, "last")
+    writer.stop()
+
+    raw = path.read_bytes().splitlines()
+    assert [cipher.decrypt(line).decode() for line in raw] == [
+        f'{{"n": {idx}}}' for idx in range(10)
+    ] + ["last"]
+    assert b"last" not in path.read_bytes()
+    assert writer.submit(path, "late") is False
+
+
+def test_full_queue_waits_for_room_then_falls_back_to_caller(tmp_path, monkeypatch):
+    cipher = _use_key(monkeypatch)
+    path = tmp_path / "a.log"
+    writer = BatchedLogWriter(max_queue=1, batch_size=1, flush_interval_s=0)
+    writer.start()
+    for idx in range(20):
+        assert writer.submit(path, str(idx))
+    writer.stop()
+    lines = [cipher.decrypt(line).decode() for line in path.read_bytes().splitlines()]
+    assert lines == [str(idx) for idx in range(20)]
+
+    stalled = BatchedLogWriter(max_queue=1, put_timeout_s=0.01)
+    stalled._queue = queue.Queue(maxsize=1)  # queue without a consumer thread
+    assert stalled.submit(path, "one") is True
+    assert stalled.submit(path, "two") is False
+
+
+def test_failed_batches_retry_then_write_line_by_line(tmp_path, monkeypatch):
+    cipher = _use_key(monkeypatch)
+    monkeypatch.setattr(log_writer, "_RETRY_DELAY_S", 0)
+    path = tmp_path / "audit.log"
+    calls = []
+
+    def broken_append(*args, **kwargs):
+        calls.append(args)
+        raise OSError("disk hiccup")
+
+    monkeypatch.setattr(secure_store, "secure_append_lines", broken_append)
+    writer = BatchedLogWriter()
+    writer._write([(str(path), "a"), (str(path), "b")])
+
+    assert len(calls) == log_writer._WRITE_ATTEMPTS
+    assert [cipher.decrypt(line) for line in path.read_bytes().splitlines()] == [b"a", b"b"]
+    assert writer.failed_lines == 0 and not writer.failing
+
+
+def test_persistent_failure_is_counted_and_pushes_callers_to_write(
+    tmp_path, monkeypatch, caplog
+):
+    monkeypatch.setattr(log_writer, "_RETRY_DELAY_S", 0)
+
+    def broken(*args, **kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(secure_store, "secure_append_lines", broken)
+    monkeypatch.setattr(secure_store, "secure_write", broken)
+    writer = BatchedLogWriter(flush_interval_s=0)
+    writer.start()
+    try:
+        assert writer.submit(tmp_path / "audit.log", "lost")
+        writer.flush()
+        assert writer.failed_lines == 1
+        assert writer.failing
+        assert writer.submit(tmp_path / "audit.log", "next") is False
+        assert any(r.levelname == "ERROR" for r in caplog.records)
+    finally:
+        writer.stop()
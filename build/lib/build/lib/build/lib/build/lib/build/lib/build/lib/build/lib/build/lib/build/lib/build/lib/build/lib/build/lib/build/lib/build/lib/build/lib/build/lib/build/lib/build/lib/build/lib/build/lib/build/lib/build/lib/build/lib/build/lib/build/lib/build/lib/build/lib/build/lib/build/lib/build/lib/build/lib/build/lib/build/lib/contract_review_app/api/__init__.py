@@ -0,0 +1,3 @@
+from .cache import IDEMPOTENCY_CACHE
+
+__all__ = ["IDEMPOTENCY_CACHE"]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+"""Heuristic document type classifier."""
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .patterns_doctype import DOC_TYPE_PATTERNS as BASE_DOC_TYPE_PATTERNS
+from .patterns_contract_types import CONTRACT_TYPE_PATTERNS
+
+DOC_TYPE_PATTERNS: Dict[str, Dict[str, Any]] = {
+    **BASE_DOC_TYPE_PATTERNS,
+    **CONTRACT_TYPE_PATTERNS,
+}
+
+W_TITLE = 0.3
+W_SUBJECT = 0.2
+W_BODY = 0.5
+
+# Optional early-prefix mode: classify long documents from their first N KB
+# plus heading lines and fall back to the full text unless that is decisive.
+DOC_TYPE_PREFIX_KB = int(os.getenv("DOC_TYPE_PREFIX_KB", "0"))
+PREFIX_DECISIVE_MARGIN = 0.5
+_LINE_RX = re.compile(r"[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+_HEADING_RX = re.compile(
+    r"^[ \t]*(\d+(?:\.\d+)*\.?[ \t]+\S[^\n]{0,80}|[A-Z][A-Z0-9 &,'()\-]{2,80}"
+    r"|(?i:schedule|annex|appendix)\b[^\n]{0,80})[ \t]*$",
+    re.MULTILINE,
+)
+
+DISPLAY_MAP = {
+    "nda": "NDA",
+    "msa_services": "MSA (Services)",
+    "supply_of_goods": "Supply of Goods",
+    "dpa_uk_gdpr": "DPA",
+    "license_ip": "License (IP)",
+    "distribution": "Distribution",
+    "reseller": "Reseller",
+    "spa_shares": "SPA (Shares)",
+    "employment": "Employment",
+    "loan": "Loan",
+    "lease": "Lease",
+    "saas_subscription": "SaaS Subscription",
+    "consultancy": "Consultancy",
+    "settlement": "Settlement",
+    "shareholders": "Shareholders",
+    "joint_venture": "Joint Venture",
+    "framework_calloff": "Framework Call-Off",
+    "manufacturing": "Manufacturing",
+    "maintenance_support": "Maintenance & Support",
+    "agency": "Agency",
+    "franchise": "Franchise",
+    "guarantee": "Guarantee",
+}
+
+
+def slug_to_display(slug: str) -> str:
+    return DISPLAY_MAP.get(slug, slug.replace("_", " ").title())
+
+
+def _lowered(values: Iterable[str] | None) -> Tuple[Tuple[str, str], ...]:
+    return tuple((value, value.lower()) for value in values or [])
+
+
+_COMPILED: Dict[str, Dict[str, Any]] = {
+    slug: {
+        "title": _lowered(cfg.get("title_keywords", [])),
+        "body": _lowered(cfg.get("body_keywords", [])),
+        "boost": tuple(
+            (phrase, phrase.lower(), float(weight))
+            for phrase, weight in cfg.get("boost_phrases", {}).items()
+        ),
+        "must_any": _lowered(cfg.get("must_have_any")),
+        "negative": _lowered(cfg.get("negative")),
+    }
+    for slug, cfg in DOC_TYPE_PATTERNS.items()
+}
+
+
+class _Presence(dict):
+    """Lazily memoized ``phrase in haystack`` lookups.
+
+    Slugs share phrases; each distinct phrase is searched at most once per
+    haystack, and short-circuiting checks never search the remainder.
+    """
+
+    def __init__(self, haystack: str) -> None:
+        super().__init__()
+        self.haystack = haystack
+
+    def __missing__(self, phrase: str) -> bool:
+        present = phrase in self.haystack
+        self[phrase] = present
+        return present
+
+
+def _match_keywords(
+    presence: _Presence, keywords: Tuple[Tuple[str, str], ...]
+) -> Tuple[int, List[str]]:
+    hits = [kw for kw, lowered in keywords if kw and presence[lowered]]
+    return len(hits), hits
+
+
+ABBREV_MAP = {
+    "NDA": "nda",
+    "MSA": "msa_services",
+    "DPA": "dpa_uk_gdpr",
+    "SPA": "spa_shares",
+}
+
+
+def _fallback_doc_type(title: str, body: str) -> str:
+    upper = title.upper()
+    for abbr, slug in ABBREV_MAP.items():
+        if abbr in upper:
+            return slug
+    for abbr, slug in ABBREV_MAP.items():
+        if abbr in body.upper():
+            return slug
+    return "unknown"
+
+
+def _first_lines(text: str, count: int) -> List[str]:
+    lines: List[str] = []
+    for line in _LINE_RX.finditer(text):
+        stripped = line.group(0).strip()
+        if stripped:
+            lines.append(stripped)
+            if len(lines) == count:
+                break
+    return lines
+
+
+def _prefix_view(text: str, prefix_kb: int) -> str | None:
+    limit = prefix_kb * 1024
+    if prefix_kb <= 0 or len(text) <= limit:
+        return None
+    headings = _HEADING_RX.findall(text, limit)
+    return "\n".join([text[:limit], *headings])
+
+
+def guess_doc_type(
+    text: str, subject: str | None = None, prefix_kb: int | None = None
+) -> Tuple[str, float, List[str], Dict[str, float], str]:
+    """Return (slug, confidence, evidence_strings, score_by_type, source).
+
+    With ``prefix_kb`` (default ``DOC_TYPE_PREFIX_KB``) set, documents longer
+    than that are first classified from their first ``prefix_kb`` KB plus
+    heading lines; the full text is only scanned when that result is not
+    decisive, i.e. the runner-up scores above ``PREFIX_DECISIVE_MARGIN`` of
+    the winner or only the abbreviation fallback matched.
+    """
+    t = text or ""
+    view = _prefix_view(t, DOC_TYPE_PREFIX_KB if prefix_kb is None else prefix_kb)
+    if view is not None:
+        result = _classify(view, subject)
+        scores = sorted(result[3].values(), reverse=True)
+        if len(scores) > 1 and scores[0] > 0 and scores[1] <= PREFIX_DECISIVE_MARGIN:
+            return result
+    return _classify(t, subject)
+
+
+def _classify(t: str, subject: str | None) -> Tuple[str, float, List[str], Dict[str, float], str]:
+    # normalize text
+    lowered = t.lower()
+    title = " ".join(_first_lines(t, 2)).lower()
+    subj = (subject or "").lower()
+
+    found_title = _Presence(title)
+    found_subj = _Presence(subj)
+    found_body = _Presence(lowered)
+
+    score_raw: Dict[str, float] = {}
+    evidences: Dict[str, List[str]] = {}
+    title_hits_map: Dict[str, int] = {}
+    body_hits_map: Dict[str, int] = {}
+    subj_hits_map: Dict[str, int] = {}
+
+    for slug, cfg in _COMPILED.items():
+        title_hits, title_ev = _match_keywords(found_title, cfg["title"])
+        subject_hits, subject_ev = _match_keywords(found_subj, cfg["title"])
+        body_hits, body_ev = _match_keywords(found_body, cfg["body"])
+        title_hits_map[slug] = title_hits + subject_hits
+        subj_hits_map[slug] = subject_hits
+        body_hits_map[slug] = body_hits
+        boost = 0.0
+        boost_ev: List[str] = []
+        for phrase, lowered_phrase, weight in cfg["boost"]:
+            if found_body[lowered_phrase]:
+                boost += weight
+                boost_ev.append(phrase)
+        score = W_TITLE * title_hits + W_SUBJECT * subject_hits + W_BODY * (body_hits + boost)
+        must_any = cfg["must_any"]
+        if must_any and not any(found_body[m] for _, m in must_any):
+            score = 0.0
+        negative = cfg["negative"]
+        if negative and any(found_body[n] for _, n in negative):
+            score = 0.0
+        score_raw[slug] = score
+        evidences[slug] = title_ev + subject_ev + body_ev + boost_ev
+
+    max_score = max(score_raw.values()) if score_raw else 0.0
+    score_by_type: Dict[str, float] = {}
+    for slug, sc in score_raw.items():
+        score_by_type[slug] = sc / max_score if max_score else 0.0
+    best_slug = max(score_raw, key=score_raw.get) if score_raw else "unknown"
+    confidence = score_by_type.get(best_slug, 0.0)
+    evidence = evidences.get(best_slug, [])
+    source = "classifier"
+    if title_hits_map.get(best_slug):
+        source = "title"
+    elif body_hits_map.get(best_slug):
+        source = "keywords"
+    if max_score == 0.0:
+        fb = _fallback_doc_type(title, lowered)
+        if fb != "unknown":
+            best_slug = fb
+            source = "title"
+            confidence = 0.5
+            score_by_type = {fb: 1.0}
+    return best_slug, round(confidence, 2), evidence, score_by_type, source
+
@@ -0,0 +1,266 @@
+"""Per-stage latency histograms for the analysis pipeline.
+
+Every thread records into its own log-bucketed histograms, so recording is a
+bucket lookup plus a few increments with no lock; readers merge the
+per-thread shards, folding those of finished threads into one.  Buckets grow
+by ``2 ** 0.25`` (~19 %) from 10 µs to ~10 min, which bounds the relative
+error of the reported quantiles.
+
+Each worker process keeps its own histograms.  The Prometheus text exports
+them as cumulative histograms (every fourth bucket bound, i.e. doubling
+``le`` bounds), so buckets from every worker can be summed and fed to
+``histogram_quantile`` to see the whole deployment.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+STAGES = (
+    "intake",
+    "parse",
+    "dispatch",
+    "engine",
+    "constraints",
+    "merge",
+    "serialization",
+)
+# characters per nominal page for ``ms/page`` figures
+PAGE_CHARS = 3000
+
+_GROWTH = 2 ** 0.25
+_BOUNDS: List[float] = [0.01 * _GROWTH ** i for i in range(int(math.log(600_000 / 0.01, _GROWTH)) + 1)]
+# bucket indexes exported as Prometheus ``le`` bounds (doubling)
+_PROM_BUCKETS = range(0, len(_BOUNDS), 4)
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(_BOUNDS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def merge(self, other: "_Histogram") -> None:
+        for idx, n in enumerate(other.counts):
+            if n:
+                self.counts[idx] += n
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            if not n:
+                continue
+            if seen + n >= rank:
+                lo = _BOUNDS[idx - 1] if idx else 0.0
+                hi = _BOUNDS[idx] if idx < len(_BOUNDS) else self.max_ms
+                value = lo + (hi - lo) * ((rank - seen) / n)
+                return min(value, self.max_ms)
+            seen += n
+        return self.max_ms
+
+
+class _Shard:
+    __slots__ = ("stages", "docs", "doc_ms", "doc_pages")
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, _Histogram] = {}
+        self.docs = 0
+        self.doc_ms = 0.0
+        self.doc_pages = 0
+
+    def merge(self, other: "_Shard") -> None:
+        for stage, hist in list(other.stages.items()):
+            self.stages.setdefault(stage, _Histogram()).merge(hist)
+        self.docs += other.docs
+        self.doc_ms += other.doc_ms
+        self.doc_pages += other.doc_pages
+
+    def clear(self) -> None:
+        self.stages.clear()
+        self.docs = 0
+        self.doc_ms = 0.0
+        self.doc_pages = 0
+
+
+_local = threading.local()
+# (owning thread, shard); guarded by _shards_lock
+_shards: List[Tuple[threading.Thread, _Shard]] = []
+# samples of threads that have exited
+_retired = _Shard()
+_shards_lock = threading.Lock()
+
+
+def _fold_finished() -> None:
+    """Merge shards of finished threads into ``_retired``; hold the lock."""
+
+    live = []
+    for thread, shard in _shards:
+        if thread.is_alive():
+            live.append((thread, shard))
+        else:
+            _retired.merge(shard)
+    _shards[:] = live
+
+
+def _shard() -> _Shard:
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = _Shard()
+        with _shards_lock:
+            _fold_finished()
+            _shards.append((threading.current_thread(), shard))
+    return shard
+
+
+def _all_shards() -> List[_Shard]:
+    """Every shard, for readers; hold the lock while using them."""
+
+    _fold_finished()
+    return [_retired] + [shard for _, shard in _shards]
+
+
+def record(stage: str, ms: float) -> None:
+    """Add one ``ms`` sample to ``stage`` (called on the request path)."""
+
+    stages = _shard().stages
+    hist = stages.get(stage)
+    if hist is None:
+        hist = stages[stage] = _Histogram()
+    hist.add(ms if ms > 0.0 else 0.0)
+
+
+def record_document(ms: float, chars: int) -> None:
+    """Count one analysed document of ``chars`` characters taking ``ms``."""
+
+    shard = _shard()
+    shard.docs += 1
+    shard.doc_ms += ms
+    shard.doc_pages += max(1, -(-int(chars) // PAGE_CHARS))
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, (time.perf_counter() - start) * 1000.0)
+
+
+def _merged() -> Dict[str, _Histogram]:
+    merged = _Shard()
+    with _shards_lock:
+        for shard in _all_shards():
+            merged.merge(shard)
+    return merged.stages
+
+
+def snapshot() -> List[Dict[str, float]]:
+    """Per-stage ``count``/``sum_ms``/``p50_ms``/``p95_ms``/``p99_ms``/``max_ms``.
+
+    Known stages come first in pipeline order, even before their first sample.
+    """
+
+    merged = _merged()
+    names = list(STAGES) + sorted(set(merged) - set(STAGES))
+    out: List[Dict[str, float]] = []
+    for name in names:
+        hist = merged.get(name) or _Histogram()
+        out.append(
+            {
+                "stage": name,
+                "count": hist.count,
+                "sum_ms": round(hist.sum_ms, 3),
+                "p50_ms": round(hist.quantile(0.50), 3),
+                "p95_ms": round(hist.quantile(0.95), 3),
+                "p99_ms": round(hist.quantile(0.99), 3),
+                "max_ms": round(hist.max_ms, 3),
+            }
+        )
+    return out
+
+
+def document_totals() -> Dict[str, float]:
+    with _shards_lock:
+        shards = _all_shards()
+        return {
+            "docs": sum(s.docs for s in shards),
+            "ms": sum(s.doc_ms for s in shards),
+            "pages": sum(s.doc_pages for s in shards),
+        }
+
+
+def to_prometheus(prefix: str = "contract_ai") -> str:
+    """Prometheus text exposition (histogram per stage plus document totals)."""
+
+    name = f"{prefix}_stage_latency_ms"
+    lines = [
+        f"# HELP {name} Analysis pipeline stage latency in milliseconds.",
+        f"# TYPE {name} histogram",
+    ]
+    merged = _merged()
+    for stage in list(STAGES) + sorted(set(merged) - set(STAGES)):
+        hist = merged.get(stage) or _Histogram()
+        label = f'stage="{stage}"'
+        cumulative = 0
+        prev = 0
+        for idx in _PROM_BUCKETS:
+            cumulative += sum(hist.counts[prev : idx + 1])
+            prev = idx + 1
+            lines.append(f'{name}_bucket{{{label},le="{_BOUNDS[idx]:.6g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{label},le="+Inf"}} {hist.count}')
+        lines.append(f"{name}_sum{{{label}}} {round(hist.sum_ms, 3)}")
+        lines.append(f"{name}_count{{{label}}} {hist.count}")
+    totals = document_totals()
+    lines += [
+        f"# TYPE {prefix}_documents_total counter",
+        f"{prefix}_documents_total {totals['docs']}",
+        f"# TYPE {prefix}_document_pages_total counter",
+        f"{prefix}_document_pages_total {totals['pages']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def reset(stage: Optional[str] = None) -> None:
+    """Drop recorded samples (all stages, or just ``stage``); for tests."""
+
+    with _shards_lock:
+        for shard in _all_shards():
+            if stage is None:
+                shard.clear()
+            else:
+                shard.stages.pop(stage, None)
+
+
+__all__ = [
+    "PAGE_CHARS",
+    "STAGES",
+    "document_totals",
+    "record",
+    "record_document",
+    "reset",
+    "snapshot",
+    "timed",
+    "to_prometheus",
+]
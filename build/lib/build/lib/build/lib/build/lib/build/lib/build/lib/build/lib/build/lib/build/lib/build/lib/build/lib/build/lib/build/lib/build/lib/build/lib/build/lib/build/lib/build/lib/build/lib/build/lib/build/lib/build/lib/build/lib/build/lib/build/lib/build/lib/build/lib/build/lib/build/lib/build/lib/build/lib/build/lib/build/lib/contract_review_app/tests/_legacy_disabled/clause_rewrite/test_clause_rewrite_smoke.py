@@ -0,0 +1,3 @@
+def test_clause_rewrite_import_smoke():
+    __import__("contract_review_app.clause_rewrite")
+    assert True
@@ -0,0 +1,3 @@
+def test_contract_intake_import_smoke():
+    __import__("contract_review_app.contract_intake")
+    assert True
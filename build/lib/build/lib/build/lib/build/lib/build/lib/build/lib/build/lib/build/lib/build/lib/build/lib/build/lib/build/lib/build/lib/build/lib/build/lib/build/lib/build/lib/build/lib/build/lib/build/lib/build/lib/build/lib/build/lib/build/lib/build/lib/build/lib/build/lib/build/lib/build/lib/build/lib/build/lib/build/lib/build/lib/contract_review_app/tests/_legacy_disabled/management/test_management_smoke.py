@@ -0,0 +1,3 @@
+def test_management_import_smoke():
+    __import__("contract_review_app.management")
+    assert True
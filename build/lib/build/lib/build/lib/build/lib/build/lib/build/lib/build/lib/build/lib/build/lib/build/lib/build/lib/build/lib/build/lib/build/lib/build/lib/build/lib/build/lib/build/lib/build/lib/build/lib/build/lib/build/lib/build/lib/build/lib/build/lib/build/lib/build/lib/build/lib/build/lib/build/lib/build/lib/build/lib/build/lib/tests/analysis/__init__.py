@@ -0,0 +1 @@
+"""Analysis tests package."""
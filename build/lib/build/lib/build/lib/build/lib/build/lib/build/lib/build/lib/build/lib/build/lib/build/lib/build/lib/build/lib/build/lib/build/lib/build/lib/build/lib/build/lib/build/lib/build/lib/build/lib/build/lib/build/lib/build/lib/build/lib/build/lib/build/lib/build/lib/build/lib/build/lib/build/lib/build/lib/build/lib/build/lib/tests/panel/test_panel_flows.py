@@ -0,0 +1,74 @@
+from pathlib import Path
+import os
+from fastapi.testclient import TestClient
+from contract_review_app.api.app import app
+from contract_review_app.api.models import SCHEMA_VERSION
+
+
+client = TestClient(app)
+
+
+def _headers():
+    return {
+        "x-schema-version": SCHEMA_VERSION,
+        "x-api-key": os.getenv("API_KEY", "local-test-key-123"),
+    }
+
+
+def _apply_ops(text: str, ops):
+    result = text
+    for op in sorted(ops, key=lambda o: o["start"], reverse=True):
+        result = result[: op["start"]] + op["replacement"] + result[op["end"] :]
+    return result
+
+
+def test_panel_end_to_end_flow():
+    # Step 1: analyze mini NDA
+    fixture = Path(__file__).resolve().parents[1] / "fixtures" / "nda_mini.txt"
+    text = fixture.read_text(encoding="utf-8")
+    r = client.post(
+        "/api/analyze",
+        json={"text": text, "language": "en-GB"},
+        headers=_headers(),
+    )
+    assert r.status_code == 200
+    data = r.json()
+    findings = data["analysis"]["findings"]
+    assert findings
+
+    # ensure deduplication and valid offsets
+    keys = {(f["rule_id"], f["start"], f["end"]) for f in findings}
+    assert len(keys) == len(findings)
+    assert data["analysis"].get("duplicates_removed", 0) >= 0
+
+    norm_text = text.replace("\r\n", "\n").replace("\r", "\n")
+    for f in findings:
+        start = f["start"]
+        end = f["end"]
+        snippet = f["snippet"].replace("\r\n", "\n").replace("\r", "\n")
+        assert 0 <= start <= end <= len(norm_text)
+        assert snippet.strip()
+
+    # Step 2: draft
+    cid = r.headers.get("x-cid")
+    payload = {"clause_id": cid, "text": "Ping", "mode": "friendly"}
+    r = client.post("/api/gpt-draft", json=payload, headers=_headers())
+    assert r.status_code == 200
+    data = r.json()
+    assert data.get("draft_text", "").strip() != ""
+
+    # Step 3: suggest edits
+    original = "bad clause"
+    r = client.post(
+        "/api/suggest_edits",
+        json={"text": original, "language": "en-GB"},
+        headers=_headers(),
+    )
+    assert r.status_code == 200
+    sugg = r.json()
+    proposed = sugg.get("proposed_text", "")
+    ops = sugg.get("ops", [])
+    if proposed and proposed != original:
+        assert ops, "ops should describe edits"
+        patched = _apply_ops(original, ops)
+        assert patched == proposed
@@ -0,0 +1,57 @@
+import asyncio
+
+from contract_review_app.gpt.interfaces import DraftResult
+from contract_review_app.gpt.response_cache import LLMResponseCache, cache_key
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = 0
+
+    def draft(self, prompt):
+        self.calls += 1
+        return DraftResult(text=f"[DRAFT] {prompt}", meta={"provider": "fake"})
+
+    async def adraft(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return DraftResult(text=f"[DRAFT] {prompt}", meta={"provider": "fake"})
+
+
+def _key(prompt, **params):
+    return cache_key("fake", "m", "draft", prompt, params)
+
+
+def test_identical_requests_hit_cache():
+    cache, llm = LLMResponseCache(), CountingProvider()
+    first = cache.call(_key("Clause", t=0.2), "draft", lambda: llm.draft("Clause"))
+    second = cache.call(_key("Clause", t=0.2), "draft", lambda: llm.draft("Clause"))
+    third = cache.call(_key("Clause", t=0.9), "draft", lambda: llm.draft("Clause"))
+    assert llm.calls == 2
+    assert first.meta["cache"] == "miss"
+    assert second.meta["cache"] == "hit"
+    assert third.meta["cache"] == "miss"
+    assert first.text == second.text
+
+
+def test_concurrent_requests_are_coalesced():
+    cache, llm = LLMResponseCache(), CountingProvider()
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.acall(_key("Same"), "draft", lambda: llm.adraft("Same")) for _ in range(8))
+        )
+
+    results = asyncio.run(run())
+    assert llm.calls == 1
+    statuses = sorted(r.meta["cache"] for r in results)
+    assert statuses == ["coalesced"] * 7 + ["miss"]
+
+
+def test_disk_persistence_and_ttl(tmp_path):
+    cache = LLMResponseCache(directory=tmp_path)
+    cache.set("k", DraftResult(text="t", meta={}), "draft")
+    fresh = LLMResponseCache(directory=tmp_path)
+    assert fresh.get("k").text == "t"
+    expired = LLMResponseCache(directory=tmp_path, ttl_s=-1)
+    assert expired.get("k") is None
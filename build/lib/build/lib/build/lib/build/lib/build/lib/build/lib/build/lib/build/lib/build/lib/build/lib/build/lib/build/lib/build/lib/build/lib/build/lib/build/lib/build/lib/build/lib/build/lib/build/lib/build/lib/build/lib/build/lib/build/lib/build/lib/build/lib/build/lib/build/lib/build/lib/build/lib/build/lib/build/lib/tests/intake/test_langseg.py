@@ -0,0 +1,39 @@
+from contract_review_app.intake.langseg import detect_script, segment_lang_script
+
+
+def _seg(start, end, script, lang):
+    return {"start": start, "end": end, "script": script, "lang": lang}
+
+
+def test_detect_script_table():
+    assert detect_script("a") == "Latin"
+    assert detect_script("µ") == "Latin"
+    assert detect_script("ё") == "Cyrillic"
+    assert detect_script("λ") == "Greek"
+    assert detect_script("ש") == "Hebrew"
+    assert detect_script("م") == "Arabic"
+    assert detect_script("7") == "Common"
+    assert detect_script("中") == "Common"
+    assert detect_script("") == "Common"
+
+
+def test_space_and_dot_merges_match_run_semantics():
+    text = "Party A. Сторона b.c d, e"
+    assert segment_lang_script(text) == [
+        _seg(0, 7, "Latin", "en"),
+        _seg(7, 9, "Common", "und"),
+        _seg(9, 16, "Cyrillic", "uk"),
+        _seg(16, 17, "Common", "und"),
+        _seg(17, 19, "Latin", "en"),
+        _seg(19, 22, "Latin", "en"),
+        _seg(22, 24, "Common", "und"),
+        _seg(24, 25, "Latin", "en"),
+    ]
+
+
+def test_long_mixed_text_stays_contiguous():
+    text = "a b, " * 20000 + "Привіт"
+    segs = segment_lang_script(text)
+    assert len(segs) == 40001
+    assert segs[0]["start"] == 0 and segs[-1]["end"] == len(text)
+    assert all(a["end"] == b["start"] for a, b in zip(segs, segs[1:]))
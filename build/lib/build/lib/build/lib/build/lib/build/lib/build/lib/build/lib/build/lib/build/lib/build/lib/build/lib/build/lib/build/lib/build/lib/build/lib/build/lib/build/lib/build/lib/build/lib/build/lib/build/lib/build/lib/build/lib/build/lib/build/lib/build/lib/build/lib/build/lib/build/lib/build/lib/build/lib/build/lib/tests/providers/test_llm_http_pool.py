@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from contract_review_app.gpt.clients import http_pool
+from contract_review_app.gpt.clients.openai_client import OpenAIClient
+from contract_review_app.gpt.config import LLMConfig
+from contract_review_app.gpt.interfaces import ProviderAuthError
+
+
+class FakeLLMServer:
+    """In-process stand-in for an OpenAI-compatible chat endpoint."""
+
+    def __init__(self, fail_first: int = 0, status: int = 503):
+        self.calls = 0
+        self.fail_first = fail_first
+        self.status = status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls <= self.fail_first:
+            return httpx.Response(self.status, text="busy")
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": "drafted"}}],
+                "usage": {"total_tokens": 3},
+            },
+        )
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    monkeypatch.setattr(http_pool, "BACKOFF_MS", 1)
+    cfg = LLMConfig(openai_api_key="sk-test", openai_base="http://127.0.0.1:9")
+    yield OpenAIClient(cfg)
+    http_pool.set_transport(None)
+
+
+def test_sync_client_is_shared_and_retries(client):
+    server = FakeLLMServer(fail_first=2)
+    http_pool.set_transport(httpx.MockTransport(server))
+    res = client.draft("prompt", 16, 0.0, 5)
+    assert res.text == "drafted"
+    assert server.calls == 3
+    assert http_pool.get_client("openai") is http_pool.get_client("openai")
+
+
+def test_auth_errors_are_not_retried(client):
+    server = FakeLLMServer(fail_first=5, status=401)
+    http_pool.set_transport(httpx.MockTransport(server))
+    with pytest.raises(ProviderAuthError):
+        client.suggest_edits("prompt", 5)
+    assert server.calls == 1
+
+
+def test_async_calls_share_one_pool(client):
+    server = FakeLLMServer()
+    http_pool.set_transport(async_transport=httpx.MockTransport(server))
+
+    async def run():
+        results = await asyncio.gather(
+            *(client.adraft("p", 8, 0.0, 5) for _ in range(10))
+        )
+        pool = http_pool.get_async_client("openai")
+        assert pool is http_pool.get_async_client("openai")
+        await http_pool.aclose_all()
+        return results
+
+    results = asyncio.run(run())
+    assert [r.text for r in results] == ["drafted"] * 10
+    assert server.calls == 10
+
+
+def test_openai_streaming_yields_deltas(client):
+    def handler(request):
+        assert json.loads(request.content)["stream"] is True
+        events = [
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": "The Supplier "}}]},
+            {"choices": [{"delta": {"content": "shall deliver."}}]},
+        ]
+        body = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    http_pool.set_transport(async_transport=httpx.MockTransport(handler))
+
+    async def run():
+        return [c async for c in client.astream_draft("p", 8, 0.0, 5)]
+
+    assert asyncio.run(run()) == ["The Supplier ", "shall deliver."]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# slowdown tolerated when the bench baseline does not set its own
+DEFAULT_MAX_REGRESSION_PCT = 20.0
+# stage timings under this many ms are too noisy to gate on
+BENCH_MIN_MS = 1.0
+
+
+def load_metrics(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_quality(baseline: dict, current: dict) -> list[str]:
+    m = current.get("metrics", {})
+    rules = m.get("rules", [])
+    if rules:
+        f1 = sum(r.get("f1", 0.0) for r in rules) / len(rules)
+    else:
+        f1 = 0.0
+    coverage = m.get("coverage", {}).get("coverage", 0.0)
+    acceptance = m.get("acceptance", {}).get("acceptance_rate", 0.0)
+    perf = m.get("perf", {}).get("avg_ms_per_page", 0.0)
+
+    failures = []
+    if f1 < baseline.get("f1_min", 0.0):
+        failures.append(f"f1 {f1:.3f} < {baseline['f1_min']}")
+    if coverage < baseline.get("coverage_min", 0.0):
+        failures.append(f"coverage {coverage:.3f} < {baseline['coverage_min']}")
+    if acceptance < baseline.get("acceptance_min", 0.0):
+        failures.append(f"acceptance {acceptance:.3f} < {baseline['acceptance_min']}")
+    if perf > baseline.get("perf_max_ms_page", float("inf")):
+        failures.append(f"avg_ms_per_page {perf:.3f} > {baseline['perf_max_ms_page']}")
+    return failures
+
+
+def compare_bench(
+    baseline: dict,
+    current: dict,
+    max_regression_pct: float | None = None,
+    min_ms: float = BENCH_MIN_MS,
+) -> list[str]:
+    """Regressions of a ``tools/bench_analyze.py`` run against its baseline.
+
+    Per document, the median latency, peak memory and every stage timing may
+    grow by at most ``max_regression_pct`` (default: the baseline's own
+    ``max_regression_pct``).  Documents missing from the current run fail.
+    """
+
+    pct = max_regression_pct
+    if pct is None:
+        pct = float(baseline.get("max_regression_pct", DEFAULT_MAX_REGRESSION_PCT))
+    limit = 1.0 + pct / 100.0
+    docs = {d["name"]: d for d in current.get("documents", [])}
+
+    failures = []
+    for ref in baseline.get("documents", []):
+        name = ref["name"]
+        doc = docs.get(name)
+        if doc is None:
+            failures.append(f"{name}: missing from current run")
+            continue
+        pairs = [
+            ("ms_median", ref.get("ms_median", 0.0), doc.get("ms_median", 0.0)),
+            ("peak_mem_kb", ref.get("peak_mem_kb", 0.0), doc.get("peak_mem_kb", 0.0)),
+        ]
+        pairs += [
+            (f"stage {stage}", ms, doc.get("stages", {}).get(stage, 0.0))
+            for stage, ms in sorted(ref.get("stages", {}).items())
+            if ms >= min_ms
+        ]
+        for label, old, new in pairs:
+            if old > 0 and new > old * limit:
+                failures.append(
+                    f"{name}: {label} {new:.1f} vs {old:.1f} "
+                    f"(+{(new / old - 1.0) * 100.0:.0f}% > {pct:.0f}%)"
+                )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--baseline")
+    p.add_argument("--current")
+    p.add_argument("--bench-baseline")
+    p.add_argument("--bench-current")
+    p.add_argument("--max-regression-pct", type=float)
+    args = p.parse_args(argv)
+
+    quality = args.baseline or args.current
+    bench = args.bench_baseline or args.bench_current
+    if quality and not (args.baseline and args.current):
+        p.error("--baseline and --current go together")
+    if bench and not (args.bench_baseline and args.bench_current):
+        p.error("--bench-baseline and --bench-current go together")
+    if not quality and not bench:
+        p.error("nothing to compare")
+
+    failures = []
+    if quality:
+        failures += compare_quality(
+            load_metrics(Path(args.baseline)), load_metrics(Path(args.current))
+        )
+    if bench:
+        failures += compare_bench(
+            load_metrics(Path(args.bench_baseline)),
+            load_metrics(Path(args.bench_current)),
+            args.max_regression_pct,
+        )
+    for failure in failures:
+        print(f"[metrics_compare] {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from ..config import LLMConfig
+from .openai_client import OpenAIClient, ProviderUnavailableError
+
+
+class AzureClient(OpenAIClient):
+    """Azure OpenAI deployment; same payloads as OpenAI, different routing."""
+
+    def __init__(self, cfg: LLMConfig):
+        self.provider = "azure"
+        self.mode = "live"
+        self.model = cfg.model_draft or (cfg.azure_deployment or "")
+        self._api_key = cfg.azure_api_key or ""
+        self._endpoint = (cfg.azure_endpoint or "").rstrip("/")
+        self._deployment = cfg.azure_deployment or self.model
+        self._api_version = cfg.azure_api_version or "2024-12-01-preview"
+
+    def _url(self) -> str:
+        return (
+            f"{self._endpoint}/openai/deployments/{self._deployment}"
+            f"/chat/completions?api-version={self._api_version}"
+        )
+
+    def _headers(self) -> dict:
+        return {"api-key": self._api_key}
+
+
+__all__ = ["AzureClient", "ProviderUnavailableError"]
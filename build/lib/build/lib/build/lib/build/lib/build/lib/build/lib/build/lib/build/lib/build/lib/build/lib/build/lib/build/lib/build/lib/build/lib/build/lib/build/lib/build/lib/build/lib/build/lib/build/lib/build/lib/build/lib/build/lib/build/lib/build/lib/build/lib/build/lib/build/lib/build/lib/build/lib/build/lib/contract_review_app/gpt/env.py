@@ -0,0 +1,23 @@
+"""Environment helpers for the LLM layer (kept free of API imports)."""
+
+from __future__ import annotations
+
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Read ``name`` from the environment as an integer."""
+
+    raw = os.getenv(name)
+    if raw is None or not str(raw).strip():
+        return default
+    try:
+        return int(raw)
+    except (TypeError, ValueError):  # tolerate floats or junk values
+        try:
+            return int(float(str(raw)))
+        except (TypeError, ValueError):
+            return default
+
+
+__all__ = ["env_int"]
@@ -0,0 +1,226 @@
+"""Content-addressed cache for LLM responses with single-flight coalescing.
+
+Keys are a SHA-256 over ``(provider, model, kind, prompt, params)`` so the
+same clause re-requested from the panel is served without another provider
+round trip.  Entries are bounded by TTL and item count (LRU eviction) and can
+optionally be persisted as one JSON file per key under ``LLM_CACHE_DIR``.
+
+Concurrent identical requests share one upstream call: the first caller
+becomes the leader, everyone else waits on its result and is reported as
+``"coalesced"``.
+
+Environment:
+
+* ``LLM_CACHE`` – set to ``0`` to disable caching (default enabled)
+* ``LLM_CACHE_TTL_S`` – entry lifetime in seconds (default 900)
+* ``LLM_CACHE_MAX`` – maximum number of in-memory entries (default 512)
+* ``LLM_CACHE_DIR`` – optional directory for on-disk persistence
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from .env import env_int
+from .interfaces import DraftResult, QAResult, SuggestResult
+
+T = TypeVar("T", DraftResult, SuggestResult, QAResult)
+
+_KINDS = {"draft": DraftResult, "suggest": SuggestResult, "qa": QAResult}
+
+
+def cache_key(
+    provider: str, model: str, kind: str, prompt: str, params: Dict[str, Any]
+) -> str:
+    """Return the content address of a single LLM request."""
+
+    raw = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "kind": kind,
+            "prompt": prompt,
+            "params": params,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _clone(result: T, status: str) -> T:
+    meta = copy.deepcopy(result.meta)
+    meta["cache"] = status
+    return dataclasses.replace(result, meta=meta)
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        max_items: int = 512,
+        ttl_s: int = 900,
+        directory: Optional[str | Path] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.max = max_items
+        self.ttl = ttl_s
+        self.enabled = enabled
+        self.dir = Path(directory) if directory else None
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._ainflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.stats = {"hit": 0, "miss": 0, "coalesced": 0}
+
+    # ------------------------------------------------------------------ storage
+    def _path(self, key: str) -> Optional[Path]:
+        return self.dir / f"{key}.json" if self.dir else None
+
+    def _load_disk(self, key: str) -> Optional[Tuple[Any, float]]:
+        path = self._path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            cls = _KINDS[raw["kind"]]
+            return cls(**raw["result"]), float(raw["ts"])
+        except Exception:
+            return None
+
+    def _store_disk(self, key: str, kind: str, result: Any, ts: float) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {"kind": kind, "ts": ts, "result": dataclasses.asdict(result)},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            tmp.replace(path)
+        except Exception:  # pragma: no cover - persistence is best effort
+            pass
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                item = self._load_disk(key)
+                if item is not None:
+                    self._data[key] = item
+            if item is None:
+                return None
+            value, ts = item
+            if now - ts > self.ttl:
+                self._data.pop(key, None)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, kind: str = "") -> None:
+        ts = time.time()
+        with self._lock:
+            self._data[key] = (value, ts)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max:
+                self._data.popitem(last=False)
+        if kind:
+            self._store_disk(key, kind, value, ts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    # ------------------------------------------------------------- single-flight
+    def call(self, key: str, kind: str, fn: Callable[[], T]) -> T:
+        """Return the cached result for ``key`` or compute it once via ``fn``."""
+
+        if not self.enabled:
+            return fn()
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.stats["hit"] += 1
+                return _clone(cached, "hit")
+            with self._lock:
+                event = self._inflight.get(key)
+                leader = event is None
+                if leader:
+                    event = self._inflight[key] = threading.Event()
+            if leader:
+                break
+            event.wait()
+            cached = self.get(key)
+            if cached is not None:
+                self.stats["coalesced"] += 1
+                return _clone(cached, "coalesced")
+            # the leader failed; retry as a new leader
+        try:
+            result = fn()
+            self.set(key, result, kind)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+        self.stats["miss"] += 1
+        return _clone(result, "miss")
+
+    async def acall(self, key: str, kind: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async :meth:`call`; waiters share the leader's awaitable result."""
+
+        if not self.enabled:
+            return await fn()
+        cached = self.get(key)
+        if cached is not None:
+            self.stats["hit"] += 1
+            return _clone(cached, "hit")
+        fut = self._ainflight.get(key)
+        if fut is not None and not fut.done():
+            result = await asyncio.shield(fut)
+            self.stats["coalesced"] += 1
+            return _clone(result, "coalesced")
+        fut = asyncio.get_running_loop().create_future()
+        self._ainflight[key] = fut
+        try:
+            result = await fn()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(exc)
+                fut.exception()  # mark retrieved when nobody is waiting
+            raise
+        finally:
+            self._ainflight.pop(key, None)
+        self.set(key, result, kind)
+        fut.set_result(result)
+        self.stats["miss"] += 1
+        return _clone(result, "miss")
+
+
+def create_response_cache() -> LLMResponseCache:
+    return LLMResponseCache(
+        max_items=env_int("LLM_CACHE_MAX", 512),
+        ttl_s=env_int("LLM_CACHE_TTL_S", 900),
+        directory=os.getenv("LLM_CACHE_DIR") or None,
+        enabled=os.getenv("LLM_CACHE", "1") != "0",
+    )
+
+
+__all__ = ["LLMResponseCache", "cache_key", "create_response_cache"]
@@ -0,0 +1,13 @@
+"""Rule engine v2 package."""
+
+from .models import FindingV2, ENGINE_VERSION
+from .types import RuleFormat, RuleSource
+from .loader import PolicyPackLoader
+
+__all__ = [
+    "FindingV2",
+    "ENGINE_VERSION",
+    "RuleFormat",
+    "RuleSource",
+    "PolicyPackLoader",
+]
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import pytest
+import starlette.requests
+from fastapi.testclient import TestClient
+
+import contract_review_app.api.app as api_mod
+
+HEADERS = {"x-api-key": "k", "x-schema-version": api_mod.SCHEMA_VERSION}
+
+
+class _NoParse:
+    @staticmethod
+    def loads(*_args, **_kwargs):
+        raise AssertionError("request body parsed a second time")
+
+
+def test_body_is_parsed_once_and_shared(monkeypatch):
+    monkeypatch.setattr(starlette.requests, "json", _NoParse)
+    client = TestClient(api_mod.app)
+
+    resp = client.post(
+        "/api/calloff/validate", json={"supplier": "Acme"}, headers=HEADERS
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "ok"
+    assert resp.headers["x-schema-version"]
+
+
+def test_bad_json_and_trace_event():
+    client = TestClient(api_mod.app)
+
+    resp = client.post(
+        "/api/calloff/validate",
+        content=b"{not json",
+        headers={**HEADERS, "content-type": "application/json", "x-cid": "mw-bad-json"},
+    )
+
+    assert resp.status_code == 400
+    assert resp.headers["content-type"].startswith("application/problem+json")
+    events = api_mod._TRACE.get("mw-bad-json") or []
+    assert events and events[-1]["status"] == 400
+    assert events[-1]["path"] == "/api/calloff/validate"
+
+
+def test_cancelled_request_waits_for_the_handler():
+    cleaned = []
+
+    async def handler(scope, receive, send):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await asyncio.sleep(0.01)
+            cleaned.append(scope["path"])
+
+    mw = api_mod.ApiRequestMiddleware(handler)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/health",
+        "raw_path": b"/health",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "root_path": "",
+        "http_version": "1.1",
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def main():
+        call = asyncio.ensure_future(mw(scope, receive, send))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert cleaned == ["/health"]
+
+    asyncio.run(main())
+
+
+def test_json_response_is_traced_from_its_content(monkeypatch):
+    from contract_review_app.api.responses import FastJSONResponse
+    from contract_review_app.core import json_codec
+
+    content = {
+        "status": "OK",
+        "analysis": {"findings": [{"scope": {"unit": "sentence", "nth": 2}}]},
+    }
+    app = FastJSONResponse(content, headers={"x-cid": "mw-trace-json"})
+    mw = api_mod.ApiRequestMiddleware(app)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/thing",
+        "raw_path": b"/api/thing",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "root_path": "",
+        "http_version": "1.1",
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    with monkeypatch.context() as m:
+        m.setattr(json_codec, "loads", _NoParse.loads)
+        asyncio.run(mw(scope, receive, send))
+
+    start, body = sent
+    headers = dict((k.decode(), v.decode()) for k, v in start["headers"])
+    assert json.loads(body["body"])["status"] == "ok"
+    assert int(headers["content-length"]) == len(body["body"])
+    entry = api_mod.TRACE.get("mw-trace-json")
+    assert entry["status"] == 200
+    assert entry["body"]["analysis"]["findings"][0]["anchor"] == {"method": "nth", "nth": 2}
+    assert "anchor" not in content["analysis"]["findings"][0]
+
+
+def test_writes_require_api_key_and_schema_headers():
+    client = TestClient(api_mod.app)
+
+    resp = client.post("/api/calloff/validate", json={}, headers={"x-cid": "mw-no-key"})
+    assert resp.status_code == 401
+    assert resp.json() == {"detail": "missing x-api-key"}
+    assert api_mod.TRACE.get("mw-no-key")["status"] == 401
+
+    resp = client.post("/api/calloff/validate", json={}, headers={"x-api-key": "k"})
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "missing x-schema-version"}
@@ -0,0 +1,19 @@
+import json
+import subprocess
+import sys
+
+
+def test_doctor_repo_hygiene(tmp_path, monkeypatch):
+    out_dir = tmp_path / "diag"
+    out_dir.mkdir()
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.setenv("LLM_MODEL", "mock")
+    monkeypatch.setenv("LLM_TIMEOUT", "5")
+    cmd = [sys.executable, "tools/doctor.py", "--out", str(out_dir), "--json"]
+    rc = subprocess.call(cmd)
+    assert rc == 0
+    data = json.loads((out_dir / "analysis.json").read_text(encoding="utf-8"))
+    assert "repo" in data
+    repo = data["repo"]
+    assert "tracked_pyc" in repo
+    assert "suggestions" in repo
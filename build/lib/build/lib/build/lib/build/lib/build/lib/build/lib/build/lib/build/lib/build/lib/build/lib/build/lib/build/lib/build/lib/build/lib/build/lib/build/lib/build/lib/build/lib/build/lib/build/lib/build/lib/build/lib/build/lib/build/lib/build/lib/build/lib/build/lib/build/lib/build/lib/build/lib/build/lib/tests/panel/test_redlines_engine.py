@@ -0,0 +1,103 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from contract_review_app.api.app import app
+from contract_review_app.api.models import SCHEMA_VERSION
+from contract_review_app.core.diff import diff_ops, render_inline_html, unified_diff
+
+
+def _replay(before, after, ops):
+    assert "".join(before[o["a_start"] : o["a_end"]] for o in ops) == before
+    assert "".join(after[o["b_start"] : o["b_end"]] for o in ops) == after
+    for o in ops:
+        if o["op"] == "equal":
+            assert before[o["a_start"] : o["a_end"]] == after[o["b_start"] : o["b_end"]]
+
+
+def test_ops_cover_both_texts_at_token_and_word_granularity():
+    before = "The Supplier shall pay within 30 days, unless agreed."
+    after = "The Vendor shall pay within 45 business days, unless agreed."
+    ops, truncated = diff_ops(before, after)
+    _replay(before, after, ops)
+    assert not truncated
+    changed = [
+        (before[o["a_start"] : o["a_end"]], after[o["b_start"] : o["b_end"]])
+        for o in ops
+        if o["op"] != "equal"
+    ]
+    assert changed == [("Supplier", "Vendor"), ("30", "45 business")]
+
+    words, _ = diff_ops("pay in 30 days.", "pay in 30 days!", granularity="word")
+    assert [o["op"] for o in words] == ["equal", "replace"]
+
+    html = render_inline_html(before, after, ops)
+    assert "<del>Supplier</del><ins>Vendor</ins>" in html
+
+
+def test_budget_exceeded_falls_back_to_replace():
+    before = " ".join("x" for _ in range(200))
+    after = " ".join("y" for _ in range(200))
+    ops, truncated = diff_ops(before, after, max_cost=5)
+    _replay(before, after, ops)
+    assert truncated
+    assert any(o["op"] == "replace" for o in ops)
+
+
+def test_long_agreement_redlines_quickly():
+    clauses = [
+        f"{i}. The Supplier shall deliver the Goods within {i % 30} days of order {i}."
+        for i in range(5000)
+    ]
+    before = "\n".join(clauses)
+    clauses[100] = clauses[100].replace("Supplier", "Vendor")
+    clauses[4000] = clauses[4000].replace("days", "business days")
+    del clauses[2500]
+    after = "\n".join(clauses)
+
+    start = time.perf_counter()
+    ops, truncated = diff_ops(before, after)
+    assert time.perf_counter() - start < 5
+    _replay(before, after, ops)
+    assert not truncated
+    assert sum(o["op"] != "equal" for o in ops) == 3
+
+
+def test_unified_diff_is_bounded_by_the_budget():
+    before = "\n".join(f"line {i}" for i in range(200))
+    after = "\n".join(f"line {i}" if i % 2 else f"changed {i}" for i in range(200))
+    full = unified_diff(before, after)
+    assert full.splitlines()[:3] == ["--- before", "+++ after", "@@ -1,200 +1,200 @@"]
+    assert full.count("\n+changed") == 100
+
+    # no unique lines to anchor on: over budget the gap is one coarse hunk
+    before = "\n".join(["x"] * 200)
+    after = "\n".join(["x", "y"] * 100)
+    assert unified_diff(before, after).count("\n-x") == 100
+    assert unified_diff(before, after, max_cost=5).count("\n-x") == 199
+
+
+def test_endpoint_returns_ops_with_table_or_inline_html(monkeypatch):
+    monkeypatch.setenv("API_KEY", "local-test-key-123")
+    client = TestClient(app)
+    headers = {"x-api-key": "local-test-key-123", "x-schema-version": SCHEMA_VERSION}
+    payload = {"before_text": "hello world", "after_text": "hello there"}
+    data = client.post("/api/panel/redlines", json=payload, headers=headers).json()
+    assert data["truncated"] is False
+    assert [o["op"] for o in data["diff_ops"]] == ["equal", "replace"]
+    # the side-by-side table stays the default markup for existing panels
+    assert data["diff_html"].startswith("\n    <table")
+
+    inline = client.post(
+        "/api/panel/redlines", json={**payload, "view": "inline"}, headers=headers
+    ).json()
+    assert "<ins>there</ins>" in inline["diff_html"]
+
+    # the table is unbounded, so large texts fall back to the inline view
+    big = {
+        "before_text": "\n".join(f"Clause {i} applies." for i in range(300)),
+        "after_text": "\n".join(f"Clause {i} applies now." for i in range(300)),
+    }
+    data = client.post("/api/panel/redlines", json=big, headers=headers).json()
+    assert data["truncated"] is True
+    assert data["diff_html"].startswith('<div class="redline">')
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import copy
+import time
+
+from contract_review_app.legal_rules.aggregate import apply_merge_policy
+
+
+def test_merge_perf_5k_findings():
+    findings = [
+        {
+            "rule_id": f"rule-{idx}",
+            "channel": "substantive" if idx % 3 else "policy",
+            "salience": (idx % 120) - 10,
+            "anchor": {"start": idx * 5, "end": idx * 5 + 4},
+        }
+        for idx in range(5000)
+    ]
+
+    baseline_start = time.perf_counter()
+    apply_merge_policy(copy.deepcopy(findings), use_agenda=False)
+    baseline_duration = max(time.perf_counter() - baseline_start, 1e-6)
+
+    agenda_start = time.perf_counter()
+    merged = apply_merge_policy(copy.deepcopy(findings), use_agenda=True)
+    agenda_duration = max(time.perf_counter() - agenda_start, 0.0)
+
+    assert len(merged) == len(findings)
+    # The agenda-aware merge performs additional grouping and overlap checks, so we
+    # keep the relative slowdown bounded while enforcing a tight absolute limit.
+    assert agenda_duration <= baseline_duration * 2 + 0.02
+    assert agenda_duration <= 0.150
+
+
+def _timed_merge(findings, *, use_agenda, repeat=3):
+    # best of ``repeat`` runs keeps the large-N timings stable on busy runners
+    best = None
+    for _ in range(repeat):
+        payload = copy.deepcopy(findings)
+        start = time.perf_counter()
+        merged = apply_merge_policy(payload, use_agenda=use_agenda)
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        best = elapsed if best is None else min(best, elapsed)
+    return merged, best
+
+
+def test_merge_perf_10k_findings():
+    findings = [
+        {
+            "rule_id": f"rule-{idx}",
+            "channel": "substantive" if idx % 3 else "policy",
+            "salience": (idx % 120) - 10,
+            "anchor": {"start": idx * 5, "end": idx * 5 + 4},
+        }
+        for idx in range(10_000)
+    ]
+
+    _, baseline_duration = _timed_merge(findings, use_agenda=False)
+    merged, agenda_duration = _timed_merge(findings, use_agenda=True)
+
+    assert len(merged) == len(findings)
+    assert agenda_duration <= baseline_duration * 2 + 0.05
+    assert agenda_duration <= 1.0
+
+
+def test_merge_perf_10k_overlapping_findings():
+    channels = ["presence", "substantive", "policy", "law", "drafting", "grammar"]
+    findings = []
+    for idx in range(10_000):
+        # clusters of four near-duplicate findings per clause
+        cluster = idx // 4
+        start = cluster * 60 + idx % 4
+        findings.append(
+            {
+                "rule_id": f"rule-{cluster % 50}",
+                "channel": channels[cluster % len(channels)],
+                "salience": (idx * 31) % 100,
+                "anchor": {"start": start, "end": start + 80},
+            }
+        )
+
+    merged, agenda_duration = _timed_merge(findings, use_agenda=True)
+    shuffled = list(reversed(findings))
+    merged_again, _ = _timed_merge(shuffled, use_agenda=True, repeat=1)
+
+    assert 0 < len(merged) < len(findings)
+    assert [f["rule_id"] for f in merged] == [f["rule_id"] for f in merged_again]
+    assert agenda_duration <= 1.0
@@ -0,0 +1,27 @@
+from starlette.responses import Response
+from typing import Tuple
+
+from contract_review_app.core import json_codec
+
+async def capture_response(response) -> Tuple[bytes, dict, str]:
+    chunks = []
+    async for section in response.body_iterator:
+        chunks.append(section)
+    body = b"".join(chunks)
+    headers = dict(response.headers)
+    headers.pop("content-length", None)
+    return body, headers, response.media_type or "application/octet-stream"
+
+def normalize_status_if_json(body: bytes, media_type: str) -> bytes:
+    if not body or not media_type.startswith("application/json"):
+        return body
+    try:
+        payload = json_codec.loads(body)
+        if isinstance(payload, dict) and isinstance(payload.get("status"), str):
+            status = payload["status"]
+            if status != status.lower():
+                payload["status"] = status.lower()
+                return json_codec.dumps_envelope(payload)
+        return body
+    except Exception:
+        return body
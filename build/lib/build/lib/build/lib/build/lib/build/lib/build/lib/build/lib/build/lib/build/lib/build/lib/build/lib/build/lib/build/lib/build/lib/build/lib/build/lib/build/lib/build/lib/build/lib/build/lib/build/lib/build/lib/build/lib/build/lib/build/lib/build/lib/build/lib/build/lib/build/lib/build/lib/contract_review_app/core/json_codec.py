@@ -0,0 +1,123 @@
+"""Compact JSON encoding for API responses, trace blobs and content hashes.
+
+``orjson`` (pinned in ``requirements.txt``) is used when it can be
+imported; every helper falls back to the stdlib encoder, both when
+``orjson`` is missing and for the values it rejects (integers wider than 64
+bits, unknown types without a ``default``), so callers see the same
+behaviour either way.  Output is always compact UTF-8
+(``ensure_ascii=False``, ``separators=(",", ":")``).
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+from typing import Any, Callable, Dict, List, Optional
+
+try:  # declared dependency; the stdlib path stays as a fallback
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson only
+    orjson = None  # type: ignore[assignment]
+
+_Default = Optional[Callable[[Any], Any]]
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS
+    # datetimes/dataclasses go through ``default`` like they do in json.dumps
+    _OPTS_DEFAULT = _OPTS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def _std_dumps(value: Any, default: _Default, sort_keys: bool) -> bytes:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=default,
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def dumps(value: Any, *, default: _Default = None) -> bytes:
+    """Serialize ``value`` to compact UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        try:
+            if default is None:
+                return orjson.dumps(value, option=_OPTS)
+            return orjson.dumps(value, default=default, option=_OPTS_DEFAULT)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return _std_dumps(value, default, False)
+
+
+def dumps_canonical(value: Any) -> bytes:
+    """Serialize ``value`` with sorted keys, for content addressing."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_OPTS | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return _std_dumps(value, None, True)
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals are accepted by json.loads only
+            pass
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _shared_lists(payload: Dict[str, Any]) -> Dict[int, List[Any]]:
+    """Non-empty lists referenced more than once from the top two levels."""
+
+    seen: Dict[int, List[Any]] = {}
+    shared: Dict[int, List[Any]] = {}
+    for value in payload.values():
+        children = value.values() if isinstance(value, dict) else (value,)
+        for child in children:
+            if isinstance(child, list) and child:
+                if id(child) in seen:
+                    shared[id(child)] = child
+                else:
+                    seen[id(child)] = child
+    return shared
+
+
+def dumps_envelope(payload: Any) -> bytes:
+    """:func:`dumps` that encodes lists shared between keys only once.
+
+    API envelopes expose the same findings list under ``findings``,
+    ``clauses`` and ``analysis.findings``; each such list is serialized once
+    and spliced into every place that references it.
+    """
+
+    shared = _shared_lists(payload) if isinstance(payload, dict) else {}
+    if not shared:
+        return dumps(payload)
+    nonce = secrets.token_hex(8)
+    markers = {key: f"@shared-{nonce}-{idx}" for idx, key in enumerate(shared)}
+
+    def _swap(value: Any) -> Any:
+        if isinstance(value, list) and id(value) in markers:
+            return markers[id(value)]
+        return value
+
+    skeleton: Dict[Any, Any] = {}
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            skeleton[key] = {k: _swap(v) for k, v in value.items()}
+        else:
+            skeleton[key] = _swap(value)
+    raw = dumps(skeleton)
+    for key, marker in markers.items():
+        raw = raw.replace(b'"' + marker.encode() + b'"', dumps(shared[key]))
+    return raw
+
+
+__all__ = ["dumps", "dumps_canonical", "dumps_envelope", "loads"]
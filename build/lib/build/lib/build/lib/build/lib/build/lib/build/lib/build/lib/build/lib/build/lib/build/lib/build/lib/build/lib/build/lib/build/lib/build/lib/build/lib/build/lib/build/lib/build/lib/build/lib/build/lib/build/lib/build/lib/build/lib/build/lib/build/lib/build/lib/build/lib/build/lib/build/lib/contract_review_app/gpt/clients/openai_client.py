@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from typing import AsyncIterator
+
+from ..config import LLMConfig
+from ..interfaces import (
+    BaseClient,
+    DraftResult,
+    QAResult,
+    SuggestResult,
+)
+from .http_pool import apost_json, astream_events, post_json
+
+
+class ProviderUnavailableError(Exception):
+    def __init__(self, provider: str, detail: str):
+        super().__init__(detail)
+        self.provider = provider
+        self.detail = detail
+
+
+class OpenAIClient(BaseClient):
+    def __init__(self, cfg: LLMConfig):
+        self.provider = "openai"
+        self.model = cfg.model_draft
+        self.mode = "live"
+        self._api_key = cfg.openai_api_key or ""
+        self._base = cfg.openai_base.rstrip("/")
+
+    def _url(self) -> str:
+        return f"{self._base}/chat/completions"
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self._api_key}"}
+
+    def _post(self, payload: dict, timeout: float) -> dict:
+        return post_json(self.provider, self._url(), payload, self._headers(), timeout)
+
+    async def _apost(self, payload: dict, timeout: float) -> dict:
+        return await apost_json(self.provider, self._url(), payload, self._headers(), timeout)
+
+    def _draft_payload(self, prompt: str, max_tokens: int, temperature: float) -> dict:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    def _chat_payload(self, prompt: str) -> dict:
+        return {"model": self.model, "messages": [{"role": "user", "content": prompt}]}
+
+    @staticmethod
+    def _delta(event: dict) -> str:
+        return (event.get("choices") or [{}])[0].get("delta", {}).get("content") or ""
+
+    def _meta(self, data: dict) -> dict:
+        usage = data.get("usage") or {}
+        return {"provider": self.provider, "model": self.model, "mode": self.mode, "usage": usage}
+
+    @staticmethod
+    def _text(data: dict) -> str:
+        return data.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+    def draft(self, prompt: str, max_tokens: int, temperature: float, timeout: float) -> DraftResult:
+        data = self._post(self._draft_payload(prompt, max_tokens, temperature), timeout)
+        return DraftResult(text=self._text(data), meta=self._meta(data))
+
+    def suggest_edits(self, prompt: str, timeout: float) -> SuggestResult:
+        data = self._post(self._chat_payload(prompt), timeout)
+        return SuggestResult(items=[{"text": self._text(data)}], meta=self._meta(data))
+
+    def qa_recheck(self, prompt: str, timeout: float) -> QAResult:
+        data = self._post(self._chat_payload(prompt), timeout)
+        return QAResult(items=[self._text(data)], meta=self._meta(data))
+
+    async def adraft(self, prompt: str, max_tokens: int, temperature: float, timeout: float) -> DraftResult:
+        data = await self._apost(self._draft_payload(prompt, max_tokens, temperature), timeout)
+        return DraftResult(text=self._text(data), meta=self._meta(data))
+
+    async def asuggest_edits(self, prompt: str, timeout: float) -> SuggestResult:
+        data = await self._apost(self._chat_payload(prompt), timeout)
+        return SuggestResult(items=[{"text": self._text(data)}], meta=self._meta(data))
+
+    async def aqa_recheck(self, prompt: str, timeout: float) -> QAResult:
+        data = await self._apost(self._chat_payload(prompt), timeout)
+        return QAResult(items=[self._text(data)], meta=self._meta(data))
+
+    async def astream_draft(
+        self, prompt: str, max_tokens: int, temperature: float, timeout: float
+    ) -> AsyncIterator[str]:
+        payload = self._draft_payload(prompt, max_tokens, temperature)
+        payload["stream"] = True
+        async for data in astream_events(
+            self.provider, self._url(), payload, self._headers(), timeout
+        ):
+            try:
+                chunk = self._delta(json.loads(data))
+            except ValueError:
+                continue
+            if chunk:
+                yield chunk
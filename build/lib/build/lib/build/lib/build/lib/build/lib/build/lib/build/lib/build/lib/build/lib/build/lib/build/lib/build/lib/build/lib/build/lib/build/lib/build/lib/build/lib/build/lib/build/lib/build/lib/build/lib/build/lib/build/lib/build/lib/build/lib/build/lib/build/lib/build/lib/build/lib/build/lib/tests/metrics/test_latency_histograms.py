@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+from importlib import reload
+
+from fastapi.testclient import TestClient
+
+from contract_review_app.api.models import SCHEMA_VERSION
+from contract_review_app.metrics import latency
+
+
+def test_quantiles_merge_thread_shards():
+    latency.reset()
+
+    def worker(offset: int) -> None:
+        for ms in range(1, 501):
+            latency.record("parse", float(ms + offset))
+
+    threads = [threading.Thread(target=worker, args=(off,)) for off in (0, 500)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    row = next(r for r in latency.snapshot() if r["stage"] == "parse")
+    assert row["count"] == 1000
+    assert row["max_ms"] == 1000.0
+    # log buckets grow by ~19%, so quantiles stay within that of the truth
+    for key, true in (("p50_ms", 500), ("p95_ms", 950), ("p99_ms", 990)):
+        assert abs(row[key] - true) / true < 0.19
+    # the shards of the finished workers were folded into one
+    assert not any(thread in threads for thread, _ in latency._shards)
+    latency.reset()
+
+
+def test_prometheus_histogram_buckets_are_cumulative():
+    latency.reset()
+    for ms in (0.5, 3.0, 3.0, 200.0):
+        latency.record("engine", ms)
+    buckets = []
+    for line in latency.to_prometheus().splitlines():
+        if line.startswith('contract_ai_stage_latency_ms_bucket{stage="engine"'):
+            le = line.split('le="')[1].split('"')[0]
+            buckets.append((le, int(line.rsplit(" ", 1)[1])))
+    counts = [n for _, n in buckets]
+    assert counts == sorted(counts)
+    assert buckets[-1] == ("+Inf", 4)
+    assert dict(buckets)["0.64"] == 1 and dict(buckets)["5.12"] == 3
+    latency.reset()
+
+
+def test_analyze_feeds_metrics_endpoints(monkeypatch):
+    monkeypatch.setenv("FEATURE_METRICS", "1")
+    monkeypatch.setenv("API_KEY", "local-test-key-123")
+    import contract_review_app.api.app as api_app
+
+    reload(api_app)
+    latency.reset()
+    client = TestClient(api_app.app)
+    headers = {"x-api-key": "local-test-key-123", "x-schema-version": SCHEMA_VERSION}
+    r = client.post("/api/analyze", json={"text": "Payment within 30 days."}, headers=headers)
+    assert r.status_code == 200
+
+    perf = client.get("/api/metrics").json()["metrics"]["perf"]
+    stages = {s["stage"]: s for s in perf["stages"]}
+    assert perf["docs"] == 1 and perf["avg_ms_per_page"] > 0
+    for stage in ("intake", "parse", "dispatch", "engine", "merge", "serialization"):
+        assert stages[stage]["count"] >= 1
+    # other JSON responses (here /api/metrics itself) are not analysis time
+    after = {s["stage"]: s for s in latency.snapshot()}
+    assert after["serialization"]["count"] == stages["serialization"]["count"]
+
+    prom = client.get("/api/metrics.prom")
+    assert prom.status_code == 200
+    assert "# TYPE contract_ai_stage_latency_ms histogram" in prom.text
+    assert 'contract_ai_stage_latency_ms_bucket{stage="parse",le="+Inf"}' in prom.text
+    assert "contract_ai_documents_total 1" in prom.text
+    assert "stage,count,p50_ms" in client.get("/api/metrics.csv").text
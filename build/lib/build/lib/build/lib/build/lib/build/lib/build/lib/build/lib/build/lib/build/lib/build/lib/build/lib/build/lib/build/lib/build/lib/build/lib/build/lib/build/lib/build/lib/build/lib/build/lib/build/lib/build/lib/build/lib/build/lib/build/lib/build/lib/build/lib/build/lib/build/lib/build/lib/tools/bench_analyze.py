@@ -0,0 +1,281 @@
+"""End-to-end benchmark of ``/api/analyze``.
+
+Every document is posted through the full in-process application (auth,
+middleware, pipeline and serialization) and timed.  The corpus is the
+``fixtures/contracts`` documents plus synthetic contracts scaled up from
+their clauses to the requested sizes, so runs are reproducible.
+
+For each document the report holds the wall-clock median and p95, ms per
+page, the mean time spent in every pipeline stage (from
+:mod:`contract_review_app.metrics.latency`) and the peak resident memory
+sampled during the timed runs; ``metrics.perf`` summarises the run in the shape of
+``/api/metrics``.  ``tools/metrics_compare.py`` gates a run against a
+baseline written by ``--write-baseline``.
+
+Usage::
+
+    python tools/bench_analyze.py --out var/bench/current.json
+    python tools/bench_analyze.py --sizes 10000,50000 --repeat 5 \\
+        --write-baseline var/bench/baseline.json
+    python tools/metrics_compare.py \\
+        --bench-baseline var/bench/baseline.json \\
+        --bench-current var/bench/current.json
+
+Baselines are specific to the machine that produced them; regenerate them
+on the CI runner rather than on a workstation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FIXTURES_DIR = ROOT / "fixtures" / "contracts"
+DEFAULT_SIZES = (10_000, 50_000, 200_000, 500_000)
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_REGRESSION_PCT = 20.0
+BENCH_API_KEY = "bench-analyze"
+BENCH_TIMEOUT_S = 900
+
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> List[Tuple[str, str]]:
+    return [
+        (path.name, path.read_text(encoding="utf-8"))
+        for path in sorted(directory.glob("*.txt"))
+    ]
+
+
+def synthetic_contract(clauses: Sequence[str], size: int) -> str:
+    """Numbered clauses cycled from ``clauses`` until ``size`` characters."""
+
+    parts: List[str] = []
+    total = 0
+    n = 0
+    while total < size:
+        clause = f"{n + 1}. {clauses[n % len(clauses)]}\n\n"
+        parts.append(clause)
+        total += len(clause)
+        n += 1
+    return "".join(parts)[:size]
+
+
+def build_corpus(
+    sizes: Sequence[int], fixtures: Sequence[Tuple[str, str]]
+) -> List[Tuple[str, str]]:
+    clauses = [
+        para.strip()
+        for _, text in fixtures
+        for para in text.split("\n\n")
+        if para.strip()
+    ]
+    corpus = list(fixtures)
+    if clauses:
+        corpus += [(f"synthetic_{size}", synthetic_contract(clauses, size)) for size in sizes]
+    return corpus
+
+
+def _client():
+    # in-process app; unless configured: a fixed key, no rate limiting and
+    # timeouts long enough for the largest synthetic contracts
+    api_key = os.environ.setdefault("API_KEY", BENCH_API_KEY)
+    os.environ.setdefault("CONTRACTAI_RATE_PER_MIN", "1000000")
+    for name in ("CONTRACTAI_API_TIMEOUT_S", "CONTRACTAI_REQUEST_TIMEOUT_S"):
+        os.environ.setdefault(name, str(BENCH_TIMEOUT_S))
+    from fastapi.testclient import TestClient
+
+    from contract_review_app.api.app import app
+    from contract_review_app.api.models import SCHEMA_VERSION
+
+    headers = {"x-api-key": api_key, "x-schema-version": SCHEMA_VERSION}
+    return TestClient(app), headers
+
+
+def _rss_kb() -> float:
+    """Current resident set size (Linux); elsewhere the process high-water mark."""
+
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            pages = int(f.read().split()[1])
+        import resource
+
+        return pages * resource.getpagesize() / 1024.0
+    except (OSError, ImportError, IndexError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024.0 if sys.platform == "darwin" else float(peak)
+
+
+class _PeakRss:
+    """Track the peak RSS from a background thread while the block runs."""
+
+    def __init__(self, interval_s: float = 0.005) -> None:
+        self.interval_s = interval_s
+        self.peak_kb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="bench-rss", daemon=True)
+
+    def _run(self) -> None:
+        while True:
+            self.peak_kb = max(self.peak_kb, _rss_kb())
+            if self._stop.wait(self.interval_s):
+                return
+
+    def __enter__(self) -> "_PeakRss":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_kb = max(self.peak_kb, _rss_kb())
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def bench_document(client, headers: Dict[str, str], name: str, text: str, repeat: int) -> Dict:
+    from contract_review_app.metrics import latency
+
+    # the module the client's app came from, even if the package attribute
+    # was rebound by a reload
+    app_module = importlib.import_module("contract_review_app.api.app")
+
+    def post() -> float:
+        # every run must take the full pipeline, not the response caches
+        app_module.an_cache.clear()
+        app_module.IDEMPOTENCY_CACHE.clear()
+        start = time.perf_counter()
+        resp = client.post("/api/analyze", json={"text": text}, headers=headers)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if resp.status_code != 200:
+            raise RuntimeError(f"{name}: /api/analyze returned {resp.status_code}")
+        if resp.headers.get("x-cache") == "hit":
+            raise RuntimeError(f"{name}: /api/analyze was served from cache")
+        return elapsed
+
+    post()  # warm-up: rule packs, compiled patterns, lazy imports
+    latency.reset()
+    with _PeakRss() as rss:
+        timings = [post() for _ in range(repeat)]
+    stages = {
+        row["stage"]: round(row["sum_ms"] / repeat, 3)
+        for row in latency.snapshot()
+        if row["count"]
+    }
+
+    pages = max(1, -(-len(text) // latency.PAGE_CHARS))
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "chars": len(text),
+        "pages": pages,
+        "runs": repeat,
+        "ms_median": round(median, 3),
+        "ms_p95": round(_percentile(timings, 0.95), 3),
+        "ms_per_page": round(median / pages, 3),
+        "peak_mem_kb": round(rss.peak_kb, 1),
+        "stages": stages,
+    }
+
+
+def run(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    fixtures_dir: Path = FIXTURES_DIR,
+    max_regression_pct: float = DEFAULT_MAX_REGRESSION_PCT,
+) -> Dict:
+    from contract_review_app.api.models import SCHEMA_VERSION
+
+    client, headers = _client()
+    repeat = max(1, int(repeat))
+    documents = [
+        bench_document(client, headers, name, text, repeat)
+        for name, text in build_corpus(sizes, load_fixtures(fixtures_dir))
+    ]
+    total_ms = sum(d["ms_median"] for d in documents)
+    total_pages = sum(d["pages"] for d in documents)
+    stage_names = sorted({s for d in documents for s in d["stages"]})
+    return {
+        "schema": SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "max_regression_pct": max_regression_pct,
+        "documents": documents,
+        "metrics": {
+            "perf": {
+                "docs": len(documents),
+                "avg_ms_per_page": round(total_ms / total_pages, 3) if total_pages else 0.0,
+                "stages": [
+                    {"stage": s, "sum_ms": round(sum(d["stages"].get(s, 0.0) for d in documents), 3)}
+                    for s in stage_names
+                ],
+            }
+        },
+    }
+
+
+def _write(path: Path, report: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="comma-separated synthetic contract sizes in characters ('' for none)",
+    )
+    p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    p.add_argument("--fixtures", default=str(FIXTURES_DIR))
+    p.add_argument("--out", help="write the report to this JSON file")
+    p.add_argument("--write-baseline", help="also write the report as a gate baseline")
+    p.add_argument(
+        "--max-regression-pct",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION_PCT,
+        help="slowdown tolerated by metrics_compare against a baseline written here",
+    )
+    args = p.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run(sizes, args.repeat, Path(args.fixtures), args.max_regression_pct)
+    for doc in report["documents"]:
+        print(
+            f"[bench] {doc['name']}: {doc['chars']} chars, median {doc['ms_median']:.1f} ms "
+            f"({doc['ms_per_page']:.1f} ms/page), peak {doc['peak_mem_kb']:.0f} KiB"
+        )
+    if args.out:
+        _write(Path(args.out), report)
+    if args.write_baseline:
+        _write(Path(args.write_baseline), report)
+    if not args.out and not args.write_baseline:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
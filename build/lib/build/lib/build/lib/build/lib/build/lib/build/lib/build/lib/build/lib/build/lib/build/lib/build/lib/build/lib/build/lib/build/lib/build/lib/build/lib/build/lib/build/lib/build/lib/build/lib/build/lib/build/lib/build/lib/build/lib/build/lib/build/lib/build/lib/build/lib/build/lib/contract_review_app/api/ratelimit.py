@@ -0,0 +1,209 @@
+"""Token-bucket rate limiting for the API middleware.
+
+Each key (``<path>:<api key or client host>``) owns a bucket holding up to
+``limit`` tokens that refills at ``limit`` tokens per minute; a request takes
+one token.  Checking a key is O(1) and only touches that key's bucket.
+
+* :class:`TokenBucketLimiter` keeps buckets in process memory, bounded to
+  ``max_keys`` entries with least-recently-used eviction.
+* :class:`SqliteTokenBucketLimiter` keeps them in a local SQLite file so all
+  workers on a host share one limit (``CONTRACTAI_RATE_DB``).  It blocks on
+  file I/O, so async callers run it in a worker thread (``blocking``), and
+  it falls back to in-memory buckets while the database is busy or broken.
+
+Both return ``0.0`` when the request may proceed and otherwise the number of
+seconds until a token becomes available.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_WINDOW_S = 60.0
+# how long a check waits for another worker's write lock before giving up
+_BUSY_TIMEOUT_S = 0.05
+
+
+def _take(
+    state: Optional[Tuple[float, float]], limit: int, now: float
+) -> Tuple[Tuple[float, float], float]:
+    """Refill ``state`` (tokens, stamp) up to ``now`` and try to take a token."""
+
+    rate = limit / _WINDOW_S
+    if state is None:
+        tokens = float(limit)
+    else:
+        tokens, stamp = state
+        tokens = min(float(limit), tokens + max(0.0, now - stamp) * rate)
+    if tokens >= 1.0:
+        return (tokens - 1.0, now), 0.0
+    return (tokens, now), (1.0 - tokens) / rate
+
+
+class TokenBucketLimiter:
+    """In-process token buckets with LRU eviction beyond ``max_keys``.
+
+    An evicted key simply starts again with a full bucket; keys idle for a
+    whole window are full anyway, so only keys under active pressure from
+    more than ``max_keys`` clients can lose state.
+    """
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self.max_keys = max(1, int(max_keys))
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limit: int, now: Optional[float] = None) -> float:
+        if limit <= 0:
+            return _WINDOW_S
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state, retry_after = _take(self._buckets.get(key), limit, now)
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SqliteTokenBucketLimiter:
+    """Token buckets shared between processes through a SQLite file.
+
+    Every check is one short ``BEGIN IMMEDIATE`` transaction on an indexed
+    row, so concurrent workers serialize per check rather than per request.
+    Every ``max_keys`` checks, rows idle for a full window are pruned and the
+    least recently used rows beyond ``max_keys`` are dropped, so the table
+    never holds more than ``2 * max_keys`` rows.
+    Wall-clock time is used because monotonic clocks are per-process.
+
+    A check waits at most ``busy_timeout_s`` for the write lock.  When the
+    database is locked or fails, the check is answered from per-process
+    :class:`TokenBucketLimiter` buckets instead of failing the request.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_keys: int = 10_000,
+        busy_timeout_s: float = _BUSY_TIMEOUT_S,
+    ) -> None:
+        self.path = Path(path)
+        self.max_keys = max(1, int(max_keys))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=busy_timeout_s,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets ("
+            " key TEXT PRIMARY KEY, tokens REAL NOT NULL, stamp REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS rate_buckets_stamp ON rate_buckets(stamp)"
+        )
+        self._lock = threading.Lock()
+        self._checks = 0
+        self._fallback = TokenBucketLimiter(max_keys=self.max_keys)
+        self._degraded = False
+
+    def acquire(self, key: str, limit: int, now: Optional[float] = None) -> float:
+        if limit <= 0:
+            return _WINDOW_S
+        now = time.time() if now is None else now
+        try:
+            with self._lock:
+                retry_after = self._acquire(key, limit, now)
+        except sqlite3.Error as exc:
+            if not self._degraded:
+                self._degraded = True
+                log.warning(
+                    "Shared rate limiter failed (%s); using per-process buckets", exc
+                )
+            return self._fallback.acquire(key, limit, now)
+        if self._degraded:
+            self._degraded = False
+            log.info("Shared rate limiter recovered")
+        return retry_after
+
+    def _acquire(self, key: str, limit: int, now: float) -> float:
+        cur = self._conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            row = cur.execute(
+                "SELECT tokens, stamp FROM rate_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            state, retry_after = _take(row, limit, now)
+            cur.execute(
+                "INSERT OR REPLACE INTO rate_buckets (key, tokens, stamp)"
+                " VALUES (?, ?, ?)",
+                (key, state[0], state[1]),
+            )
+            self._checks += 1
+            if self._checks >= self.max_keys:
+                self._checks = 0
+                self._prune(cur, now)
+            cur.execute("COMMIT")
+        except BaseException:
+            if self._conn.in_transaction:
+                try:
+                    cur.execute("ROLLBACK")
+                except sqlite3.Error:
+                    # keep the original error
+                    pass
+            raise
+        return retry_after
+
+    def _prune(self, cur: sqlite3.Cursor, now: float) -> None:
+        cur.execute("DELETE FROM rate_buckets WHERE stamp < ?", (now - _WINDOW_S,))
+        cur.execute(
+            "DELETE FROM rate_buckets WHERE key IN ("
+            " SELECT key FROM rate_buckets ORDER BY stamp DESC LIMIT -1 OFFSET ?)",
+            (self.max_keys,),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_buckets")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rate_buckets").fetchone()[0]
+
+
+def create_limiter(
+    db_path: Optional[str] = None, max_keys: int = 10_000
+) -> TokenBucketLimiter | SqliteTokenBucketLimiter:
+    """Shared SQLite limiter when ``db_path`` is set, in-memory otherwise."""
+
+    if db_path:
+        try:
+            return SqliteTokenBucketLimiter(db_path, max_keys=max_keys)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning("Shared rate limiter unavailable (%s); using per-process buckets", exc)
+    return TokenBucketLimiter(max_keys=max_keys)
+
+
+__all__ = ["SqliteTokenBucketLimiter", "TokenBucketLimiter", "create_limiter"]
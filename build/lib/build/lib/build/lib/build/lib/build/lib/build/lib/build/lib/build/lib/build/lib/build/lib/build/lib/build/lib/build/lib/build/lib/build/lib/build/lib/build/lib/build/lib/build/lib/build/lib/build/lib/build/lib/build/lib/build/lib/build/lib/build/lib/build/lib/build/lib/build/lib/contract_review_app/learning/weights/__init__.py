@@ -0,0 +1,12 @@
+# ASCII-only
+from .replay_io import ensure_storage, append_events
+from .adaptor import get_config, log_event, update_weights, rank_templates
+
+__all__ = [
+    "ensure_storage",
+    "append_events",
+    "get_config",
+    "log_event",
+    "update_weights",
+    "rank_templates",
+]
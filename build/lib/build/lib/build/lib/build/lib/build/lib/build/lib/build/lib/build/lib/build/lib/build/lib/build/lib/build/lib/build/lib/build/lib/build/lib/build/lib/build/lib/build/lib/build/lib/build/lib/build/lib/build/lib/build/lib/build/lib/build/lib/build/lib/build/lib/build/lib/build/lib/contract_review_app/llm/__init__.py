@@ -0,0 +1,13 @@
+from .provider import ProviderError, MockProvider, AzureProvider, get_provider
+
+# Backwards compatibility
+provider_from_env = get_provider
+
+__all__ = [
+    "ProviderError",
+    "MockProvider",
+    "AzureProvider",
+    "get_provider",
+    "provider_from_env",
+]
+"""Lightweight LLM utilities."""
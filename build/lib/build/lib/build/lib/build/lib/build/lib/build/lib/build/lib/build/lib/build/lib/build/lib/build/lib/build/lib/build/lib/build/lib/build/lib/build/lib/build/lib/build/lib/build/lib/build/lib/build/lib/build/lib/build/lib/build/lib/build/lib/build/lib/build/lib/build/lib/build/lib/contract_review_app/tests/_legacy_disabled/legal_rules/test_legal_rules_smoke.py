@@ -0,0 +1,3 @@
+def test_legal_rules_import_smoke():
+    __import__("contract_review_app.legal_rules")
+    assert True
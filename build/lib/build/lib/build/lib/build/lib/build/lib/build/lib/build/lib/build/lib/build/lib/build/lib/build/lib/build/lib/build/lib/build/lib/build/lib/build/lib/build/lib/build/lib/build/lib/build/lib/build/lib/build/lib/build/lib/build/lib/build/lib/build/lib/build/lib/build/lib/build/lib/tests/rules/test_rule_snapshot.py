@@ -0,0 +1,134 @@
+from textwrap import dedent
+
+from contract_review_app.legal_rules import dispatcher, loader, snapshot
+
+
+def _write_rule(path, rule_id: str) -> None:
+    path.write_text(
+        dedent(
+            f"""
+            ---
+            id: {rule_id}
+            triggers:
+              regex:
+                - regex: foo
+            """
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_snapshot_is_reused_until_a_pack_changes(tmp_path, monkeypatch):
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    _write_rule(packs / "pack.yml", "snap.one")
+    parsed = []
+    parse = loader._parse_pack
+
+    def _counting_parse(path, digest):
+        parsed.append(path.name)
+        return parse(path, digest)
+
+    try:
+        with monkeypatch.context() as mp:
+            mp.setenv("RULE_SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+            mp.setattr(loader, "RULE_ROOTS", [str(packs)])
+            mp.setattr(loader, "_PARSED", {})
+            mp.setattr(loader, "_parse_pack", _counting_parse)
+
+            loader.load_rule_packs()
+            first = loader.rules_fingerprint()
+            assert parsed == ["pack.yml"]
+            assert (tmp_path / "snapshots" / "rules.pickle").is_file()
+
+            loader._PARSED.clear()  # a fresh worker only has the disk snapshot
+            loader.load_rule_packs()
+            assert parsed == ["pack.yml"]
+            assert loader.rules_fingerprint() == first
+            assert [r["id"] for r in loader._RULES] == ["snap.one"]
+            assert loader._RULES[0]["triggers"]["regex"][0].search("xfoo")
+
+            _write_rule(packs / "pack.yml", "snap.two")
+            loader.load_rule_packs()
+            assert parsed == ["pack.yml", "pack.yml"]
+            assert loader.rules_fingerprint() != first
+            assert [r["id"] for r in loader._RULES] == ["snap.two"]
+    finally:
+        loader.load_rule_packs()
+
+
+def test_hot_reload_reparses_changed_packs_only(tmp_path, monkeypatch):
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    _write_rule(packs / "a.yml", "reload.a")
+    _write_rule(packs / "b.yml", "reload.b")
+    parsed = []
+    parse = loader._parse_pack
+
+    def _counting_parse(path, digest):
+        parsed.append(path.name)
+        return parse(path, digest)
+
+    def _ids(rules):
+        return sorted(r["id"] for r in rules)
+
+    try:
+        with monkeypatch.context() as mp:
+            mp.setenv("RULE_SNAPSHOT", "0")
+            mp.setattr(loader, "RULE_ROOTS", [str(packs)])
+            mp.setattr(loader, "_parse_pack", _counting_parse)
+            loader.load_rule_packs()
+            parsed.clear()
+            assert loader.reload_changed_packs() is False
+
+            with loader.pinned_rule_set() as pinned:
+                _write_rule(packs / "b.yml", "reload.b2")
+                assert loader.reload_changed_packs() is True
+                assert parsed == ["b.yml"]
+                # the pinned request keeps evaluating the version it started with
+                assert _ids(loader._rules()) == ["reload.a", "reload.b"]
+                assert {r["id"] for r in dispatcher._rule_index()[0]} == {
+                    "reload.a",
+                    "reload.b",
+                }
+            assert loader.rules_version() == pinned.version + 1
+            assert _ids(loader._rules()) == ["reload.a", "reload.b2"]
+            assert {r["id"] for r in dispatcher._rule_index()[0]} == {
+                "reload.a",
+                "reload.b2",
+            }
+
+            # a pack that stops parsing keeps serving its previous rules
+            (packs / "b.yml").write_text("id: [broken", encoding="utf-8")
+            assert loader.reload_changed_packs() is True
+            assert _ids(loader._RULES) == ["reload.a", "reload.b2"]
+
+            (packs / "a.yml").unlink()
+            assert loader.reload_changed_packs() is True
+            assert _ids(loader._RULES) == ["reload.b2"]
+    finally:
+        loader.load_rule_packs()
+
+
+_UNPICKLED = []
+
+
+def _unpickle_marker():
+    _UNPICKLED.append(1)
+    return "marker"
+
+
+class _Marker:
+    def __reduce__(self):
+        return (_unpickle_marker, ())
+
+
+def test_stale_snapshot_is_rejected_before_unpickling(tmp_path, monkeypatch):
+    monkeypatch.setenv("RULE_SNAPSHOT_DIR", str(tmp_path))
+    fp = snapshot.digest("packs-v1")
+    snapshot.store("rules", fp, _Marker())
+
+    assert snapshot.load("rules", snapshot.digest("packs-v2")) is None
+    assert _UNPICKLED == []
+    assert snapshot.load("rules", fp) == "marker"
+    assert _UNPICKLED == [1]
@@ -0,0 +1,444 @@
+"""Redline diffs between two versions of a contract text.
+
+:func:`diff_ops` is the engine: it tokenizes both texts (words and punctuation
+by default, whitespace-delimited words with ``granularity="word"``), anchors
+the alignment on tokens that occur exactly once on each side (patience diff)
+and runs Myers' O(ND) algorithm only inside the gaps between anchors.  The
+result is a compact list of operations with character offsets into both
+texts, which the panel renders directly.
+
+Work is bounded: each gap may cost at most ``max_cost`` edits and the whole
+diff at most ``budget_ms``.  A gap that exceeds either budget is reported as a
+single ``replace`` and the result is flagged as truncated, so a heavily
+rewritten 50-page agreement still comes back promptly with a coarser redline.
+
+:func:`make_diff` keeps the unified/HTML pair used by ``/api/panel/redlines``.
+The unified diff runs the same engine over lines under the same budgets; the
+HTML is the :class:`difflib.HtmlDiff` side-by-side table by default, or the
+inline rendering of the ops.  ``HtmlDiff`` is unbounded (roughly quadratic
+in the number of changed lines), so texts over the table size limits get
+the inline rendering instead (:func:`table_fits`).
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import html as _html
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+GRANULARITIES = ("token", "word")
+VIEWS = ("inline", "table", "none")
+# largest texts still rendered as the HtmlDiff table (lines per side, chars)
+TABLE_MAX_LINES = 200
+TABLE_MAX_CHARS = 40_000
+
+_TOKEN_RE = {
+    "token": re.compile(r"\w+|\s+|[^\w\s]", re.UNICODE),
+    "word": re.compile(r"\S+|\s+", re.UNICODE),
+}
+# patience recursion depth after which gaps go straight to Myers
+_MAX_DEPTH = 64
+
+# (tag, a_lo, a_hi, b_lo, b_hi) over token indexes
+_Opcode = Tuple[str, int, int, int, int]
+
+
+class _Budget:
+    __slots__ = ("deadline", "max_cost", "timed_out", "truncated")
+
+    def __init__(self, budget_ms: Optional[float], max_cost: Optional[int]) -> None:
+        self.deadline = (
+            time.perf_counter() + budget_ms / 1000.0 if budget_ms and budget_ms > 0 else None
+        )
+        self.max_cost = max_cost if max_cost and max_cost > 0 else None
+        self.timed_out = False
+        self.truncated = False
+
+    def expired(self) -> bool:
+        if not self.timed_out and self.deadline is not None:
+            self.timed_out = time.perf_counter() > self.deadline
+        return self.timed_out
+
+
+def tokenize(text: str, granularity: str = "token") -> Tuple[List[str], List[int]]:
+    """Split ``text`` into tokens and their start offsets.
+
+    Tokens cover the text without gaps, so ``"".join(tokens) == text``.
+    """
+
+    try:
+        pattern = _TOKEN_RE[granularity]
+    except KeyError:
+        raise ValueError(f"unknown diff granularity: {granularity!r}") from None
+    tokens: List[str] = []
+    starts: List[int] = []
+    for m in pattern.finditer(text):
+        tokens.append(m.group())
+        starts.append(m.start())
+    return tokens, starts
+
+
+def _myers(
+    a: Sequence[str], alo: int, ahi: int, b: Sequence[str], blo: int, bhi: int, budget: _Budget
+) -> Optional[List[_Opcode]]:
+    """Shortest edit script of ``a[alo:ahi]`` -> ``b[blo:bhi]``, ``None`` over budget."""
+
+    n, m = ahi - alo, bhi - blo
+    limit = n + m
+    if budget.max_cost is not None:
+        limit = min(limit, budget.max_cost)
+    v = {1: 0}
+    trace: List[Dict[int, int]] = []
+    for d in range(limit + 1):
+        if budget.expired():
+            return None
+        vd: Dict[int, int] = {}
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            vd[k] = x
+            if x >= n and y >= m:
+                trace.append(vd)
+                return _backtrack(trace, n, m, alo, blo)
+        trace.append(vd)
+        v = vd
+    return None
+
+
+def _backtrack(trace: List[Dict[int, int]], n: int, m: int, alo: int, blo: int) -> List[_Opcode]:
+    out: List[_Opcode] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        prev = trace[d - 1]
+        k = x - y
+        if k == -d or (k != d and prev[k - 1] < prev[k + 1]):
+            px = prev[k + 1]
+            py = px - (k + 1)
+            mx, my = px, py + 1
+            move = ("insert", alo + px, alo + px, blo + py, blo + my)
+        else:
+            px = prev[k - 1]
+            py = px - (k - 1)
+            mx, my = px + 1, py
+            move = ("delete", alo + px, alo + mx, blo + py, blo + py)
+        if x > mx:
+            out.append(("equal", alo + mx, alo + x, blo + my, blo + y))
+        out.append(move)
+        x, y = px, py
+    if x:
+        out.append(("equal", alo, alo + x, blo, blo + y))
+    out.reverse()
+    return out
+
+
+def _unique_anchors(
+    a: Sequence[str], alo: int, ahi: int, b: Sequence[str], blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """Longest increasing run of tokens that are unique on both sides."""
+
+    seen_a: Dict[str, int] = {}
+    for i in range(alo, ahi):
+        tok = a[i]
+        seen_a[tok] = -1 if tok in seen_a else i
+    seen_b: Dict[str, int] = {}
+    for j in range(blo, bhi):
+        tok = b[j]
+        if seen_a.get(tok, -1) >= 0:
+            seen_b[tok] = -1 if tok in seen_b else j
+    pairs = sorted((seen_a[tok], j) for tok, j in seen_b.items() if j >= 0)
+    if not pairs:
+        return []
+    # patience sort: tails[k] is the smallest j ending an increasing run of k+1
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    back: List[int] = []
+    for idx, (_, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        back.append(tail_idx[pos - 1] if pos else -1)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(idx)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = idx
+    chain: List[Tuple[int, int]] = []
+    idx = tail_idx[-1]
+    while idx >= 0:
+        chain.append(pairs[idx])
+        idx = back[idx]
+    chain.reverse()
+    return chain
+
+
+def _align(
+    a: Sequence[str],
+    alo: int,
+    ahi: int,
+    b: Sequence[str],
+    blo: int,
+    bhi: int,
+    budget: _Budget,
+    out: List[_Opcode],
+    depth: int = 0,
+) -> None:
+    # common prefix / suffix are free
+    start_a, start_b = alo, blo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo += 1
+        blo += 1
+    if alo > start_a:
+        out.append(("equal", start_a, alo, start_b, blo))
+    end_a, end_b = ahi, bhi
+    while ahi > alo and bhi > blo and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+
+    if alo == ahi or blo == bhi:
+        if alo < ahi:
+            out.append(("delete", alo, ahi, blo, blo))
+        elif blo < bhi:
+            out.append(("insert", alo, alo, blo, bhi))
+    elif budget.expired():
+        budget.truncated = True
+        out.append(("replace", alo, ahi, blo, bhi))
+    else:
+        anchors = _unique_anchors(a, alo, ahi, b, blo, bhi) if depth < _MAX_DEPTH else []
+        if anchors:
+            i, j = alo, blo
+            for ai, bj in anchors:
+                _align(a, i, ai, b, j, bj, budget, out, depth + 1)
+                out.append(("equal", ai, ai + 1, bj, bj + 1))
+                i, j = ai + 1, bj + 1
+            _align(a, i, ahi, b, j, bhi, budget, out, depth + 1)
+        else:
+            script = _myers(a, alo, ahi, b, blo, bhi, budget)
+            if script is None:
+                budget.truncated = True
+                out.append(("replace", alo, ahi, blo, bhi))
+            else:
+                out.extend(script)
+
+    if ahi < end_a:
+        out.append(("equal", ahi, end_a, bhi, end_b))
+
+
+def _merge(opcodes: List[_Opcode]) -> List[_Opcode]:
+    """Coalesce neighbours; a run of deletes/inserts becomes one ``replace``."""
+
+    merged: List[_Opcode] = []
+    for tag, a1, a2, b1, b2 in opcodes:
+        if a1 == a2 and b1 == b2:
+            continue
+        if merged:
+            ptag, pa1, _, pb1, _ = merged[-1]
+            same = ptag == tag
+            if same or (ptag != "equal" and tag != "equal"):
+                if not same:
+                    tag = "replace"
+                merged[-1] = (tag, pa1, a2, pb1, b2)
+                continue
+        merged.append((tag, a1, a2, b1, b2))
+    return merged
+
+
+def diff_ops(
+    before: str,
+    after: str,
+    *,
+    granularity: str = "token",
+    budget_ms: Optional[float] = 2000,
+    max_cost: Optional[int] = 1000,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Return ``(ops, truncated)`` turning ``before`` into ``after``.
+
+    Each op is ``{"op", "a_start", "a_end", "b_start", "b_end"}`` with
+    ``op`` one of ``equal``/``delete``/``insert``/``replace`` and character
+    offsets into ``before`` (``a_*``) and ``after`` (``b_*``).  Ops are
+    contiguous and cover both texts.  ``truncated`` is ``True`` when a budget
+    was hit and some changed region was reported as a coarse ``replace``.
+    """
+
+    a, a_starts = tokenize(before, granularity)
+    b, b_starts = tokenize(after, granularity)
+    a_starts.append(len(before))
+    b_starts.append(len(after))
+    budget = _Budget(budget_ms, max_cost)
+    opcodes: List[_Opcode] = []
+    _align(a, 0, len(a), b, 0, len(b), budget, opcodes)
+    ops = [
+        {
+            "op": tag,
+            "a_start": a_starts[a1],
+            "a_end": a_starts[a2],
+            "b_start": b_starts[b1],
+            "b_end": b_starts[b2],
+        }
+        for tag, a1, a2, b1, b2 in _merge(opcodes)
+    ]
+    return ops, budget.truncated
+
+
+def _grouped(opcodes: List[_Opcode], n: int) -> List[List[_Opcode]]:
+    """Hunks with ``n`` lines of context, as ``SequenceMatcher.get_grouped_opcodes``."""
+
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    tag, i1, i2, j1, j2 = codes[0]
+    if tag == "equal":
+        codes[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+    tag, i1, i2, j1, j2 = codes[-1]
+    if tag == "equal":
+        codes[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+    groups: List[List[_Opcode]] = []
+    group: List[_Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+    return groups
+
+
+def _hunk_range(start: int, stop: int) -> str:
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start + 1 if length else start},{length}"
+
+
+def unified_diff(
+    before: str,
+    after: str,
+    *,
+    n: int = 3,
+    budget_ms: Optional[float] = 2000,
+    max_cost: Optional[int] = 1000,
+) -> str:
+    """Line-based unified diff in :func:`difflib.unified_diff` format.
+
+    Lines are aligned with the bounded engine of :func:`diff_ops`; a gap
+    over budget becomes one hunk replacing the whole region.
+    """
+
+    a, b = before.splitlines(), after.splitlines()
+    opcodes: List[_Opcode] = []
+    _align(a, 0, len(a), b, 0, len(b), _Budget(budget_ms, max_cost), opcodes)
+    out: List[str] = []
+    for group in _grouped(_merge(opcodes), n):
+        if not out:
+            out += ["--- before", "+++ after"]
+        first, last = group[0], group[-1]
+        out.append(
+            f"@@ -{_hunk_range(first[1], last[2])} +{_hunk_range(first[3], last[4])} @@"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + line for line in a[i1:i2])
+                continue
+            out.extend("-" + line for line in a[i1:i2])
+            out.extend("+" + line for line in b[j1:j2])
+    return "\n".join(out)
+
+
+def render_inline_html(before: str, after: str, ops: Sequence[Dict[str, Any]]) -> str:
+    """Inline redline: removed text in ``<del>``, added text in ``<ins>``."""
+
+    parts: List[str] = ['<div class="redline">']
+    for op in ops:
+        removed = before[op["a_start"] : op["a_end"]]
+        added = after[op["b_start"] : op["b_end"]]
+        if op["op"] == "equal":
+            parts.append(_html.escape(added))
+            continue
+        if removed:
+            parts.append(f"<del>{_html.escape(removed)}</del>")
+        if added:
+            parts.append(f"<ins>{_html.escape(added)}</ins>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def make_table_html(before: str, after: str) -> str:
+    """Side-by-side :class:`difflib.HtmlDiff` table (slow on long texts)."""
+
+    return difflib.HtmlDiff().make_table(before.splitlines(), after.splitlines())
+
+
+def table_fits(
+    before: str,
+    after: str,
+    *,
+    max_lines: Optional[int] = TABLE_MAX_LINES,
+    max_chars: Optional[int] = TABLE_MAX_CHARS,
+) -> bool:
+    """Whether the texts are small enough for :func:`make_table_html`."""
+
+    if max_chars is not None and len(before) + len(after) > max_chars:
+        return False
+    if max_lines is not None:
+        lines = max(before.count("\n"), after.count("\n")) + 1
+        if lines > max_lines:
+            return False
+    return True
+
+
+def make_diff(
+    before: str,
+    after: str,
+    view: str = "table",
+    ops: Optional[Sequence[Dict[str, Any]]] = None,
+    *,
+    budget_ms: Optional[float] = 2000,
+    max_cost: Optional[int] = 1000,
+    max_table_lines: Optional[int] = TABLE_MAX_LINES,
+    max_table_chars: Optional[int] = TABLE_MAX_CHARS,
+) -> Tuple[str, str]:
+    """Return unified and HTML diffs for the given texts.
+
+    The unified diff is line based (:func:`unified_diff`, bounded by
+    ``budget_ms``/``max_cost``).  ``view`` selects the HTML: ``"table"`` the
+    side-by-side table, ``"inline"`` renders ``ops`` (computed with
+    :func:`diff_ops` when not given) and ``"none"`` skips it.  A table over
+    ``max_table_lines``/``max_table_chars`` is rendered inline instead.
+    """
+    if view not in VIEWS:
+        raise ValueError(f"unknown diff view: {view!r}")
+    unified = unified_diff(before, after, budget_ms=budget_ms, max_cost=max_cost)
+    if view == "table" and not table_fits(
+        before, after, max_lines=max_table_lines, max_chars=max_table_chars
+    ):
+        view = "inline"
+    if view == "table":
+        html = make_table_html(before, after)
+    elif view == "inline":
+        if ops is None:
+            ops, _ = diff_ops(before, after, budget_ms=budget_ms, max_cost=max_cost)
+        html = render_inline_html(before, after, ops)
+    else:
+        html = ""
+    return unified, html
+
+
+__all__ = [
+    "GRANULARITIES",
+    "VIEWS",
+    "diff_ops",
+    "make_diff",
+    "make_table_html",
+    "render_inline_html",
+    "table_fits",
+    "tokenize",
+    "unified_diff",
+]
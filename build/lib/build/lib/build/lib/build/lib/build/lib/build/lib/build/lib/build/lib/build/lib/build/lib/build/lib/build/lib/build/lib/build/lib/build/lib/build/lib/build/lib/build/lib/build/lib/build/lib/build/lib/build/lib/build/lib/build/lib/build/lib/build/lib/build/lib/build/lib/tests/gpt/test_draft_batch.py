@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+import json
+import re
+import sys
+import time
+
+from contract_review_app.gpt import gpt_orchestrator as orch
+from contract_review_app.gpt.gpt_orchestrator import arun_draft_batch, run_draft_batch
+
+CITATIONS = [{"instrument": "UK GDPR", "section": "Art. 28"}]
+
+
+def _analyses(n):
+    return [
+        {"clause_type": "data_protection", "text": f"Clause {i} text.", "citations": CITATIONS}
+        for i in range(n)
+    ]
+
+
+class FakeBatchLLM:
+    def __init__(self, drop=()):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.drop = set(drop)
+
+    async def __call__(self, prompt):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        ids = [int(x) for x in re.findall(r"<<CLAUSE id=(\d+)>>", prompt)]
+        drafts = [
+            {"id": i, "draft_text": f"Revised clause {i} [c1] (Directive 1/2/3)."}
+            for i in ids
+            if i not in self.drop
+        ]
+        return "Here you go:\n" + json.dumps({"drafts": drafts})
+
+
+def test_batches_pack_clauses_and_apply_guardrails_per_clause():
+    llm = FakeBatchLLM()
+    out = run_draft_batch(
+        _analyses(20), use_llm=True, batch_size=8, max_parallel=2, call=llm
+    )
+    assert llm.calls == 3
+    assert llm.peak <= 2
+    assert [o["draft_text"].split()[2] for o in out] == [str(i) for i in range(20)]
+    for o in out:
+        assert o["model"] == "batch-llm"
+        assert o["verification_status"] == "verified"
+        assert "Directive" not in o["draft_text"]
+        assert "neutralize_unknown_sources" in o["guardrails"]["applied"]
+
+
+def test_missing_clause_falls_back_to_single_draft():
+    llm = FakeBatchLLM(drop={1})
+    out = asyncio.run(arun_draft_batch(_analyses(3), use_llm=True, call=llm))
+    assert llm.calls == 1
+    assert "batch_miss_single_draft" in out[1]["guardrails"]["applied"]
+    assert out[0]["model"] == "batch-llm"
+
+
+def test_batch_misses_run_off_loop_in_parallel(monkeypatch):
+    def slow_draft(a, **kwargs):
+        time.sleep(0.2)
+        return {"model": "proxy-llm", "guardrails": {"applied": []}}
+
+    monkeypatch.setattr(orch, "run_draft", slow_draft)
+    llm = FakeBatchLLM(drop={0, 1, 2, 3})
+    start = time.perf_counter()
+    out = asyncio.run(arun_draft_batch(_analyses(4), use_llm=True, max_parallel=4, call=llm))
+    assert time.perf_counter() - start < 0.6
+    assert all("batch_miss_single_draft" in o["guardrails"]["applied"] for o in out)
+
+
+def test_default_batch_call_uses_model_shared_service_and_cache(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.setattr(orch, "_BATCH_SERVICES", {})
+    # other gpt tests install a stub service module
+    monkeypatch.delitem(sys.modules, "contract_review_app.gpt.service", raising=False)
+    importlib.import_module("contract_review_app.gpt.service")
+    call = orch._default_batch_call("mock-batch", 3)
+    svc = orch._batch_service("mock-batch")
+    assert svc.client.model == "mock-batch"
+
+    seen = []
+    real = svc.client.adraft
+
+    async def spy(prompt, max_tokens, temperature, timeout):
+        seen.append(max_tokens)
+        return await real(prompt, max_tokens, temperature, timeout)
+
+    monkeypatch.setattr(svc.client, "adraft", spy)
+    asyncio.run(call("batch prompt"))
+    asyncio.run(call("batch prompt"))
+    assert seen == [svc.cfg.max_tokens * 3]
+    assert orch._batch_service(None).cache is svc.cache
+
+
+def test_rule_templates_skip_the_llm():
+    llm = FakeBatchLLM()
+    items = [{"clause_type": "x", "proposed_text": "Template text."}]
+    out = run_draft_batch(items, use_llm=True, call=llm)
+    assert llm.calls == 0
+    assert out[0]["model"] == "rule-template"
+
+
+def test_stream_guardrails_run_per_sentence_and_on_full_text():
+    from contract_review_app.gpt.gpt_orchestrator import aguard_stream
+
+    async def tokens():
+        for tok in ["```The Supplier ", "shall deliver. ", "As an AI I cannot ", "advise. ", "Fees apply."]:
+            yield tok
+
+    async def run():
+        return [ev async for ev in aguard_stream(tokens(), mode="standard")]
+
+    events = asyncio.run(run())
+    deltas = [e["text"] for e in events if e["event"] == "delta"]
+    assert deltas == ["The Supplier shall deliver. ", "Fees apply."]
+    done = events[-1]
+    assert done["event"] == "done"
+    assert "As an AI" not in done["draft_text"]
+    assert "strip_markdown" in done["guardrails"]["applied"]
@@ -0,0 +1,23 @@
+from contract_review_app.engine.doc_type import guess_doc_type
+
+NDA = (
+    "NON-DISCLOSURE AGREEMENT\n"
+    "This Non-Disclosure Agreement protects Confidential Information disclosed "
+    "by the Disclosing Party to the Receiving Party.\n"
+)
+FILLER = "The parties shall act in good faith in all matters.\n" * 400
+
+
+def test_prefix_mode_matches_full_scan_when_decisive():
+    text = NDA + FILLER
+    full = guess_doc_type(text, prefix_kb=0)
+    early = guess_doc_type(text, prefix_kb=4)
+
+    assert full[0] == "nda"
+    assert early[:2] == full[:2]
+
+
+def test_prefix_mode_falls_back_to_full_text():
+    text = "1. GENERAL\n" + FILLER + NDA
+
+    assert guess_doc_type(text, prefix_kb=1)[0] == guess_doc_type(text, prefix_kb=0)[0]
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import re
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+
+from contract_review_app.core import json_codec
+
+# (payload, weight, compressed)
+_Blob = Tuple[bytes, int, bool]
+
+# string literals, the only place "," and ":" are not separators
+_STRING_RE = re.compile(rb'"(?:[^"\\]|\\.)*"')
+# bytes json.dumps' ASCII escaping adds: DEL -> \u007f, and per UTF-8 lead
+# byte a \uXXXX escape (a surrogate pair for 4-byte sequences)
+_ESCAPE_CLASS = bytes(
+    1 if b == 0x7F else 2 if 0xC0 <= b <= 0xDF else 3 if 0xE0 <= b <= 0xEF
+    else 4 if 0xF0 <= b <= 0xF7 else 0
+    for b in range(256)
+)
+_ESCAPE_EXTRA = ((1, 5), (2, 4), (3, 3), (4, 8))
+
+
+def _dumps(value: Any) -> bytes:
+    try:
+        return json_codec.dumps(value, default=str)
+    except (TypeError, ValueError):
+        return json_codec.dumps(str(value))
+
+
+def _std_len(raw: bytes) -> int:
+    """Length of ``json.dumps`` output (default separators, ASCII escaping)
+    for the value whose compact encoding is ``raw``.
+
+    Entry limits have always been expressed in that measure; deriving it
+    from the compact bytes avoids a second serialization.
+    """
+    size = len(raw)
+    if raw[:1] != b'"':
+        bare = _STRING_RE.sub(b"", raw) if b'"' in raw else raw
+        size += bare.count(b",") + bare.count(b":")
+    if not raw.isascii() or b"\x7f" in raw:
+        classes = raw.translate(_ESCAPE_CLASS)
+        size += sum(extra * classes.count(cls) for cls, extra in _ESCAPE_EXTRA)
+    return size
+
+
+def _key_len(key: str) -> int:
+    return _std_len(json_codec.dumps(key))
+
+
+_BODY = "body"
+_BODY_KEY_LEN = _key_len(_BODY)
+
+
+def _obj_len(item_total: int, count: int) -> int:
+    """``json.dumps`` length of an object whose ``key: value`` items sum to
+    ``item_total`` characters."""
+    return 2 + item_total + 2 * max(0, count - 1)
+
+
+class _Record:
+    """Pre-serialized trace entry.
+
+    Top-level keys live in ``head``; a dict ``body`` is kept key by key in
+    ``body`` so ``TraceStore.add`` only serializes the value it receives.
+    ``head["body"]`` is ``None`` while the body is held in ``body``.
+    """
+
+    __slots__ = ("head", "body", "head_total", "body_total")
+
+    def __init__(self) -> None:
+        self.head: "OrderedDict[str, Optional[_Blob]]" = OrderedDict()
+        self.body: Optional[Dict[str, _Blob]] = None
+        self.head_total = 0
+        self.body_total = 0
+
+    def weight(self) -> int:
+        total = self.head_total
+        if self.body is not None:
+            total += _BODY_KEY_LEN + 2 + _obj_len(self.body_total, len(self.body))
+        return _obj_len(total, len(self.head))
+
+
+class TraceStore:
+    """In-memory LRU store for trace snapshots.
+
+    Values are serialized once, when they are written, into compact JSON
+    bytes (zlib-compressed above ``compress_min_bytes``) and decoded only when
+    an entry is read back.  Entry weights are tracked per key, so writing a
+    key costs the size of that key's value rather than of the whole entry;
+    weights and limits are in ``json.dumps`` characters (default separators,
+    ASCII escaping), derived from the compact bytes.
+    Entries returned by :meth:`get` are fresh copies; write changes back with
+    :meth:`put` or :meth:`add`.
+    """
+
+    def __init__(
+        self,
+        maxlen: int = 200,
+        max_size_bytes: int = 0,
+        max_entry_size_bytes: int = 0,
+        compress_min_bytes: int = 0,
+    ) -> None:
+        self.maxlen = maxlen
+        self.max_size_bytes = max(0, int(max_size_bytes))
+        self.max_entry_size_bytes = max(0, int(max_entry_size_bytes))
+        self.compress_min_bytes = max(0, int(compress_min_bytes))
+        self._data: "OrderedDict[str, _Record]" = OrderedDict()
+        self._weights: Dict[str, int] = {}
+        self._total_weight = 0
+        self._writes = 0
+        self._trims = 0
+        self._serialize_ns = 0
+        self._materialize_ns = 0
+
+    # ----------------------------------------------------------- serialization
+    def _blob(self, value: Any) -> _Blob:
+        started = time.perf_counter_ns()
+        raw = _dumps(value)
+        weight = _std_len(raw)
+        if self.compress_min_bytes and len(raw) >= self.compress_min_bytes:
+            blob: _Blob = (zlib.compress(raw, 1), weight, True)
+        else:
+            blob = (raw, weight, False)
+        self._serialize_ns += time.perf_counter_ns() - started
+        return blob
+
+    @staticmethod
+    def _load(blob: _Blob) -> Any:
+        payload, _, compressed = blob
+        if compressed:
+            payload = zlib.decompress(payload)
+        return json_codec.loads(payload)
+
+    @staticmethod
+    def _item_len(key: str, blob: _Blob) -> int:
+        return _key_len(key) + 2 + blob[1]
+
+    def _set_head(self, rec: _Record, key: str, blob: Optional[_Blob]) -> None:
+        old = rec.head.get(key)
+        if old is not None:
+            rec.head_total -= self._item_len(key, old)
+        rec.head[key] = blob
+        if blob is not None:
+            rec.head_total += self._item_len(key, blob)
+
+    def _set_body(self, rec: _Record, key: str, blob: _Blob) -> None:
+        body = rec.body
+        if body is None:
+            return
+        old = body.get(key)
+        if old is not None:
+            rec.body_total -= self._item_len(key, old)
+        body[key] = blob
+        rec.body_total += self._item_len(key, blob)
+
+    def _replace_body(self, rec: _Record, body: Any) -> None:
+        if isinstance(body, dict):
+            self._set_head(rec, _BODY, None)
+            rec.body = {}
+            rec.body_total = 0
+            for key, value in body.items():
+                self._set_body(rec, str(key), self._blob(value))
+        else:
+            rec.body = None
+            rec.body_total = 0
+            self._set_head(rec, _BODY, self._blob(body))
+
+    # ------------------------------------------------------------- accounting
+    def _drop_lru(self) -> None:
+        try:
+            cid, _ = self._data.popitem(last=False)
+        except KeyError:
+            return
+        weight = self._weights.pop(cid, 0)
+        self._total_weight = max(0, self._total_weight - weight)
+
+    def _record_weight(self, cid: str) -> None:
+        rec = self._data.get(cid)
+        if rec is None:
+            return
+        new_weight = rec.weight()
+        old_weight = self._weights.get(cid, 0)
+        self._weights[cid] = new_weight
+        self._total_weight += new_weight - old_weight
+
+    def _apply_entry_limit(self, cid: str) -> None:
+        if self.max_entry_size_bytes <= 0:
+            return
+        rec = self._data.get(cid)
+        if rec is None or rec.body is None:
+            return
+        weight = rec.weight()
+        if weight <= self.max_entry_size_bytes:
+            return
+
+        # Only the trimmable keys are decoded; every pop below reports the
+        # bytes it removed so the weight is tracked without re-serializing.
+        body: Dict[str, Any] = {
+            key: self._load(rec.body[key])
+            for key in ("dispatch", "features")
+            if key in rec.body
+        }
+
+        def _pop_tail(items: list[Any]) -> int:
+            removed = _std_len(_dumps(items.pop()))
+            return removed + 2 if items else removed
+
+        def _resolve_list(container: Dict[str, Any], path: tuple[str, ...]) -> list[Any] | None:
+            current: Any = container
+            for key in path:
+                if not isinstance(current, dict):
+                    return None
+                current = current.get(key)
+                if current is None:
+                    return None
+            return current if isinstance(current, list) else None
+
+        def _candidates(container: Dict[str, Any]) -> list[Any]:
+            candidates = _resolve_list(container, ("dispatch", "candidates"))
+            return candidates if candidates is not None else []
+
+        def _trim_reason_buckets(container: Dict[str, Any]) -> int:
+            bucket_keys = ("patterns", "amounts", "durations", "law", "jurisdiction")
+            for candidate in reversed(_candidates(container)):
+                if not isinstance(candidate, dict):
+                    continue
+                reasons = candidate.get("reasons")
+                if not isinstance(reasons, list):
+                    continue
+                for reason in reversed(reasons):
+                    if not isinstance(reason, dict):
+                        continue
+                    for key in bucket_keys:
+                        bucket = reason.get(key)
+                        if isinstance(bucket, list) and bucket:
+                            return _pop_tail(bucket)
+            return 0
+
+        def _trim_reason_list(container: Dict[str, Any]) -> int:
+            for candidate in reversed(_candidates(container)):
+                if not isinstance(candidate, dict):
+                    continue
+                reasons = candidate.get("reasons")
+                if isinstance(reasons, list) and reasons:
+                    return _pop_tail(reasons)
+            return 0
+
+        trim_paths: tuple[tuple[str, ...], ...] = (
+            ("dispatch", "candidates"),
+            ("features", "segments"),
+        )
+
+        trimmed = False
+        while weight > self.max_entry_size_bytes:
+            changed = False
+            for path in trim_paths:
+                items = _resolve_list(body, path)
+                if not items:
+                    continue
+                # remove items from the tail to favour earlier entries
+                weight -= _pop_tail(items)
+                changed = trimmed = True
+                if weight <= self.max_entry_size_bytes:
+                    break
+            if changed:
+                continue
+            removed = _trim_reason_buckets(body) or _trim_reason_list(body)
+            if not removed:
+                break
+            weight -= removed
+            trimmed = True
+
+        if trimmed:
+            self._trims += 1
+            for key, value in body.items():
+                self._set_body(rec, key, self._blob(value))
+
+    def _enforce_limits(self) -> None:
+        while len(self._data) > self.maxlen:
+            self._drop_lru()
+        if self.max_size_bytes <= 0:
+            return
+        while self._total_weight > self.max_size_bytes and self._data:
+            self._drop_lru()
+
+    def _commit(self, cid: str) -> None:
+        self._writes += 1
+        self._data.move_to_end(cid)
+        self._apply_entry_limit(cid)
+        self._record_weight(cid)
+        self._enforce_limits()
+
+    # ------------------------------------------------------------------ public
+    def put(self, cid: str, item: Dict[str, Any]) -> None:
+        """Insert *item* under *cid* keeping only the latest *maxlen* items.
+
+        An existing entry is updated key by key; dict bodies are merged.
+        """
+        if not cid or not isinstance(item, dict):
+            return
+        rec = self._data.get(cid)
+        if rec is None:
+            rec = self._data[cid] = _Record()
+        for key, value in item.items():
+            key = str(key)
+            if key != _BODY:
+                self._set_head(rec, key, self._blob(value))
+                continue
+            if rec.body:
+                # a non-empty dict body is only ever extended, never replaced
+                if isinstance(value, dict):
+                    for body_key, body_value in value.items():
+                        self._set_body(rec, str(body_key), self._blob(body_value))
+                continue
+            self._replace_body(rec, value)
+        self._commit(cid)
+
+    def add(self, cid: str, key: str, value: Any) -> None:
+        """Attach a ``key``/``value`` pair to the trace body for ``cid``."""
+        if not cid or not key:
+            return
+        rec = self._data.get(cid)
+        if rec is None:
+            self.put(cid, {"body": {key: value}})
+            return
+        if rec.body is None:
+            self._replace_body(rec, {})
+        self._set_body(rec, key, self._blob(value))
+        self._commit(cid)
+
+    def get(self, cid: str) -> Dict[str, Any] | None:
+        rec = self._data.get(cid)
+        if rec is None:
+            return None
+        started = time.perf_counter_ns()
+        entry: Dict[str, Any] = {}
+        for key, blob in rec.head.items():
+            if blob is None:
+                entry[key] = {k: self._load(b) for k, b in (rec.body or {}).items()}
+            else:
+                entry[key] = self._load(blob)
+        self._materialize_ns += time.perf_counter_ns() - started
+        return entry
+
+    def get_field(self, cid: str, key: str) -> Any:
+        """Decode a single top-level ``key`` of the entry for ``cid``."""
+        rec = self._data.get(cid)
+        if rec is None or key not in rec.head:
+            return None
+        blob = rec.head[key]
+        if blob is None:
+            return {k: self._load(b) for k, b in (rec.body or {}).items()}
+        return self._load(blob)
+
+    def digest(self, cid: str) -> Optional[str]:
+        """Content hash of the entry for ``cid``, computed from the stored
+        blobs without decoding them; ``None`` if there is no such entry."""
+        rec = self._data.get(cid)
+        if rec is None:
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        for key, blob in list(rec.head.items()):
+            h.update(key.encode("utf-8") + b"\0")
+            if blob is None:
+                for body_key, body_blob in list((rec.body or {}).items()):
+                    h.update(b"\1" + body_key.encode("utf-8") + b"\0")
+                    h.update(len(body_blob[0]).to_bytes(8, "little") + body_blob[0])
+            else:
+                h.update(len(blob[0]).to_bytes(8, "little") + blob[0])
+        return h.hexdigest()
+
+    def list(self) -> list[str]:
+        return list(self._data.keys())
+
+    def stats(self) -> Dict[str, Any]:
+        """Report store size and the time spent (de)serializing trace data."""
+        stored = 0
+        compressed = 0
+        for rec in self._data.values():
+            blobs = [b for b in rec.head.values() if b is not None]
+            blobs.extend((rec.body or {}).values())
+            for payload, _, is_compressed in blobs:
+                stored += len(payload)
+                compressed += int(is_compressed)
+        return {
+            "entries": len(self._data),
+            "bytes": self._total_weight,
+            "stored_bytes": stored,
+            "compressed_values": compressed,
+            "writes": self._writes,
+            "trims": self._trims,
+            "serialize_ms": round(self._serialize_ns / 1e6, 3),
+            "materialize_ms": round(self._materialize_ns / 1e6, 3),
+        }
+
+
+def compute_cid(request: Request) -> str:
+    """Compute deterministic content id for a request.
+
+    POST/PUT/PATCH: path + sorted(query) + canonical JSON body
+    GET/DELETE: path + sorted(query)
+    """
+    path = request.url.path
+    query_items = sorted(request.query_params.multi_items())
+    query = "&".join(f"{k}={v}" for k, v in query_items)
+    body_part = b""
+    if request.method.upper() in {"POST", "PUT", "PATCH"}:
+        body_bytes = getattr(request.state, "body", b"")
+        try:
+            obj: Any = json_codec.loads(body_bytes) if body_bytes else None
+        except Exception:
+            obj = body_bytes.decode("utf-8", "ignore")
+        if isinstance(obj, (dict, list)):
+            body_part = json_codec.dumps_canonical(obj)
+        elif obj is not None:
+            body_part = str(obj).encode("utf-8")
+    raw = f"{path}{query}".encode("utf-8") + body_part
+    return hashlib.sha256(raw).hexdigest()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from ..config import LLMConfig
+from .openai_client import OpenAIClient, ProviderUnavailableError
+
+
+class AnthropicClient(OpenAIClient):
+    """Anthropic Messages API; only routing and response shape differ."""
+
+    def __init__(self, cfg: LLMConfig):
+        self.provider = "anthropic"
+        self.mode = "live"
+        self.model = cfg.model_draft
+        self._api_key = cfg.anthropic_api_key or ""
+        self._base = cfg.anthropic_base.rstrip("/")
+        self._version = "2023-06-01"
+
+    def _url(self) -> str:
+        return f"{self._base}/messages"
+
+    def _headers(self) -> dict:
+        return {
+            "x-api-key": self._api_key,
+            "anthropic-version": self._version,
+        }
+
+    @staticmethod
+    def _text(data: dict) -> str:
+        return data.get("content", [{}])[0].get("text", "")
+
+    @staticmethod
+    def _delta(event: dict) -> str:
+        if event.get("type") != "content_block_delta":
+            return ""
+        return (event.get("delta") or {}).get("text") or ""
+
+
+__all__ = ["AnthropicClient", "ProviderUnavailableError"]
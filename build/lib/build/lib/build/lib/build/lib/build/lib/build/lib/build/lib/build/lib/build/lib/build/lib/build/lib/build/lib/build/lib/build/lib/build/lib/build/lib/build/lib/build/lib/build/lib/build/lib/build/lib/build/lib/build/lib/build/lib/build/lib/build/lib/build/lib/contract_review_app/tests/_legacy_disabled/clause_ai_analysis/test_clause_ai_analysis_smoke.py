@@ -0,0 +1,3 @@
+def test_clause_ai_analysis_import_smoke():
+    __import__("contract_review_app.clause_ai_analysis")
+    assert True
@@ -0,0 +1,3 @@
+# contract_review_app/tools/__init__.py
+# Навмисно порожній: не імпортуємо нічого, щоб не ламати запуск модулів.
+__all__ = []
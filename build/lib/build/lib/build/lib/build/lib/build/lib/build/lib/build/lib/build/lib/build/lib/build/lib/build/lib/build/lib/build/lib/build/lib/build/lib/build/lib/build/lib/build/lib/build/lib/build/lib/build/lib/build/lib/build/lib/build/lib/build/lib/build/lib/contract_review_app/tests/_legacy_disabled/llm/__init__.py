@@ -0,0 +1 @@
+"""LLM tests package."""
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Read ``name`` from the environment as an integer."""
+
+    raw = os.getenv(name)
+    if raw is None or not str(raw).strip():
+        return default
+    try:
+        return int(raw)
+    except (TypeError, ValueError):  # tolerate floats or junk values
+        try:
+            return int(float(str(raw)))
+        except (TypeError, ValueError):
+            return default
+
+
+# API limits
+API_TIMEOUT_S = env_int("CONTRACTAI_API_TIMEOUT_S", 60)
+REQUEST_TIMEOUT_S = env_int("CONTRACTAI_REQUEST_TIMEOUT_S", 75)
+API_RATE_LIMIT_PER_MIN = env_int("CONTRACTAI_RATE_PER_MIN", 60)
+# Rate limiter: tracked keys per process; a SQLite file shares buckets across workers
+API_RATE_LIMIT_MAX_KEYS = env_int("CONTRACTAI_RATE_MAX_KEYS", 10_000)
+API_RATE_LIMIT_DB = os.getenv("CONTRACTAI_RATE_DB") or None
+DEFAULT_PAGE_SIZE = env_int("CONTRACTAI_PAGE_SIZE", 10)
+MAX_PAGE_SIZE = env_int("CONTRACTAI_MAX_PAGE_SIZE", 50)
+
+# Orchestrator budgets
+ANALYZE_TIMEOUT_S = env_int("CONTRACT_AI_ANALYZE_TIMEOUT_SEC", 55)
+QA_TIMEOUT_S = env_int("CONTRACT_AI_QA_TIMEOUT_SEC", 40)
+DRAFT_TIMEOUT_S = env_int("CONTRACT_AI_DRAFT_TIMEOUT_SEC", 40)
+
+# External calls
+LLM_TIMEOUT_S = env_int("LLM_TIMEOUT_S", 40)
+CH_TIMEOUT_S = env_int("CH_TIMEOUT_S", 10)
+
+# Audit/learning log writer: lines per batch, max delay and queue bound
+LOG_BATCH_SIZE = env_int("CONTRACTAI_LOG_BATCH", 256)
+LOG_FLUSH_MS = env_int("CONTRACTAI_LOG_FLUSH_MS", 200)
+LOG_QUEUE_MAX = env_int("CONTRACTAI_LOG_QUEUE", 10_000)
+
+# Rule packs: poll interval for hot reload of changed packs (0 disables)
+RULE_RELOAD_INTERVAL_S = env_int("CONTRACTAI_RULE_RELOAD_S", 0)
+
+# Redlines: time budget per diff and max edit cost per gap before coarsening
+REDLINE_BUDGET_MS = env_int("CONTRACTAI_REDLINE_BUDGET_MS", 2000)
+REDLINE_MAX_COST = env_int("CONTRACTAI_REDLINE_MAX_COST", 1000)
+# Redlines: largest texts still rendered as the side-by-side table
+REDLINE_TABLE_MAX_LINES = env_int("CONTRACTAI_REDLINE_TABLE_MAX_LINES", 200)
+REDLINE_TABLE_MAX_CHARS = env_int("CONTRACTAI_REDLINE_TABLE_MAX_CHARS", 40_000)
+
+
+__all__ = [
+    "API_TIMEOUT_S",
+    "REQUEST_TIMEOUT_S",
+    "API_RATE_LIMIT_PER_MIN",
+    "API_RATE_LIMIT_MAX_KEYS",
+    "API_RATE_LIMIT_DB",
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "ANALYZE_TIMEOUT_S",
+    "QA_TIMEOUT_S",
+    "DRAFT_TIMEOUT_S",
+    "LLM_TIMEOUT_S",
+    "CH_TIMEOUT_S",
+    "LOG_BATCH_SIZE",
+    "LOG_FLUSH_MS",
+    "LOG_QUEUE_MAX",
+    "RULE_RELOAD_INTERVAL_S",
+    "REDLINE_BUDGET_MS",
+    "REDLINE_MAX_COST",
+    "REDLINE_TABLE_MAX_CHARS",
+    "REDLINE_TABLE_MAX_LINES",
+    "env_int",
+]
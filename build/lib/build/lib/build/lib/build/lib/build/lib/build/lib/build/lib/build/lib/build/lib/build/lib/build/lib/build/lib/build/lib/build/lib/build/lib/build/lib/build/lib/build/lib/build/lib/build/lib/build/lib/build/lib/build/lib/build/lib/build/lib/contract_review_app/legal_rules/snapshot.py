@@ -0,0 +1,99 @@
+# contract_review_app/legal_rules/snapshot.py
+"""On-disk snapshots of the parsed rule base.
+
+Parsing the YAML packs dominates worker start-up, so the loader (and the
+dispatcher indexes derived from it) pickle their results behind a header
+holding a content fingerprint.  A snapshot is only used when its fingerprint
+matches, i.e. when no pack file (nor the code that produced it) changed since
+it was written; the header is read first, so a stale snapshot is never
+unpickled.
+
+* ``RULE_SNAPSHOT_DIR`` – directory for snapshot files (default ``var/rules``)
+* ``RULE_SNAPSHOT`` – set to ``0`` to disable on-disk snapshots
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+log = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+# bump when the pickled layout changes in a way the fingerprints do not cover
+SNAPSHOT_FORMAT = 2
+# file layout: magic line, fingerprint line, pickled value
+_MAGIC = b"contract-ai-rule-snapshot\n"
+
+
+def snapshot_dir() -> Optional[Path]:
+    if os.getenv("RULE_SNAPSHOT", "1") == "0":
+        return None
+    return Path(os.getenv("RULE_SNAPSHOT_DIR") or ROOT_DIR / "var" / "rules")
+
+
+def digest(*parts: bytes | str) -> str:
+    """Stable hex digest over ``parts`` (framed, so concatenations differ)."""
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{SNAPSHOT_FORMAT}|{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _path(name: str) -> Optional[Path]:
+    base = snapshot_dir()
+    return None if base is None else base / f"{name}.pickle"
+
+
+def load(name: str, fingerprint: str) -> Any:
+    """Return the value stored under ``name`` for ``fingerprint`` or ``None``."""
+
+    path = _path(name)
+    if path is None or not path.is_file():
+        return None
+    try:
+        with path.open("rb") as fh:
+            # the header is checked before anything is unpickled
+            if fh.readline() != _MAGIC:
+                return None
+            if fh.readline().rstrip(b"\n").decode("ascii") != fingerprint:
+                return None
+            return pickle.load(fh)
+    except Exception as exc:  # corrupt/partial/incompatible snapshot
+        log.debug("Ignoring rule snapshot %s: %s", path, exc)
+        return None
+
+
+def store(name: str, fingerprint: str, value: Any) -> None:
+    """Atomically write ``value`` under ``name``; failures are non-fatal."""
+
+    path = _path(name)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{name}.")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_MAGIC)
+                fh.write(fingerprint.encode("ascii") + b"\n")
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception as exc:  # read-only deployments just skip the cache
+        log.debug("Could not write rule snapshot %s: %s", path, exc)
+
+
+__all__ = ["digest", "load", "snapshot_dir", "store"]
@@ -0,0 +1 @@
+# Panel tests package
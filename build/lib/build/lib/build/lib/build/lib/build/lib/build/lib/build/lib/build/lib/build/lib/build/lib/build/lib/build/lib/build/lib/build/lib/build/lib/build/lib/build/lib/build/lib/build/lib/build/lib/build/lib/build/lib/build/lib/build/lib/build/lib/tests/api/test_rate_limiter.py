@@ -0,0 +1,95 @@
+import sqlite3
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from contract_review_app.api import app as app_module
+from contract_review_app.api.ratelimit import (
+    SqliteTokenBucketLimiter,
+    TokenBucketLimiter,
+)
+
+
+def test_token_bucket_refills_and_evicts_idle_keys():
+    limiter = TokenBucketLimiter(max_keys=2)
+
+    assert limiter.acquire("a", 2, now=0.0) == 0.0
+    assert limiter.acquire("a", 2, now=0.0) == 0.0
+    assert limiter.acquire("a", 2, now=0.0) == 30.0
+    # two tokens per minute -> one token back after 30s
+    assert limiter.acquire("a", 2, now=30.0) == 0.0
+
+    limiter.acquire("b", 2, now=31.0)
+    limiter.acquire("c", 2, now=32.0)
+    assert len(limiter) == 2
+    # "a" was least recently used and starts over with a full bucket
+    assert limiter.acquire("a", 2, now=33.0) == 0.0
+
+
+def test_sqlite_buckets_are_shared_between_limiters(tmp_path):
+    db = tmp_path / "rate.sqlite3"
+    first = SqliteTokenBucketLimiter(db, max_keys=2)
+    second = SqliteTokenBucketLimiter(db, max_keys=2)
+
+    assert first.acquire("k", 1, now=100.0) == 0.0
+    assert second.acquire("k", 1, now=100.0) == 60.0
+    assert second.acquire("k", 1, now=160.0) == 0.0
+
+    # every max_keys-th check prunes idle rows and the least recently used
+    for idx in range(3):
+        first.acquire(f"idle-{idx}", 1, now=500.0 + idx)
+    assert len(first) == 2
+
+
+def test_sqlite_lock_or_error_falls_back_to_process_buckets(tmp_path):
+    db = tmp_path / "rate.sqlite3"
+    limiter = SqliteTokenBucketLimiter(db)
+    holder = sqlite3.connect(str(db), isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        start = time.perf_counter()
+        assert limiter.acquire("k", 1, now=100.0) == 0.0
+        assert limiter.acquire("k", 1, now=100.0) == 60.0
+        # a short busy timeout, not sqlite's default five seconds
+        assert time.perf_counter() - start < 1.0
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+    assert len(limiter) == 0
+
+    limiter._conn.close()
+    assert limiter.acquire("other", 1, now=100.0) == 0.0
+
+
+def test_api_checks_shared_limiter_off_the_event_loop(monkeypatch, tmp_path):
+    threads = []
+
+    class _Recording(SqliteTokenBucketLimiter):
+        def acquire(self, key, limit, now=None):
+            threads.append(threading.current_thread())
+            return super().acquire(key, limit, now)
+
+    monkeypatch.setattr(app_module, "API_RATE_LIMIT_PER_MIN", 1000)
+    monkeypatch.setattr(app_module, "_RATE_LIMITER", _Recording(tmp_path / "r.sqlite3"))
+    client = TestClient(app_module.app)
+
+    with client:
+        assert client.get("/health").status_code == 200
+        loop_thread = client.portal.call(threading.current_thread)
+
+    assert threads and threads[0] is not loop_thread
+
+
+def test_api_returns_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(app_module, "API_RATE_LIMIT_PER_MIN", 1)
+    monkeypatch.setattr(app_module, "_RATE_LIMITER", TokenBucketLimiter())
+    client = TestClient(app_module.app)
+
+    assert client.get("/health").status_code != 429
+    r = client.get("/health")
+
+    assert r.status_code == 429
+    assert r.json()["type"] == "too_many_requests"
+    assert int(r.headers["Retry-After"]) > 0
+    assert "x-cid" in r.headers
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from contract_review_app.api import app as app_module
+from contract_review_app.api.models import SCHEMA_VERSION
+from contract_review_app.api.reports import ReportRenderer
+
+
+def test_concurrent_renders_collapse_into_one():
+    renderer = ReportRenderer(max_items=2)
+    calls = []
+    gate = threading.Event()
+
+    def build():
+        gate.wait(5)
+        calls.append(1)
+        return "<html/>"
+
+    async def scenario():
+        key = ("html", "cid", "d1")
+        pending = [asyncio.ensure_future(renderer.render(key, build)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        gate.set()
+        results = await asyncio.gather(*pending)
+        again = await renderer.render(key, build)
+        return results, again
+
+    results, again = asyncio.run(scenario())
+    renderer.shutdown()
+
+    assert calls == [1]
+    assert {r[0] for r in results} == {"<html/>"}
+    assert again == ("<html/>", True)
+
+
+def test_report_etag_and_cache(monkeypatch):
+    headers = {"x-api-key": "k", "x-schema-version": SCHEMA_VERSION}
+    client = TestClient(app_module.app)
+    r = client.post("/api/analyze", json={"text": "Report cache check."}, headers=headers)
+    assert r.status_code == 200
+    cid = r.headers["x-cid"]
+
+    renders = []
+    real_render = app_module.render_html_report
+    monkeypatch.setattr(
+        app_module,
+        "render_html_report",
+        lambda trace: renders.append(1) or real_render(trace),
+    )
+
+    first = client.get(f"/api/report/{cid}.html")
+    second = client.get(f"/api/report/{cid}.html")
+    assert first.status_code == second.status_code == 200
+    assert first.text == second.text
+    assert second.headers["x-cache"] == "hit"
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+    etag = first.headers["ETag"]
+    not_modified = client.get(f"/api/report/{cid}.html", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert len(renders) == 1
+
+    # new trace data -> new digest -> fresh render
+    app_module.TRACE.add(cid, "note", {"late": True})
+    third = client.get(f"/api/report/{cid}.html", headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
@@ -0,0 +1,26 @@
+import time
+from typing import MutableMapping
+
+from fastapi import Request, Response
+
+from contract_review_app.core.trace import compute_cid
+
+from .models import SCHEMA_VERSION
+
+
+def apply_std_headers(response: Response, request: Request, started_at: float) -> None:
+    """Apply standard headers to the response."""
+    set_std_headers(response.headers, request, started_at)
+
+
+def set_std_headers(
+    headers: MutableMapping[str, str], request: Request, started_at: float
+) -> None:
+    """Set the standard headers on a header mapping (e.g. ``MutableHeaders``)."""
+    latency_ms = int((time.perf_counter() - started_at) * 1000)
+    cid = getattr(request.state, "cid", request.headers.get("x-cid") or compute_cid(request))
+    schema = getattr(request.state, "schema_version", SCHEMA_VERSION)
+    headers["x-schema-version"] = schema
+    headers["x-latency-ms"] = str(latency_ms)
+    headers["x-cid"] = cid
+    headers["X-Cid"] = cid
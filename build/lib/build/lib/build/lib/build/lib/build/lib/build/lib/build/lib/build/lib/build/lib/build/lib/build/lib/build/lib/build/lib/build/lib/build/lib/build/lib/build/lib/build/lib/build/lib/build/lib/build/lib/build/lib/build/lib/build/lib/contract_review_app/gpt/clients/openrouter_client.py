@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from ..config import LLMConfig
+from .openai_client import OpenAIClient, ProviderUnavailableError
+
+
+class OpenRouterClient(OpenAIClient):
+    """OpenRouter speaks the OpenAI chat-completions protocol."""
+
+    def __init__(self, cfg: LLMConfig):
+        self.provider = "openrouter"
+        self.mode = "live"
+        self.model = cfg.model_draft
+        self._api_key = cfg.openrouter_api_key or ""
+        self._base = cfg.openrouter_base.rstrip("/")
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self._api_key}", "HTTP-Referer": ""}
+
+
+__all__ = ["OpenRouterClient", "ProviderUnavailableError"]
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import os
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+from contract_review_app.analysis.agenda import (
+    AGENDA_ORDER,
+    DEFAULT_SALIENCE,
+    SALIENCE_MAX,
+    SALIENCE_MIN,
+    map_to_agenda_group,
+    span_iou,
+    stronger,
+)
+
+__all__ = ["apply_merge_policy", "apply_legacy_merge_policy"]
+
+
+def apply_merge_policy(
+    findings: Iterable[Dict[str, Any]],
+    *,
+    use_agenda: bool = True,
+) -> List[Dict[str, Any]]:
+    """Merge findings using agenda ordering and overlap resolution."""
+
+    items: List[Dict[str, Any]] = [f for f in findings if isinstance(f, dict)]
+    if not items:
+        return []
+
+    if not use_agenda:
+        return apply_legacy_merge_policy(items)
+
+    strict_merge = os.getenv("FEATURE_AGENDA_STRICT_MERGE", "0") == "1"
+
+    groups: List[str] = []
+    spans: List[Tuple[int, int] | None] = []
+    sort_keys: List[Tuple[int, int, int, str]] = []
+    # entity keys are only needed for overlapping pairs; computed on demand
+    entity_keys: List[Set[str] | None] = [None] * len(items)
+
+    # precompute sort keys, spans, groups; inject resolved salience into finding
+    for finding in items:
+        group = map_to_agenda_group(finding)
+        salience = _resolve_salience(finding, group)
+
+        anchor = finding.get("anchor") or {}
+        start_val = _coerce_int(anchor.get("start"))
+        end_val = _coerce_int(anchor.get("end"))
+
+        if start_val is not None and end_val is not None and end_val > start_val:
+            span = (start_val, end_val)
+            start = start_val
+        else:
+            span = _extract_span(finding)
+            start = start_val if start_val is not None else 0
+
+        rid = str(finding.get("rule_id") or "")
+
+        groups.append(group)
+        spans.append(span)
+        sort_keys.append((AGENDA_ORDER.get(group, 999), -salience, start, rid))
+
+        # persist salience for downstream consumers (non-breaking)
+        finding["salience"] = salience
+
+    order = sorted(range(len(items)), key=lambda idx: sort_keys[idx])
+    n = len(order)
+
+    # Survivors are addressed by their position in ``order`` (insertion
+    # sequence).  ``ends`` is a min-segment-tree over those positions holding
+    # each live survivor's span end; it answers "latest survivor ending at or
+    # before ``start``", which bounds how far back overlaps are resolved.
+    # Overlap candidates after that cut come from a per-group index of
+    # (start, seq) pairs kept sorted by start.
+    size = 1
+    while size < n:
+        size <<= 1
+    ends: List[float] = [_INF] * (2 * size)
+    alive = [False] * n
+    index: Dict[str, _GroupIndex] = {}
+    # live survivors with a span, newest last (dead entries are skipped lazily)
+    recent: List[int] = []
+    recent_end: List[int] = []
+
+    for seq, idx in enumerate(order):
+        span = spans[idx]
+        alive[seq] = True
+        if span is None:
+            continue
+
+        start, end = span
+        bucket = index.get(_ALL if strict_merge else groups[idx])
+        if bucket is None:
+            bucket = index[_ALL if strict_merge else groups[idx]] = _GroupIndex()
+
+        while recent and not alive[recent[-1]]:
+            recent.pop()
+            recent_end.pop()
+
+        should_add = True
+        # the newest survivor already ends before us: nothing to compare
+        if recent and recent_end[-1] > start:
+            found = bucket.overlapping(start, end)
+            if found:
+                # the backwards scan stops at the newest survivor ending
+                # at or before our start, whatever its group
+                cut = _rightmost_at_most(ends, size, start)
+            for cand_seq in found:
+                if cand_seq < cut:
+                    break
+                existing_idx = order[cand_seq]
+                if not strict_merge:
+                    # when strict_merge=0 we only collapse overlaps within the
+                    # same agenda group (guaranteed by the bucket) and between
+                    # compatible entities
+                    current_entities = entity_keys[idx]
+                    if current_entities is None:
+                        current_entities = entity_keys[idx] = _entity_key_set(items[idx])
+                    existing_entities = entity_keys[existing_idx]
+                    if existing_entities is None:
+                        existing_entities = entity_keys[existing_idx] = _entity_key_set(
+                            items[existing_idx]
+                        )
+                    if (
+                        current_entities
+                        and existing_entities
+                        and not (current_entities & existing_entities)
+                    ):
+                        continue
+
+                existing_span = spans[existing_idx]
+                if span_iou(existing_span, span) >= 0.6:
+                    champion = stronger(items[idx], items[existing_idx])
+                    if champion is items[existing_idx]:
+                        should_add = False
+                        break
+                    # replace weaker survivor
+                    alive[cand_seq] = False
+                    bucket.remove(existing_span[0], cand_seq)
+                    _tree_clear(ends, size, cand_seq)
+
+        if not should_add:
+            alive[seq] = False
+            continue
+
+        bucket.add(start, end, seq)
+        _tree_lower(ends, size, seq, end)
+        recent.append(seq)
+        recent_end.append(end)
+
+    return [items[idx] for seq, idx in enumerate(order) if alive[seq]]
+
+
+_INF = float("inf")
+_ALL = "\0all"
+
+
+class _GroupIndex:
+    """Live survivor spans of one agenda group, sorted by start."""
+
+    __slots__ = ("keys", "ends", "max_len")
+
+    def __init__(self) -> None:
+        self.keys: List[Tuple[int, int]] = []
+        self.ends: Dict[int, int] = {}
+        self.max_len = 0
+
+    def add(self, start: int, end: int, seq: int) -> None:
+        insort(self.keys, (start, seq))
+        self.ends[seq] = end
+        if end - start > self.max_len:
+            self.max_len = end - start
+
+    def remove(self, start: int, seq: int) -> None:
+        pos = bisect_left(self.keys, (start, seq))
+        del self.keys[pos]
+        del self.ends[seq]
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        """Survivors whose span overlaps ``[start, end)``.
+
+        Returned newest first, matching the order of the backwards scan.
+        """
+
+        keys = self.keys
+        lo = bisect_left(keys, (start - self.max_len, -1))
+        hi = bisect_left(keys, (end, -1))
+        ends = self.ends
+        found = [
+            seq
+            for _, seq in keys[lo:hi]
+            if ends[seq] > start
+        ]
+        found.sort(reverse=True)
+        return found
+
+
+def _tree_lower(tree: List[float], size: int, pos: int, value: float) -> None:
+    """Set an empty leaf to ``value``; ancestors only ever decrease."""
+
+    pos += size
+    tree[pos] = value
+    pos >>= 1
+    while pos and tree[pos] > value:
+        tree[pos] = value
+        pos >>= 1
+
+
+def _tree_clear(tree: List[float], size: int, pos: int) -> None:
+    pos += size
+    tree[pos] = _INF
+    pos >>= 1
+    while pos:
+        left = tree[2 * pos]
+        right = tree[2 * pos + 1]
+        tree[pos] = left if left < right else right
+        pos >>= 1
+
+
+def _rightmost_at_most(tree: List[float], size: int, bound: int) -> int:
+    """Return the highest position whose value is ``<= bound`` (or ``-1``)."""
+
+    if tree[1] > bound:
+        return -1
+    node = 1
+    while node < size:
+        node = 2 * node + 1 if tree[2 * node + 1] <= bound else 2 * node
+    return node - size
+
+
+def _extract_span(finding: Mapping[str, Any]) -> Tuple[int, int] | None:
+    """Best-effort span extraction from anchor/start/end/anchors[*]."""
+    anchor = finding.get("anchor")
+    if isinstance(anchor, Mapping):
+        start = _coerce_int(anchor.get("start"))
+        end = _coerce_int(anchor.get("end"))
+        if start is not None and end is not None and end > start:
+            return (start, end)
+
+    start = _coerce_int(finding.get("start"))
+    end = _coerce_int(finding.get("end"))
+    if start is not None and end is not None and end > start:
+        return (start, end)
+
+    anchors = finding.get("anchors")
+    if isinstance(anchors, Sequence):
+        for candidate in anchors:
+            if not isinstance(candidate, Mapping):
+                continue
+            span = candidate.get("span")
+            if isinstance(span, Sequence) and len(span) == 2:
+                c_start = _coerce_int(span[0])
+                c_end = _coerce_int(span[1])
+                if c_start is not None and c_end is not None and c_end > c_start:
+                    return (c_start, c_end)
+            c_start = _coerce_int(candidate.get("start"))
+            c_end = _coerce_int(candidate.get("end"))
+            if c_start is not None and c_end is not None and c_end > c_start:
+                return (c_start, c_end)
+    return None
+
+
+def _resolve_salience(finding: Mapping[str, Any], group: str) -> int:
+    for key in ("salience", "_spec_salience"):
+        if key not in finding:
+            continue
+        value = _coerce_int(finding.get(key))
+        if value is None:
+            continue
+        if value < SALIENCE_MIN:
+            return SALIENCE_MIN
+        if value > SALIENCE_MAX:
+            return SALIENCE_MAX
+        return value
+    return DEFAULT_SALIENCE.get(group, 50)
+
+
+def _entity_key_set(finding: Mapping[str, Any]) -> Set[str]:
+    tokens: Set[str] = set()
+
+    def _add(value: Any) -> None:
+        token = _normalize_entity_token(value)
+        if token:
+            tokens.add(token)
+
+    _add(finding.get("rule_id"))
+    for key in (
+        "entity",
+        "entity_key",
+        "legal_entity",
+        "topic",
+        "issue_id",
+        "canonical_name",
+    ):
+        _add(finding.get(key))
+
+    meta = finding.get("meta")
+    if isinstance(meta, Mapping):
+        for key in (
+            "entity_id",
+            "entity",
+            "entity_key",
+            "legal_entity",
+            "legal_issue",
+            "topic",
+            "subtopic",
+            "issue_id",
+        ):
+            _add(meta.get(key))
+
+    return tokens
+
+
+def _normalize_entity_token(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        token = value.strip().lower()
+        return token or None
+    try:
+        token = str(value).strip().lower()
+    except Exception:
+        return None
+    return token or None
+
+
+# ----------------------- Legacy prioritisation (for rollback) ----------------
+
+_CHANNEL_PRIORITY = {
+    "law": 0,
+    "policy": 1,
+    "substantive": 2,
+    "drafting": 3,
+    "grammar": 4,
+}
+_DEFAULT_CHANNEL_RANK = len(_CHANNEL_PRIORITY)
+
+_SEVERITY_PRIORITY = {
+    "critical": 4,
+    "severe": 4,
+    "blocker": 4,
+    "major": 3,
+    "high": 3,
+    "medium": 2,
+    "moderate": 2,
+    "minor": 1,
+    "low": 1,
+    "info": 0,
+    "informational": 0,
+}
+
+_MAX_POSITION = 10 ** 12
+
+
+def apply_legacy_merge_policy(findings: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Legacy merge behaviour kept for feature flag rollbacks."""
+    items = [f for f in findings if isinstance(f, dict)]
+    if not items:
+        return []
+
+    buckets: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+    for idx, finding in enumerate(items):
+        key = _bucket_key(finding, idx)
+        buckets.setdefault(key, []).append(finding)
+
+    resolved: List[Dict[str, Any]] = []
+    for key, bucket in buckets.items():
+        if key[0] == "span":
+            best = min(bucket, key=_priority_tuple)
+            resolved.append(best)
+        else:
+            resolved.extend(sorted(bucket, key=_priority_tuple))
+
+    resolved.sort(key=_final_sort_key)
+    return list(resolved)
+
+
+def _bucket_key(finding: Dict[str, Any], idx: int) -> Tuple[Any, ...]:
+    start = _coerce_int(finding.get("start"))
+    end = _coerce_int(finding.get("end"))
+    if start is not None and end is not None:
+        return ("span", start, end)
+
+    anchors = finding.get("anchors")
+    if isinstance(anchors, list) and anchors:
+        anchor = anchors[0]
+        if isinstance(anchor, dict):
+            span = anchor.get("span")
+            if isinstance(span, (list, tuple)) and len(span) == 2:
+                a_start = _coerce_int(span[0])
+                a_end = _coerce_int(span[1])
+                if a_start is not None and a_end is not None:
+                    return ("span", a_start, a_end)
+    return ("idx", idx)
+
+
+def _priority_tuple(finding: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        _channel_rank(finding),
+        -_severity_rank(finding),
+        -_span_length(finding),
+        str(finding.get("rule_id") or ""),
+    )
+
+
+def _final_sort_key(finding: Dict[str, Any]) -> Tuple[Any, ...]:
+    start = _coerce_int(finding.get("start"))
+    end = _coerce_int(finding.get("end"))
+    if start is None:
+        start = _MAX_POSITION
+    if end is None:
+        end = _MAX_POSITION
+    return (
+        start,
+        end,
+        _channel_rank(finding),
+        -_severity_rank(finding),
+        -_span_length(finding),
+        str(finding.get("rule_id") or ""),
+    )
+
+
+def _channel_rank(finding: Dict[str, Any]) -> int:
+    channel = _infer_channel(finding)
+    return _CHANNEL_PRIORITY.get(channel.lower(), _DEFAULT_CHANNEL_RANK)
+
+
+def _infer_channel(finding: Dict[str, Any]) -> str:
+    channel = finding.get("channel")
+    if isinstance(channel, str) and channel.strip():
+        return channel.strip()
+
+    source = finding.get("source")
+    if isinstance(source, str) and source.strip():
+        if source.strip().lower() == "constraints":
+            return "Law"
+
+    rule_id = finding.get("rule_id")
+    if isinstance(rule_id, str) and rule_id.upper().startswith("L2"):
+        return "Law"
+
+    return ""
+
+
+def _severity_rank(finding: Dict[str, Any]) -> int:
+    severity = finding.get("severity") or finding.get("severity_level")
+    if not isinstance(severity, str):
+        severity = str(severity or "")
+    severity_norm = severity.strip().lower()
+    return _SEVERITY_PRIORITY.get(severity_norm, 0)
+
+
+def _span_length(finding: Dict[str, Any]) -> int:
+    start = _coerce_int(finding.get("start"))
+    end = _coerce_int(finding.get("end"))
+    if start is not None and end is not None:
+        length = end - start
+        if length >= 0:
+            return length
+    snippet = finding.get("snippet") or finding.get("message") or ""
+    return len(str(snippet))
+
+
+def _coerce_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+    if value is None:
+        return None
+    try:
+        return int(str(value))
+    except Exception:
+        return None
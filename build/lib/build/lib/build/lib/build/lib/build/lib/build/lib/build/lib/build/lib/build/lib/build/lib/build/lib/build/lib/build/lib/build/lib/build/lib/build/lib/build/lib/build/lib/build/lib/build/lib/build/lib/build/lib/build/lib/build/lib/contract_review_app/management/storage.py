@@ -0,0 +1 @@
+# stub; fill with implementation
@@ -0,0 +1,216 @@
+"""Background writer for encrypted append-only logs (audit, learning log).
+
+While the writer runs, :meth:`BatchedLogWriter.submit` only puts the line on
+a bounded queue.  A single worker thread drains the queue, groups lines per
+file and appends each group with :func:`secure_append_lines` (every line is
+still its own Fernet token) followed by one ``fsync``.  A batch is written
+once ``batch_size`` lines are waiting or ``flush_interval_s`` after its first
+line, and :meth:`stop` drains everything still queued.
+
+A full queue applies back-pressure: ``submit`` waits up to ``put_timeout_s``
+for room, so lines reach the file in submission order.  A group that fails
+to append is retried, then written line by line with :func:`secure_write`;
+lines that still fail are counted in ``failed_lines`` and logged as errors,
+and for ``failure_backoff_s`` afterwards the writer refuses new lines.
+
+``submit`` returns ``False`` when the writer is not running, is backing off
+after a failure or stays full; callers then write synchronously and see any
+error themselves.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from contract_review_app.security import secure_store
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+# attempts per group before falling back to line-by-line writes
+_WRITE_ATTEMPTS = 3
+_RETRY_DELAY_S = 0.05
+
+
+class BatchedLogWriter:
+    def __init__(
+        self,
+        *,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.2,
+        max_queue: int = 10_000,
+        put_timeout_s: float = 1.0,
+        failure_backoff_s: float = 5.0,
+    ) -> None:
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_queue = max(1, int(max_queue))
+        self.put_timeout_s = max(0.0, float(put_timeout_s))
+        self.failure_backoff_s = max(0.0, float(failure_backoff_s))
+        self.failed_lines = 0
+        self._failing_until = 0.0
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        flush_interval_s: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            if batch_size is not None:
+                self.batch_size = max(1, int(batch_size))
+            if flush_interval_s is not None:
+                self.flush_interval_s = max(0.0, float(flush_interval_s))
+            if max_queue is not None:
+                self.max_queue = max(1, int(max_queue))
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), name="secure-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Write every queued line, then stop the worker."""
+
+        with self._lock:
+            thread, q = self._thread, self._queue
+            self._thread = self._queue = None
+        if thread is None or q is None:
+            return
+        q.put(_STOP)
+        thread.join()
+        # lines submitted while stop() was racing the worker
+        leftovers = []
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftovers.append(item)
+        self._write(leftovers)
+
+    @property
+    def failing(self) -> bool:
+        """Whether a recent batch could not be written at all."""
+
+        return time.monotonic() < self._failing_until
+
+    def submit(self, path: str | Path, line: str | bytes) -> bool:
+        q = self._queue
+        if q is None or self.failing:
+            return False
+        try:
+            q.put((os.path.abspath(path), line), timeout=self.put_timeout_s)
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every line submitted so far is on disk."""
+
+        q = self._queue
+        if q is not None:
+            q.join()
+
+    def _run(self, q: queue.Queue) -> None:
+        stopping = False
+        while not stopping:
+            item = q.get()
+            batch: List[Tuple[str, str | bytes]] = []
+            taken = 1
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+            deadline = time.monotonic() + self.flush_interval_s
+            while not stopping and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = q.get(timeout=timeout) if timeout > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if stopping:
+                # drain whatever was queued before stop()
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is not _STOP:
+                        batch.append(item)
+            try:
+                self._write(batch)
+            finally:
+                for _ in range(taken):
+                    q.task_done()
+
+    def _write(self, batch: List[Tuple[str, str | bytes]]) -> None:
+        by_path: Dict[str, List[str | bytes]] = {}
+        for path, line in batch:
+            by_path.setdefault(path, []).append(line)
+        for path, lines in by_path.items():
+            failed = self._write_lines(path, lines)
+            if failed:
+                self.failed_lines += failed
+                self._failing_until = time.monotonic() + self.failure_backoff_s
+
+    @staticmethod
+    def _write_lines(path: str, lines: List[str | bytes]) -> int:
+        """Append ``lines`` to ``path``; return how many could not be written."""
+
+        for attempt in range(_WRITE_ATTEMPTS):
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                secure_store.secure_append_lines(path, lines, fsync=True)
+                return 0
+            except Exception as exc:
+                log.warning(
+                    "failed to write %d log line(s) to %s (attempt %d): %s",
+                    len(lines),
+                    path,
+                    attempt + 1,
+                    exc,
+                )
+            if attempt + 1 < _WRITE_ATTEMPTS:
+                time.sleep(_RETRY_DELAY_S * 2**attempt)
+        # one line at a time, so a single bad line cannot sink the group
+        failed = 0
+        error: Optional[Exception] = None
+        for line in lines:
+            try:
+                secure_store.secure_write(path, line, append=True)
+            except Exception as exc:
+                failed += 1
+                error = exc
+        if failed:
+            log.error("could not write %d log line(s) to %s: %s", failed, path, error)
+        return failed
+
+
+LOG_WRITER = BatchedLogWriter()
+
+
+__all__ = ["BatchedLogWriter", "LOG_WRITER"]
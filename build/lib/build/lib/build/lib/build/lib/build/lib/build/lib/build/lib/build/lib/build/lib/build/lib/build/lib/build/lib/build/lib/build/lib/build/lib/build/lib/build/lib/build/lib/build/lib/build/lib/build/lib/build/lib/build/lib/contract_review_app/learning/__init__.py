@@ -0,0 +1,3 @@
+from .replay_io import ensure_storage, append_events
+from .adaptor import update_weights, get_config
+__all__ = ["ensure_storage", "append_events", "update_weights", "get_config"]
\ No newline at end of file
@@ -0,0 +1,2 @@
+import pytest
+pytest.skip("legacy/orphan tests are quarantined", allow_module_level=True)
@@ -0,0 +1,3 @@
+def test_due_diligence_import_smoke():
+    __import__("contract_review_app.due_diligence")
+    assert True
@@ -0,0 +1,2 @@
+def test_runtime_imports():
+    import fastapi, uvicorn, httpx, cryptography  # noqa: F401
@@ -0,0 +1,31 @@
+import json
+
+from contract_review_app.core import json_codec
+
+
+def test_envelope_splices_shared_lists():
+    findings = [{"rule_id": "R1", "message": "ü \"quoted\""}, {"rule_id": "R2"}]
+    envelope = {
+        "status": "ok",
+        "analysis": {"findings": findings, "status": "ok"},
+        "clauses": findings,
+        "findings": findings,
+        "empty": [],
+        "other": [],
+    }
+
+    raw = json_codec.dumps_envelope(envelope)
+
+    assert json.loads(raw) == envelope
+    assert raw == json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode()
+    assert b"@shared-" not in raw
+
+
+def test_canonical_and_fallback_paths():
+    value = {"b": [1, 2], "a": {"z": 1, "y": None}, "big": 2**70}
+
+    assert json_codec.dumps_canonical(value) == json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    ).encode()
+    assert json_codec.loads(b'{"x": NaN}')["x"] != 0
+    assert json_codec.dumps({1: "a"}, default=str) == b'{"1":"a"}'
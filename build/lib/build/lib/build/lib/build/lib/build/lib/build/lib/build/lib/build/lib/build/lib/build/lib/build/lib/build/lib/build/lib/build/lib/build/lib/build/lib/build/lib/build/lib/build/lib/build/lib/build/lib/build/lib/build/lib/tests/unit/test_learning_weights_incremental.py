@@ -0,0 +1,74 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from contract_review_app.learning import adaptor, replay_io
+
+
+@pytest.fixture
+def learning_dir(tmp_path, monkeypatch):
+    d = str(tmp_path)
+    monkeypatch.setattr(replay_io, "LEARNING_DIR", d)
+    monkeypatch.setattr(replay_io, "REPLAY_FILE", os.path.join(d, "replay_buffer.jsonl"))
+    monkeypatch.setattr(replay_io, "HMAC_KEY_FILE", os.path.join(d, ".hmac.key"))
+    monkeypatch.setattr(replay_io, "GENERATION_FILE", os.path.join(d, ".replay.gen"))
+    monkeypatch.setattr(adaptor, "LEARNING_DIR", d)
+    monkeypatch.setattr(adaptor, "WEIGHTS_DIR", os.path.join(d, "weights"))
+    monkeypatch.setattr(adaptor, "WEIGHTS_FILE", os.path.join(d, "weights", "weights.json"))
+    monkeypatch.setattr(adaptor, "WEIGHTS_LOCK", os.path.join(d, ".weights.lock"))
+    return d
+
+
+def _events(start, count):
+    base = datetime.utcnow() - timedelta(hours=1)
+    return [
+        {
+            "clause_type": "termination",
+            "mode": "standard",
+            "template_id": "T1" if i % 3 else "T2",
+            "action": "applied" if i % 2 else "rejected",
+            "ts": (base + timedelta(seconds=start + i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        for i in range(count)
+    ]
+
+
+def test_update_folds_only_new_events(learning_dir, monkeypatch):
+    replay_io.append_events(_events(0, 6))
+    assert adaptor.update_weights(min_events=1)["events_used"] == 6
+    wm = adaptor._load_weights()["watermark"]
+    assert wm["offset"] == os.path.getsize(replay_io.REPLAY_FILE)
+
+    seen = []
+    real_verify = adaptor._verify_hmac
+    monkeypatch.setattr(
+        adaptor, "_verify_hmac", lambda e, k: seen.append(e["ts"]) or real_verify(e, k)
+    )
+    replay_io.append_events(_events(10, 4))
+    assert adaptor.update_weights(min_events=1)["events_used"] == 4
+    assert len(seen) == 4
+    assert adaptor.update_weights(min_events=1)["events_used"] == 0
+
+    # rotation: a new generation restarts at the top of the fresh file
+    open(replay_io.REPLAY_FILE, "w").close()
+    replay_io._bump_generation()
+    replay_io.append_events(_events(20, 2))
+    assert adaptor.update_weights(min_events=1)["events_used"] == 2
+    seg = adaptor._load_weights()["by_segment"]
+    assert sum(t["n"] for v in seg.values() for t in v.values()) == 12
+
+
+def test_rank_templates_served_from_memory(learning_dir, monkeypatch):
+    replay_io.append_events(_events(0, 6))
+    adaptor.update_weights(min_events=1)
+    context = {"mode": "standard"}
+    first = adaptor.rank_templates("termination", context)
+    assert [r["template_id"] for r in first] == ["T1", "T2"]
+
+    def no_io():
+        raise AssertionError("weights re-read from disk")
+
+    monkeypatch.setattr(adaptor, "_load_weights", no_io)
+    monkeypatch.setattr(adaptor, "WEIGHTS_RECHECK_S", 0.0)
+    assert adaptor.rank_templates("termination", context) == first
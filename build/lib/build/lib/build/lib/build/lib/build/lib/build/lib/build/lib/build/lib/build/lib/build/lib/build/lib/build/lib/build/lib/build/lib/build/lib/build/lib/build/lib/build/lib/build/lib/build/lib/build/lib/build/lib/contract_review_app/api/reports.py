@@ -0,0 +1,94 @@
+"""Off-loop, cached rendering of trace reports (HTML/PDF exports).
+
+Rendering runs on a small thread pool, so an export never blocks the event
+loop.  Artifacts are cached per ``(kind, cid, trace digest)``: re-downloading
+an unchanged trace is a dictionary lookup, and a trace that gained new data
+gets a new digest and is rendered again.  Concurrent requests for the same
+key share one render.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_Key = Tuple[str, str, str]
+
+
+class ReportRenderer:
+    def __init__(self, max_items: int = 64, max_workers: int = 2) -> None:
+        self.max_items = max(0, int(max_items))
+        self.max_workers = max(1, int(max_workers))
+        self._cache: "OrderedDict[_Key, Any]" = OrderedDict()
+        self._inflight: Dict[_Key, Future] = {}
+        # re-entrant: a future that is already done runs its callback inline
+        self._lock = threading.RLock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def cached(self, key: _Key) -> Any:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _submit(self, key: _Key, build: Callable[[], Any]) -> Future:
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="report-render"
+                    )
+                fut = self._pool.submit(build)
+                self._inflight[key] = fut
+                fut.add_done_callback(lambda done: self._finish(key, done))
+            return fut
+
+    def _finish(self, key: _Key, fut: Future) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+            if fut.cancelled() or fut.exception() is not None or not self.max_items:
+                return
+            self._cache[key] = fut.result()
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_items:
+                self._cache.popitem(last=False)
+
+    async def render(self, key: _Key, build: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return ``(artifact, cache_hit)``; exceptions from ``build`` propagate."""
+
+        value = self.cached(key)
+        if value is not None:
+            return value, True
+        return await asyncio.wrap_future(self._submit(key, build)), False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """``If-None-Match`` check accepting lists, weak validators and ``*``."""
+
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+__all__ = ["ReportRenderer", "etag_matches"]
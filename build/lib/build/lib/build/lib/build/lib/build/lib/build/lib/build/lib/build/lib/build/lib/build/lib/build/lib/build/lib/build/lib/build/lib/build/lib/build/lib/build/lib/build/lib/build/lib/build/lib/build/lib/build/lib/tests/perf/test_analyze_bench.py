@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import copy
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from tools import bench_analyze
+from tools.metrics_compare import compare_bench
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_synthetic_contract_is_deterministic():
+    clauses = ["TERM: one year.", "LAW: England."]
+    text = bench_analyze.synthetic_contract(clauses, 200)
+    assert len(text) == 200
+    assert text.startswith("1. TERM: one year.\n\n2. LAW: England.\n\n3. TERM")
+    assert text == bench_analyze.synthetic_contract(clauses, 200)
+
+
+def test_bench_report_feeds_regression_gate(tmp_path, monkeypatch):
+    monkeypatch.setenv("API_KEY", "bench-test-key")
+    monkeypatch.setattr("contract_review_app.api.app.API_RATE_LIMIT_PER_MIN", 1_000_000)
+    report = bench_analyze.run(sizes=[10_000], repeat=1, max_regression_pct=25.0)
+
+    names = [d["name"] for d in report["documents"]]
+    assert names == ["mixed_sample.txt", "synthetic_10000"]
+    doc = report["documents"][1]
+    assert doc["chars"] == 10_000 and doc["pages"] == 4
+    assert doc["ms_median"] > 0 and doc["peak_mem_kb"] > 0
+    assert {"parse", "engine"} <= set(doc["stages"])
+    assert report["metrics"]["perf"]["avg_ms_per_page"] > 0
+
+    assert compare_bench(report, report) == []
+    baseline = copy.deepcopy(report)
+    baseline["documents"][1]["ms_median"] = doc["ms_median"] / 2
+    failures = compare_bench(baseline, report)
+    assert len(failures) == 1 and "synthetic_10000: ms_median" in failures[0]
+    assert compare_bench(baseline, report, max_regression_pct=150.0) == []
+
+    base_path = tmp_path / "baseline.json"
+    cur_path = tmp_path / "current.json"
+    base_path.write_text(json.dumps(baseline), encoding="utf-8")
+    cur_path.write_text(json.dumps(report), encoding="utf-8")
+    cmd = [
+        sys.executable,
+        "tools/metrics_compare.py",
+        "--bench-baseline",
+        str(base_path),
+        "--bench-current",
+        str(cur_path),
+    ]
+    assert subprocess.run(cmd, cwd=ROOT).returncode == 1
+    assert subprocess.run(cmd + ["--max-regression-pct", "150"], cwd=ROOT).returncode == 0
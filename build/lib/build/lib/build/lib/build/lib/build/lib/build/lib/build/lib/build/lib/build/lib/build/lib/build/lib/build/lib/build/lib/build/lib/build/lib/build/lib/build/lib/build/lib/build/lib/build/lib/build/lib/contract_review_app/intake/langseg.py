@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Pattern
+
+
+_LATIN_RANGES = [
+    (0x0080, 0x00FF),
+    (0x0100, 0x017F),
+    (0x0180, 0x024F),
+    (0x1E00, 0x1EFF),
+]
+_CYRILLIC_RANGES = [
+    (0x0400, 0x04FF),
+    (0x0500, 0x052F),
+    (0x2DE0, 0x2DFF),
+    (0xA640, 0xA69F),
+]
+_GREEK_RANGES = [
+    (0x0370, 0x03FF),
+    (0x1F00, 0x1FFF),
+]
+_ARABIC_RANGES = [
+    (0x0600, 0x06FF),
+    (0x0750, 0x077F),
+    (0x08A0, 0x08FF),
+]
+_HEBREW_RANGES = [(0x0590, 0x05FF)]
+
+
+def _in_ranges(cp: int, ranges: List[tuple[int, int]]) -> bool:
+    return any(start <= cp <= end for start, end in ranges)
+
+
+def _classify(cp: int) -> str:
+    ch = chr(cp)
+    if ch.isalpha():
+        if cp <= 0x007F:
+            return "Latin"
+        if _in_ranges(cp, _LATIN_RANGES):
+            return "Latin"
+        if _in_ranges(cp, _CYRILLIC_RANGES):
+            return "Cyrillic"
+        if _in_ranges(cp, _GREEK_RANGES):
+            return "Greek"
+        if _in_ranges(cp, _ARABIC_RANGES):
+            return "Arabic"
+        if _in_ranges(cp, _HEBREW_RANGES):
+            return "Hebrew"
+    return "Common"
+
+
+def _build_table() -> Dict[int, str]:
+    """Codepoint -> script for every non-Common codepoint."""
+
+    table: Dict[int, str] = {}
+    spans = [(0x0000, 0x007F)]
+    for ranges in (
+        _LATIN_RANGES,
+        _CYRILLIC_RANGES,
+        _GREEK_RANGES,
+        _ARABIC_RANGES,
+        _HEBREW_RANGES,
+    ):
+        spans.extend(ranges)
+    for lo, hi in spans:
+        for cp in range(lo, hi + 1):
+            script = _classify(cp)
+            if script != "Common":
+                table[cp] = script
+    return table
+
+
+def _char_class(cps: List[int]) -> str:
+    """Regex character class matching exactly ``cps`` (sorted)."""
+
+    parts: List[str] = []
+    i = 0
+    while i < len(cps):
+        j = i
+        while j + 1 < len(cps) and cps[j + 1] == cps[j] + 1:
+            j += 1
+        lo, hi = re.escape(chr(cps[i])), re.escape(chr(cps[j]))
+        parts.append(lo if i == j else f"{lo}-{hi}")
+        i = j + 1
+    return "[" + "".join(parts) + "]"
+
+
+def _build_run_re(table: Dict[int, str]) -> Pattern[str]:
+    by_script: Dict[str, List[int]] = {}
+    for cp in sorted(table):
+        by_script.setdefault(table[cp], []).append(cp)
+    return re.compile(
+        "|".join(
+            f"(?P<{script}>{_char_class(cps)}+)" for script, cps in by_script.items()
+        )
+    )
+
+
+_SCRIPT_BY_CP = _build_table()
+# one alternative per script; each match is a maximal run, gaps are Common
+_RUN_RE = _build_run_re(_SCRIPT_BY_CP)
+
+
+def detect_script(ch: str) -> str:
+    """Return script label for a single character using Unicode ranges.
+    Returns: one of {"Latin","Cyrillic","Greek","Arabic","Hebrew","Common"}.
+    """
+
+    if not ch:
+        return "Common"
+    return _SCRIPT_BY_CP.get(ord(ch), "Common")
+
+
+def script_to_lang(script: str) -> str:
+    """Map script to lightweight language tag. Deterministic and total mapping."""
+
+    mapping = {
+        "Latin": "en",
+        "Cyrillic": "uk",
+        "Greek": "el",
+        "Arabic": "ar",
+        "Hebrew": "he",
+        "Common": "und",
+    }
+    return mapping[script]
+
+
+def segment_lang_script(text: str) -> List[Dict[str, object]]:
+    """Return list of segments [{start:int, end:int, lang:str, script:str}] for the whole text.
+    - start inclusive, end exclusive
+    - segments are contiguous and non-overlapping
+    - merges adjacent runs with same (lang, script)
+    - O(n): runs come from one regex scan and are merged in a single sweep
+    """
+
+    if not text:
+        return []
+
+    segments: List[Dict[str, object]] = []
+    # index of a lone " " segment directly after a Latin segment, if it is last
+    space_after_latin: Optional[int] = None
+
+    def _push(start: int, end: int, script: str) -> None:
+        nonlocal space_after_latin
+        last = segments[-1] if segments else None
+        if last is not None and last["script"] == "Latin" and script == "Common":
+            chunk = text[start:end]
+            if chunk == ".":
+                # absorb trailing single dot after Latin
+                last["end"] = end
+                return
+            if chunk == " ":
+                space_after_latin = len(segments)
+        elif script == "Latin" and space_after_latin == len(segments) - 1:
+            # merge Latin + single space + Latin
+            segments.pop()
+            segments[-1]["end"] = end
+            space_after_latin = None
+            return
+        segments.append(
+            {
+                "start": start,
+                "end": end,
+                "script": script,
+                "lang": script_to_lang(script),
+            }
+        )
+
+    pos = 0
+    for match in _RUN_RE.finditer(text):
+        start, end = match.span()
+        if start > pos:
+            _push(pos, start, "Common")
+        _push(start, end, match.lastgroup or "Common")
+        pos = end
+    if pos < len(text):
+        _push(pos, len(text), "Common")
+
+    return segments
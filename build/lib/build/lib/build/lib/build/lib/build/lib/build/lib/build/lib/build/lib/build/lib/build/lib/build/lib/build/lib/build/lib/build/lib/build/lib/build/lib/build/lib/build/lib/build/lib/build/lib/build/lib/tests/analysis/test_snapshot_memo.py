@@ -0,0 +1,27 @@
+from contract_review_app.analysis import extract_summary
+from contract_review_app.analysis.extract_summary import extract_document_snapshot
+
+TEXT = (
+    "NON-DISCLOSURE AGREEMENT\n"
+    "This Agreement is dated 1 March 2024 between Acme Ltd (the Disclosing Party) "
+    "and Beta plc (the Receiving Party).\n"
+    "This Agreement is governed by the laws of England and Wales.\n"
+)
+
+
+def test_snapshot_memoized_per_doc_uid(monkeypatch):
+    calls = []
+    build = extract_summary._build_snapshot
+    monkeypatch.setattr(
+        extract_summary, "_build_snapshot", lambda text: calls.append(text) or build(text)
+    )
+
+    first = extract_document_snapshot(TEXT, doc_uid="doc-memo-test")
+    first.hints.append("mutated")
+    second = extract_document_snapshot(TEXT, doc_uid="doc-memo-test")
+
+    assert len(calls) == 1
+    assert "mutated" not in second.hints
+    assert second.governing_law == "England and Wales"
+    assert [p.name for p in second.parties] == ["Acme Ltd", "Beta plc"]
+    assert second.dates["dated"] == "1 March 2024"
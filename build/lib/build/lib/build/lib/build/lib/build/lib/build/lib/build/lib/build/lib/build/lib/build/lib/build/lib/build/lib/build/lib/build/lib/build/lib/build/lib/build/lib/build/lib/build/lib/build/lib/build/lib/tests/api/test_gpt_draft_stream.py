@@ -0,0 +1,132 @@
+import asyncio
+import importlib
+import json
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from contract_review_app.api import app as app_module
+from contract_review_app.api.app import app
+from contract_review_app.api.models import SCHEMA_VERSION
+from contract_review_app.gpt.gpt_orchestrator import aguard_stream
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def _real_llm_service(monkeypatch):
+    # other API tests install a stub service module and reload the app
+    monkeypatch.setenv("API_KEY", "local-test-key-123")
+    monkeypatch.delitem(sys.modules, "contract_review_app.gpt.service", raising=False)
+    service = importlib.import_module("contract_review_app.gpt.service")
+    monkeypatch.setattr(app_module, "LLM_SERVICE", service.LLMService())
+
+
+def _headers() -> dict[str, str]:
+    return {"x-api-key": "local-test-key-123", "x-schema-version": SCHEMA_VERSION}
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    out = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        out.append((lines["event"], json.loads(lines["data"])))
+    return out
+
+
+def test_gpt_draft_stream_emits_deltas_then_done():
+    payload = {"text": "The Supplier shall deliver the Goods. Payment is due in 30 days."}
+    with client.stream("POST", "/api/gpt-draft/stream", json=payload, headers=_headers()) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert resp.headers["x-schema-version"] == SCHEMA_VERSION
+        body = "".join(resp.iter_text())
+    events = _events(body)
+    kinds = [k for k, _ in events]
+    assert kinds[-1] == "done"
+    assert kinds.count("delta") >= 2
+    done = events[-1][1]
+    assert done["status"] == "ok"
+    assert done["draft_text"].startswith("[MOCK DRAFT]")
+    assert "style_friendly" in done["guardrails"]["applied"]
+
+
+def test_gpt_draft_stream_rejects_empty_text():
+    resp = client.post("/api/gpt-draft/stream", json={"text": "  "}, headers=_headers())
+    assert resp.status_code == 422
+
+
+def _guard(tokens, **kwargs) -> list[dict]:
+    async def chunks():
+        for tok in tokens:
+            yield tok
+
+    async def run():
+        return [ev async for ev in aguard_stream(chunks(), **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_stream_guardrails_run_per_sentence():
+    events = _guard(
+        ["```The Supplier ", "shall deliver. ", "As an AI I cannot ", "advise. ", "Fees apply."],
+        mode="standard",
+    )
+    deltas = [e["text"] for e in events if e["event"] == "delta"]
+    assert deltas == ["The Supplier shall deliver.", " Fees apply."]
+    done = events[-1]
+    assert done["event"] == "done"
+    assert done["draft_text"] == "".join(deltas)
+    assert "strip_markdown" in done["guardrails"]["applied"]
+    assert "remove_disclaimer" in done["guardrails"]["applied"]
+
+
+def test_stream_done_matches_deltas_when_a_disclaimer_shares_the_line():
+    events = _guard(
+        ["Payment is due in 30 days. ", "As an AI, this is not legal advice. ", "Interest accrues daily."],
+        mode="standard",
+    )
+    deltas = [e["text"] for e in events if e["event"] == "delta"]
+    done = events[-1]
+    assert done["draft_text"] == "".join(deltas)
+    assert done["draft_text"].startswith("Payment is due in 30 days. Interest accrues daily.")
+    assert "not legal advice" not in done["draft_text"]
+
+
+def test_stream_guarded_away_entirely_has_no_placeholder():
+    events = _guard(["As an AI I cannot advise on this clause."], mode="standard")
+    assert [e["event"] for e in events] == ["done"]
+    assert events[0]["draft_text"] == ""
+
+
+def test_gpt_draft_stream_neutralizes_sources_not_cited(monkeypatch):
+    async def chunks():
+        yield "Data is processed under (Data Protection Act 2018 s.1). "
+        yield "See also (Regulation 2016/679)."
+
+    async def open_draft_stream(*args, **kwargs):
+        return chunks(), False
+
+    monkeypatch.setattr(app_module.LLM_SERVICE, "open_draft_stream", open_draft_stream)
+    payload = {
+        "text": "Personal data shall be processed lawfully and fairly.",
+        "citations": [{"instrument": "Data Protection Act 2018", "section": "s.1"}],
+    }
+    with client.stream("POST", "/api/gpt-draft/stream", json=payload, headers=_headers()) as resp:
+        body = "".join(resp.iter_text())
+    done = _events(body)[-1][1]
+    assert "(Data Protection Act 2018 s.1)" in done["draft_text"]
+    assert "Regulation 2016/679" not in done["draft_text"]
+    assert done["guardrails"]["removed_sources"] == ["(Regulation 2016/679)"]
+
+
+def test_gpt_draft_stream_reports_cache_outcome():
+    payload = {"text": "The Licensee shall pay royalties quarterly in arrears."}
+    seen = []
+    for _ in range(2):
+        with client.stream("POST", "/api/gpt-draft/stream", json=payload, headers=_headers()) as resp:
+            "".join(resp.iter_text())
+            seen.append(resp.headers["x-cache"])
+    assert seen == ["miss", "hit"]
@@ -0,0 +1,46 @@
+import json
+
+from contract_review_app.core.trace import TraceStore
+
+
+def _json_len(value: dict) -> int:
+    return len(json.dumps(value))
+
+
+def test_trace_store_weights_track_incremental_writes():
+    store = TraceStore(maxlen=10)
+
+    store.put("cid-1", {"path": "/api/analyze", "status": 200, "body": {"a": 1}})
+    store.add("cid-1", "features", {"segments": [{"id": i} for i in range(5)]})
+    store.add("cid-1", "features", {"segments": []})
+    store.add("cid-1", "coverage", {"ok": "ü"})
+    store.put("cid-1", {"meta": {"risk_threshold": "medium"}})
+
+    entry = store.get("cid-1")
+    assert entry == {
+        "path": "/api/analyze",
+        "status": 200,
+        "body": {"a": 1, "features": {"segments": []}, "coverage": {"ok": "ü"}},
+        "meta": {"risk_threshold": "medium"},
+    }
+    assert store._weights["cid-1"] == _json_len(entry)
+    assert store._total_weight == _json_len(entry)
+    assert store.get_field("cid-1", "meta") == {"risk_threshold": "medium"}
+
+
+def test_trace_store_compresses_large_values_and_trims_entries():
+    store = TraceStore(maxlen=10, max_entry_size_bytes=400, compress_min_bytes=64)
+    candidates = [{"rule_id": f"R{i}", "reasons": []} for i in range(50)]
+
+    store.put("cid-1", {"body": {"dispatch": {"candidates": candidates}}})
+
+    entry = store.get("cid-1")
+    kept = entry["body"]["dispatch"]["candidates"]
+    assert 0 < len(kept) < 50
+    assert kept == candidates[: len(kept)]
+    assert store._weights["cid-1"] == _json_len(entry) <= 400
+
+    stats = store.stats()
+    assert stats["compressed_values"] == 1
+    assert stats["stored_bytes"] < stats["bytes"]
+    assert stats["trims"] == 1
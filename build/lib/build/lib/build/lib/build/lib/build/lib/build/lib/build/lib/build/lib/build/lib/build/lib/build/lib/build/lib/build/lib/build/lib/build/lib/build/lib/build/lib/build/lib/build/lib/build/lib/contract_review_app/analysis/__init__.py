@@ -0,0 +1,27 @@
+"""Analysis helpers and exports."""
+
+from .labels_taxonomy import LABELS_CANON, resolve_labels
+
+from .extractors import (
+    extract_amounts,
+    extract_dates,
+    extract_durations,
+    extract_incoterms,
+    extract_jurisdiction,
+    extract_law,
+    extract_percentages,
+    extract_roles,
+)
+
+__all__ = [
+    "LABELS_CANON",
+    "resolve_labels",
+    "extract_amounts",
+    "extract_percentages",
+    "extract_durations",
+    "extract_dates",
+    "extract_law",
+    "extract_jurisdiction",
+    "extract_incoterms",
+    "extract_roles",
+]
@@ -0,0 +1,4 @@
+# init
+from .legal_rules import validate_clause, cross_check_clauses
+
+__all__ = ["validate_clause", "cross_check_clauses"]
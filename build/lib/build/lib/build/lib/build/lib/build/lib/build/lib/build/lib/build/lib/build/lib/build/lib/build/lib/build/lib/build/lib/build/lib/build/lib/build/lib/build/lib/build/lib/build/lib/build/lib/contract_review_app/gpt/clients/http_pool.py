@@ -0,0 +1,267 @@
+"""Shared, connection-pooled HTTP transport for the LLM provider clients.
+
+Every provider gets one long-lived :class:`httpx.Client` and one
+:class:`httpx.AsyncClient`, so calls reuse keep-alive connections instead of
+paying a TCP+TLS handshake per request.  HTTP/2 is negotiated when the
+optional ``h2`` package is installed.  Transient failures (connect errors,
+429 and retryable 5xx responses) are retried with jittered exponential
+backoff before the status is mapped onto the ``Provider*Error`` hierarchy.
+
+Tuning knobs (environment):
+
+* ``LLM_HTTP_MAX_CONNECTIONS`` – pool size per provider (default 20)
+* ``LLM_HTTP_MAX_KEEPALIVE`` – idle keep-alive connections kept (default 10)
+* ``LLM_HTTP_KEEPALIVE_S`` – idle connection expiry in seconds (default 30)
+* ``LLM_HTTP_RETRIES`` – retries after the first attempt (default 2)
+* ``LLM_HTTP_BACKOFF_MS`` – base backoff delay in milliseconds (default 200)
+* ``LLM_HTTP2`` – set to ``0`` to force HTTP/1.1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+from ..env import env_int
+from ..interfaces import (
+    ProviderAuthError,
+    ProviderConfigError,
+    ProviderError,
+    ProviderTimeoutError,
+    ProviderUnavailableError,
+)
+
+MAX_CONNECTIONS = env_int("LLM_HTTP_MAX_CONNECTIONS", 20)
+MAX_KEEPALIVE = env_int("LLM_HTTP_MAX_KEEPALIVE", 10)
+KEEPALIVE_EXPIRY_S = env_int("LLM_HTTP_KEEPALIVE_S", 30)
+RETRIES = env_int("LLM_HTTP_RETRIES", 2)
+BACKOFF_MS = env_int("LLM_HTTP_BACKOFF_MS", 200)
+HTTP2 = os.getenv("LLM_HTTP2", "1") != "0" and (
+    importlib.util.find_spec("h2") is not None
+)
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_SYNC: Dict[str, httpx.Client] = {}
+# async clients are bound to the event loop that created them
+_ASYNC: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+_LOCK = threading.Lock()
+# Optional transport override (tests / benchmarks point this at a fake server)
+_TRANSPORT: Optional[Any] = None
+_ASYNC_TRANSPORT: Optional[Any] = None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE,
+        keepalive_expiry=KEEPALIVE_EXPIRY_S,
+    )
+
+
+def set_transport(
+    transport: Optional[httpx.BaseTransport] = None,
+    async_transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> None:
+    """Route all pooled clients through ``transport``/``async_transport``.
+
+    Existing clients are dropped so the next call picks up the override.
+    Passing ``None`` restores the default network transport.
+    """
+
+    global _TRANSPORT, _ASYNC_TRANSPORT
+    with _LOCK:
+        _TRANSPORT = transport
+        _ASYNC_TRANSPORT = async_transport
+        for client in _SYNC.values():
+            client.close()
+        _SYNC.clear()
+        _ASYNC.clear()
+
+
+def get_client(provider: str) -> httpx.Client:
+    """Return the process-wide pooled sync client for ``provider``."""
+
+    client = _SYNC.get(provider)
+    if client is None:
+        with _LOCK:
+            client = _SYNC.get(provider)
+            if client is None:
+                kwargs: Dict[str, Any] = {"limits": _limits(), "http2": HTTP2}
+                if _TRANSPORT is not None:
+                    kwargs["transport"] = _TRANSPORT
+                client = httpx.Client(**kwargs)
+                _SYNC[provider] = client
+    return client
+
+
+def get_async_client(provider: str) -> httpx.AsyncClient:
+    """Return the pooled async client for ``provider`` on the running loop."""
+
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC.get(provider)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        with _LOCK:
+            entry = _ASYNC.get(provider)
+            if entry is None or entry[0] is not loop or entry[1].is_closed:
+                kwargs: Dict[str, Any] = {"limits": _limits(), "http2": HTTP2}
+                if _ASYNC_TRANSPORT is not None:
+                    kwargs["transport"] = _ASYNC_TRANSPORT
+                entry = (loop, httpx.AsyncClient(**kwargs))
+                _ASYNC[provider] = entry
+    return entry[1]
+
+
+def _backoff_s(attempt: int) -> float:
+    """Full-jitter exponential backoff for ``attempt`` (0-based)."""
+
+    cap = BACKOFF_MS * (2**attempt) / 1000.0
+    return random.uniform(0, cap)
+
+
+def _should_retry(resp: httpx.Response, attempt: int) -> bool:
+    return resp.status_code in _RETRY_STATUSES and attempt < RETRIES
+
+
+def _check(provider: str, resp: httpx.Response) -> Dict[str, Any]:
+    err: Optional[ProviderError] = None
+    if resp.status_code in (401, 403):
+        err = ProviderAuthError(provider, resp.text)
+    elif resp.status_code >= 400:
+        err = ProviderConfigError(provider, resp.text)
+    if err is not None:
+        err.status_code = resp.status_code  # type: ignore[attr-defined]
+        raise err
+    return resp.json()
+
+
+def post_json(
+    provider: str,
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Dict[str, Any]:
+    """POST ``payload`` through the pooled sync client with retries."""
+
+    client = get_client(provider)
+    attempt = 0
+    while True:
+        try:
+            resp = client.post(url, json=payload, headers=headers, timeout=timeout)
+        except httpx.TimeoutException:
+            raise ProviderTimeoutError(provider, timeout)
+        except httpx.TransportError as exc:
+            if attempt >= RETRIES:
+                raise ProviderUnavailableError(provider, str(exc)) from exc
+        else:
+            if not _should_retry(resp, attempt):
+                return _check(provider, resp)
+        time.sleep(_backoff_s(attempt))
+        attempt += 1
+
+
+async def apost_json(
+    provider: str,
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Dict[str, Any]:
+    """Async counterpart of :func:`post_json`; never blocks the event loop."""
+
+    client = get_async_client(provider)
+    attempt = 0
+    while True:
+        try:
+            resp = await client.post(
+                url, json=payload, headers=headers, timeout=timeout
+            )
+        except httpx.TimeoutException:
+            raise ProviderTimeoutError(provider, timeout)
+        except httpx.TransportError as exc:
+            if attempt >= RETRIES:
+                raise ProviderUnavailableError(provider, str(exc)) from exc
+        else:
+            if not _should_retry(resp, attempt):
+                return _check(provider, resp)
+        await asyncio.sleep(_backoff_s(attempt))
+        attempt += 1
+
+
+async def astream_events(
+    provider: str,
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+) -> AsyncIterator[str]:
+    """POST a streaming request and yield the ``data:`` field of each SSE event.
+
+    Retries apply only until the response headers arrive; once tokens have
+    been yielded a failure is surfaced to the caller instead of replayed.
+    """
+
+    client = get_async_client(provider)
+    attempt = 0
+    started = False
+    while True:
+        try:
+            async with client.stream(
+                "POST", url, json=payload, headers=headers, timeout=timeout
+            ) as resp:
+                if _should_retry(resp, attempt):
+                    await resp.aread()
+                else:
+                    if resp.status_code >= 400:
+                        await resp.aread()
+                        _check(provider, resp)
+                    async for line in resp.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            return
+                        started = True
+                        yield data
+                    return
+        except httpx.TimeoutException:
+            raise ProviderTimeoutError(provider, timeout)
+        except httpx.TransportError as exc:
+            if started or attempt >= RETRIES:
+                raise ProviderUnavailableError(provider, str(exc)) from exc
+        await asyncio.sleep(_backoff_s(attempt))
+        attempt += 1
+
+
+async def aclose_all() -> None:
+    """Close every pooled client; called from the API shutdown hook."""
+
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        sync_clients = list(_SYNC.values())
+        async_clients = [c for owner, c in _ASYNC.values() if owner is loop]
+        _SYNC.clear()
+        _ASYNC.clear()
+    for client in sync_clients:
+        client.close()
+    for aclient in async_clients:
+        await aclient.aclose()
+
+
+__all__ = [
+    "get_client",
+    "get_async_client",
+    "post_json",
+    "apost_json",
+    "astream_events",
+    "aclose_all",
+    "set_transport",
+]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List
+
+
+@dataclass
+class DraftResult:
+    text: str
+    meta: Dict[str, Any]
+
+
+@dataclass
+class SuggestResult:
+    items: List[Dict[str, Any]]
+    meta: Dict[str, Any]
+
+
+@dataclass
+class QAResult:
+    items: List[Dict[str, Any]]
+    meta: Dict[str, Any]
+
+
+class ProviderError(Exception):
+    def __init__(self, provider: str, detail: str):
+        super().__init__(detail)
+        self.provider = provider
+        self.detail = detail
+
+
+class ProviderTimeoutError(ProviderError):
+    def __init__(self, provider: str, timeout: float):
+        super().__init__(provider, f"{provider} timeout {timeout}s")
+        self.timeout = timeout
+
+
+class ProviderAuthError(ProviderError):
+    pass
+
+
+class ProviderConfigError(ProviderError):
+    pass
+
+
+class ProviderUnavailableError(ProviderError):
+    """Raised when a provider is temporarily unavailable."""
+    pass
+
+
+class BaseClient(ABC):
+    provider: str
+    model: str
+    mode: str
+
+    @abstractmethod
+    def draft(self, prompt: str, max_tokens: int, temperature: float, timeout: float) -> DraftResult:  # pragma: no cover - interface
+        ...
+
+    @abstractmethod
+    def suggest_edits(self, prompt: str, timeout: float) -> SuggestResult:  # pragma: no cover - interface
+        ...
+
+    @abstractmethod
+    def qa_recheck(self, prompt: str, timeout: float) -> QAResult:  # pragma: no cover - interface
+        ...
+
+    # Async variants. Live clients override these with a non-blocking
+    # implementation on the pooled transport; the defaults keep simple clients
+    # (mock, test doubles) usable from async endpoints via a worker thread.
+    async def adraft(self, prompt: str, max_tokens: int, temperature: float, timeout: float) -> DraftResult:
+        return await asyncio.to_thread(self.draft, prompt, max_tokens, temperature, timeout)
+
+    async def asuggest_edits(self, prompt: str, timeout: float) -> SuggestResult:
+        return await asyncio.to_thread(self.suggest_edits, prompt, timeout)
+
+    async def aqa_recheck(self, prompt: str, timeout: float) -> QAResult:
+        return await asyncio.to_thread(self.qa_recheck, prompt, timeout)
+
+    async def astream_draft(
+        self, prompt: str, max_tokens: int, temperature: float, timeout: float
+    ) -> AsyncIterator[str]:
+        """Yield the draft as text deltas; non-streaming clients yield it once."""
+        res = await self.adraft(prompt, max_tokens, temperature, timeout)
+        yield res.text
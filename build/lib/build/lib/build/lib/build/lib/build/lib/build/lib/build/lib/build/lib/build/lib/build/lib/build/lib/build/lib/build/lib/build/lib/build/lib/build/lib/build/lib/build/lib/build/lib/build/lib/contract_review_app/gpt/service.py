@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from contract_review_app.api.limits import LLM_TIMEOUT_S
+
+from .config import LLMConfig, load_llm_config
+from .interfaces import (
+    ProviderError,
+    ProviderTimeoutError,
+    ProviderUnavailableError,
+    ProviderAuthError,
+    ProviderConfigError,
+    BaseClient,
+    DraftResult,
+    SuggestResult,
+    QAResult,
+)
+from .clients.mock_client import MockClient
+from .response_cache import LLMResponseCache, cache_key, create_response_cache
+
+
+def _normalize_rules_ctx(rules_ctx):
+    if rules_ctx is None:
+        return {"rules": []}
+    if isinstance(rules_ctx, list):
+        return {"rules": rules_ctx}
+    return rules_ctx
+
+
+def get_client(provider: str, cfg: LLMConfig) -> BaseClient:
+    if provider == "openai" and cfg.valid:
+        from .clients.openai_client import OpenAIClient
+
+        return OpenAIClient(cfg)
+    if provider == "azure" and cfg.valid:
+        from .clients.azure_client import AzureClient
+
+        return AzureClient(cfg)
+    if provider == "anthropic" and cfg.valid:
+        from .clients.anthropic_client import AnthropicClient
+
+        return AnthropicClient(cfg)
+    if provider == "openrouter" and cfg.valid:
+        from .clients.openrouter_client import OpenRouterClient
+
+        return OpenRouterClient(cfg)
+    return MockClient(cfg.model_draft)
+
+
+class LLMService:
+    def __init__(
+        self,
+        cfg: Optional[LLMConfig] = None,
+        cache: Optional[LLMResponseCache] = None,
+    ):
+        self.cfg = cfg or load_llm_config()
+        self.client: BaseClient = get_client(self.cfg.provider, self.cfg)
+        self.cache = cache if cache is not None else create_response_cache()
+
+    def _key(self, kind: str, prompt: str, **params: Any) -> str:
+        return cache_key(self.client.provider, self.client.model, kind, prompt, params)
+
+    # prompt loading helpers
+    def _read_prompt(self, name: str) -> str:
+        import pkgutil
+
+        data = pkgutil.get_data("contract_review_app.gpt", f"prompts/{name}.txt")
+        if not data:
+            return ""
+        return data.decode("utf-8")
+
+    def _draft_args(
+        self,
+        text: str,
+        clause_type: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        timeout: Optional[float],
+    ) -> Tuple[str, int, float, float]:
+        prompt_tpl = self._read_prompt("draft")
+        prompt = prompt_tpl.format(
+            clause_type=clause_type or "clause",
+            style="formal",
+            jurisdiction="UK",
+            text=text,
+        )
+        max_t = max_tokens or self.cfg.max_tokens
+        temp = temperature if temperature is not None else self.cfg.temperature
+        to = timeout or self.cfg.timeout_s or LLM_TIMEOUT_S
+        return prompt, max_t, temp, to
+
+    def draft(
+        self,
+        text: str,
+        clause_type: Optional[str],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> DraftResult:
+        args = self._draft_args(text, clause_type, max_tokens, temperature, timeout)
+        key = self._key("draft", args[0], max_tokens=args[1], temperature=args[2])
+        return self.cache.call(key, "draft", lambda: self.client.draft(*args))
+
+    async def adraft(
+        self,
+        text: str,
+        clause_type: Optional[str],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> DraftResult:
+        args = self._draft_args(text, clause_type, max_tokens, temperature, timeout)
+        key = self._key("draft", args[0], max_tokens=args[1], temperature=args[2])
+        return await self.cache.acall(key, "draft", lambda: self.client.adraft(*args))
+
+    async def adraft_prompt(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> DraftResult:
+        """Draft from a ready-made prompt (e.g. a multi-clause batch), cached."""
+        max_t = max_tokens or self.cfg.max_tokens
+        temp = temperature if temperature is not None else self.cfg.temperature
+        to = timeout or self.cfg.timeout_s or LLM_TIMEOUT_S
+        key = self._key("draft", prompt, max_tokens=max_t, temperature=temp)
+        return await self.cache.acall(
+            key, "draft", lambda: self.client.adraft(prompt, max_t, temp, to)
+        )
+
+    async def astream_draft(
+        self,
+        text: str,
+        clause_type: Optional[str],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """Stream draft text deltas; a cached draft is replayed as one delta."""
+        args = self._draft_args(text, clause_type, max_tokens, temperature, timeout)
+        key = self._key("draft", args[0], max_tokens=args[1], temperature=args[2])
+        cached = self.cache.get(key) if self.cache.enabled else None
+        if cached is not None:
+            yield cached.text
+            return
+        parts = []
+        async for chunk in self.client.astream_draft(*args):
+            parts.append(chunk)
+            yield chunk
+        meta = {
+            "provider": self.client.provider,
+            "model": self.client.model,
+            "mode": self.client.mode,
+        }
+        self.cache.set(key, DraftResult(text="".join(parts), meta=meta), "draft")
+
+    def _suggest_args(
+        self, text: str, risk_level: str, timeout: Optional[float]
+    ) -> Tuple[str, float]:
+        prompt_tpl = self._read_prompt("suggest")
+        prompt = prompt_tpl.format(text=text, risk=risk_level)
+        to = timeout or self.cfg.timeout_s or LLM_TIMEOUT_S
+        return prompt, to
+
+    def suggest(
+        self, text: str, risk_level: str, timeout: Optional[float] = None
+    ) -> SuggestResult:
+        args = self._suggest_args(text, risk_level, timeout)
+        key = self._key("suggest", args[0])
+        return self.cache.call(key, "suggest", lambda: self.client.suggest_edits(*args))
+
+    async def asuggest(
+        self, text: str, risk_level: str, timeout: Optional[float] = None
+    ) -> SuggestResult:
+        args = self._suggest_args(text, risk_level, timeout)
+        key = self._key("suggest", args[0])
+        return await self.cache.acall(
+            key, "suggest", lambda: self.client.asuggest_edits(*args)
+        )
+
+    def _safe_format_prompt(self, tpl: str, **kw: Any) -> str:
+        formatter = Formatter()
+        fields: Set[str] = {fname for _, fname, _, _ in formatter.parse(tpl) if fname}
+        allowed = {"text", "rules"}
+        unknown = fields - allowed
+        if unknown:
+            raise ValueError(
+                f"qa_prompt_invalid: unknown placeholders={','.join(sorted(unknown))}"
+            )
+        return tpl.format(**{k: kw.get(k, "") for k in allowed})
+
+    def _qa_args(
+        self, text: str, rules_context, timeout_s: float, profile: str
+    ) -> Tuple[str, float]:
+        rules_context = _normalize_rules_ctx(rules_context)
+        if profile == "smart" and not rules_context:
+            raise ValueError("qa_prompt_invalid: missing rules context")
+        prompt_tpl = self._read_prompt("qa")
+        safe_rules = []
+        for r in rules_context.get("rules", []):
+            safe_rules.append(
+                {
+                    "id": str(r.get("id", "")),
+                    "status": str(r.get("status", "")).lower(),
+                    "note": r.get("note", ""),
+                }
+            )
+        rules_ctx = {"rules": safe_rules}
+        prompt = self._safe_format_prompt(prompt_tpl, text=text, rules=rules_ctx)
+        to = timeout_s or self.cfg.timeout_s or LLM_TIMEOUT_S
+        return prompt, to
+
+    def qa(
+        self,
+        text: str,
+        rules_context=None,
+        timeout_s: float = 30,
+        profile: str = "vanilla",
+    ) -> QAResult:
+        args = self._qa_args(text, rules_context, timeout_s, profile)
+        key = self._key("qa", args[0])
+        result = self.cache.call(key, "qa", lambda: self.client.qa_recheck(*args))
+        result.meta["profile"] = profile
+        return result
+
+    async def aqa(
+        self,
+        text: str,
+        rules_context=None,
+        timeout_s: float = 30,
+        profile: str = "vanilla",
+    ) -> QAResult:
+        args = self._qa_args(text, rules_context, timeout_s, profile)
+        key = self._key("qa", args[0])
+        result = await self.cache.acall(key, "qa", lambda: self.client.aqa_recheck(*args))
+        result.meta["profile"] = profile
+        return result
+
+
+def create_llm_service() -> LLMService:
+    cfg = load_llm_config()
+    return LLMService(cfg)
+
+
+__all__ = [
+    "LLMService",
+    "LLMResponseCache",
+    "load_llm_config",
+    "create_llm_service",
+    "ProviderError",
+    "ProviderTimeoutError",
+    "ProviderUnavailableError",
+    "ProviderAuthError",
+    "ProviderConfigError",
+    "BaseClient",
+    "DraftResult",
+    "SuggestResult",
+    "QAResult",
+]
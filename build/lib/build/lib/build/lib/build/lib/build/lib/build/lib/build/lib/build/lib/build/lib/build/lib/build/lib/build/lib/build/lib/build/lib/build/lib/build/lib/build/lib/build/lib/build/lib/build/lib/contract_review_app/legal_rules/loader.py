@@ -0,0 +1,999 @@
+# contract_review_app/legal_rules/loader.py
+"""YAML rule loader for policy and core rule packs."""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError, field_validator, conint
+
+# Новая нормализация при intake: кавычки/дефисы -> ASCII, сжатие пробелов, сохранение \n
+from ..intake.normalization import normalize_for_intake
+from . import snapshot
+
+log = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+# ---------------------------------------------------------------------------
+# Rule roots and extension filter
+# ---------------------------------------------------------------------------
+
+RULE_ROOTS = [
+    "contract_review_app/legal_rules",
+    "core/rules",
+]
+ALLOWED_RULE_EXTS = {".yml", ".yaml"}
+
+# Global meta information used by tests/diagnostics
+meta: Dict[str, Any] = {"debug": {}}
+
+# Priority mapping for packs defined in core/rules/registry.yml
+REGISTRY_FILE = ROOT_DIR / "core/rules" / "registry.yml"
+BASELINE_FILE = Path(__file__).resolve().with_name("baseline_patterns.yaml")
+PACK_PRIORITIES: Dict[str, int] = {}
+if REGISTRY_FILE.exists():
+    try:
+        _reg_data = yaml.safe_load(REGISTRY_FILE.read_text(encoding="utf-8")) or {}
+        for _doc, juris in _reg_data.items():
+            for _juris, packs in (juris or {}).items():
+                for idx, p in enumerate(packs or []):
+                    PACK_PRIORITIES.setdefault(str(p), idx)
+    except Exception:  # pragma: no cover
+        PACK_PRIORITIES = {}
+
+_ENV_DIRS = os.getenv("RULE_PACKS_DIRS")
+if _ENV_DIRS:
+    RULE_ROOTS = [p.strip() for p in _ENV_DIRS.split(os.pathsep) if p.strip()]
+
+
+def _resolve_root(p: str | Path) -> Path:
+    path = Path(p)
+    if not path.is_absolute():
+        path = ROOT_DIR / path
+    return path
+
+
+_RULES: List[Dict[str, Any]] = []
+_PACKS: List[Dict[str, Any]] = []
+CANDIDATES_VAR: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar(
+    "candidate_rule_ids", default=None
+)
+
+
+@dataclass
+class RuleMeta:
+    path: str
+    sha256: str
+    title: Optional[str] = None
+    pack: Optional[str] = None
+    priority: int = 0
+
+
+PICKED: Dict[str, Tuple[int, RuleMeta, int]] = {}
+SHADOWED: Dict[str, List[RuleMeta]] = {}
+# rules of one pack file as (spec, meta) pairs; None when the YAML is unreadable
+_ParsedPack = Optional[List[Tuple[Dict[str, Any], RuleMeta]]]
+
+# ---------------------------------------------------------------------------
+# Coverage flags (bitmask)
+# ---------------------------------------------------------------------------
+SCHEMA_MISMATCH = 1 << 0
+DOC_TYPE_MISMATCH = 1 << 1
+JURISDICTION_MISMATCH = 1 << 2
+NO_CLAUSE = 1 << 3
+REGEX_MISS = 1 << 4
+WHEN_FALSE = 1 << 5
+TEXT_NORMALIZATION_ISSUE = 1 << 6
+FIRED = 1 << 7
+SEGMENT_LABEL_MISMATCH = 1 << 8
+SEGMENT_KIND_MISMATCH = 1 << 9
+
+
+def _compile(patterns: Iterable[str]) -> List[re.Pattern[str]]:
+    """Compile regex patterns with IGNORECASE|MULTILINE by default (inline flags respected)."""
+    return [re.compile(p, re.I | re.MULTILINE) for p in patterns if p]
+
+
+def _normalize_str_list(values: Any) -> List[str]:
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    result: List[str] = []
+    for item in values:
+        if item is None:
+            continue
+        text = str(item).strip().lower()
+        if not text:
+            continue
+        if text not in result:
+            result.append(text)
+    return result
+
+
+class AppliesToSchema(BaseModel):
+    labels: List[str] = Field(default_factory=list)
+    segment_kind: List[str] = Field(default_factory=list)
+
+
+class RuleSchema(BaseModel):
+    """Pydantic model validating the unified rule specification."""
+
+    rule_id: str = Field(alias="id")
+    doc_types: List[str] = Field(default_factory=list)
+    jurisdiction: List[str] = Field(default_factory=list)
+    severity: str = Field(default="medium")
+    triggers: Dict[str, List[str]] = Field(default_factory=dict)
+    requires_clause: List[str] = Field(default_factory=list)
+    advice: Optional[str] = None
+    law_refs: List[Any] = Field(default_factory=list)
+    deprecated: bool = False
+    always_on: bool = False
+    generic: bool = False
+    applies_to: Optional[AppliesToSchema] = None
+    channel: Optional[Literal["presence", "substantive", "policy", "drafting", "fixup"]] = None
+    salience: Optional[conint(ge=0, le=100)] = 50
+
+    @field_validator("severity")
+    @classmethod
+    def _severity_valid(cls, v: str) -> str:
+        val = str(v or "").lower()
+        if val not in {"high", "medium", "low"}:
+            raise ValueError("invalid severity")
+        return val
+
+
+def _pack_files(base_dirs: Iterable[Path]) -> List[Path]:
+    """Rule pack files under ``base_dirs`` in load order."""
+
+    skip = {REGISTRY_FILE.resolve(), BASELINE_FILE.resolve()}
+    files: List[Path] = []
+    for base in base_dirs:
+        if not base.exists():
+            continue
+
+        paths = sorted(p for p in base.rglob("*") if p.is_file())
+        for path in paths:
+            if any(part == ".venv" for part in path.parts):
+                continue
+            if "_legacy_disabled" in path.parts:
+                continue
+            if path.suffix.lower() not in ALLOWED_RULE_EXTS:
+                continue
+            if path.resolve() in skip:
+                continue
+            if path.name == "coverage_map.yaml":
+                continue
+            files.append(path)
+    return files
+
+
+def _parse_pack(path: Path, file_sha: str) -> _ParsedPack:
+    """Parse one pack file into ``(spec, meta)`` pairs (``None`` if unreadable)."""
+
+    try:
+        docs = list(yaml.safe_load_all(path.read_text(encoding="utf-8")))
+    except Exception as exc:  # pragma: no cover
+        log.error("Failed to load %s: %s", path, exc)
+        return None
+
+    # Pack identifier and priority
+    try:
+        pack_rel_core = path.relative_to(ROOT_DIR / "core/rules")
+        pack_id = pack_rel_core.parent.as_posix()
+    except ValueError:
+        try:
+            pack_id = path.parent.relative_to(ROOT_DIR).as_posix()
+        except ValueError:  # pragma: no cover
+            pack_id = path.parent.as_posix()
+    priority = PACK_PRIORITIES.get(pack_id, 10_000)
+
+    entries: List[Tuple[Dict[str, Any], RuleMeta]] = []
+    for data in docs:
+        if not data:
+            continue
+
+        if isinstance(data, dict) and data.get("rule"):
+            rules_iter: List[Dict[str, Any]] = [data["rule"]]
+        elif isinstance(data, dict) and data.get("rules"):
+            rules_iter = list(data.get("rules") or [])
+        elif isinstance(data, dict):
+            rules_iter = [data]
+        elif isinstance(data, list):
+            rules_iter = list(data)
+        else:
+            rules_iter = []
+
+        for raw in rules_iter:
+            rid = raw.get("rule_id") or raw.get("id")
+            if not rid:
+                log.warning("Rule without rule_id: %s", path)
+                continue
+
+            # Собираем «плоский» список pat'ов из triggers.{any,all,regex}/patterns
+            pats: List[str] = []
+            trig_any = raw.get("triggers", {}).get("any", []) or []
+            trig_all = raw.get("triggers", {}).get("all", []) or []
+            trig_regex = raw.get("triggers", {}).get("regex", []) or []
+
+            if raw.get("patterns"):
+                pats = list(raw.get("patterns", []))
+            else:
+
+                def _pull(xs):
+                    for c in xs:
+                        yield c.get("regex") if isinstance(c, dict) else c
+
+                pats.extend([p for p in _pull(trig_any) if p])
+                pats.extend([p for p in _pull(trig_all) if p])
+                pats.extend([p for p in _pull(trig_regex) if p])
+
+            finding_section = raw.get("finding")
+            if not finding_section:
+                checks = raw.get("checks") or []
+                if isinstance(checks, list):
+                    for chk in checks:
+                        if isinstance(chk, dict) and chk.get("finding"):
+                            finding_section = chk.get("finding")
+                            break
+
+            compiled_patterns = _compile(pats)
+
+            trig_map: Dict[str, List[re.Pattern[str]]] = {}
+            if trig_any:
+                trig_map["any"] = _compile(
+                    [
+                        (c.get("regex") if isinstance(c, dict) else c)
+                        for c in trig_any
+                    ]
+                )
+            if trig_all:
+                trig_map["all"] = _compile(
+                    [
+                        (c.get("regex") if isinstance(c, dict) else c)
+                        for c in trig_all
+                    ]
+                )
+            if trig_regex or raw.get("patterns"):
+                trig_map["regex"] = _compile(
+                    [
+                        (c.get("regex") if isinstance(c, dict) else c)
+                        for c in (trig_regex or raw.get("patterns", []))
+                    ]
+                )
+
+            doc_types = list(
+                raw.get("doc_types")
+                or (raw.get("scope", {}) or {}).get("doc_types")
+                or []
+            )
+            if doc_types:
+                dt_lc = [str(d).lower() for d in doc_types]
+                if "any" in dt_lc and len(dt_lc) > 1:
+                    log.warning(
+                        "Rule %s mixes 'Any' with specific doc_types %s",
+                        rid,
+                        doc_types,
+                    )
+            jurisdiction = list(
+                raw.get("jurisdiction")
+                or (raw.get("scope", {}) or {}).get("jurisdiction")
+                or []
+            )
+            requires_clause = list(
+                raw.get("requires_clause")
+                or (raw.get("scope", {}) or {}).get("clauses")
+                or []
+            )
+            deprecated = bool(raw.get("deprecated"))
+
+            try:
+                pack_rel = str(path.relative_to(ROOT_DIR))
+            except ValueError:  # pragma: no cover
+                pack_rel = str(path)
+
+            title_val = raw.get("Title") or raw.get("title")
+            applies_to_raw = raw.get("applies_to") or {}
+            applies_to_spec: Dict[str, List[str]] = {}
+            if isinstance(applies_to_raw, dict):
+                labels_norm = _normalize_str_list(
+                    applies_to_raw.get("labels")
+                )
+                kinds_norm = _normalize_str_list(
+                    applies_to_raw.get("segment_kind")
+                )
+                if labels_norm:
+                    applies_to_spec["labels"] = labels_norm
+                if kinds_norm:
+                    applies_to_spec["segment_kind"] = kinds_norm
+
+            channel = raw.get("channel")
+            salience = raw.get("salience")
+            if salience is None:
+                salience = 50
+
+            spec = {
+                "id": rid,
+                "rule_id": rid,
+                "Title": raw.get("Title"),
+                "title": title_val,
+                "clause_type": raw.get("clause_type")
+                or (raw.get("scope", {}) or {}).get("clauses", [None])[0],
+                "severity": str(
+                    raw.get("severity")
+                    or raw.get("risk")
+                    or raw.get("severity_level")
+                    or "medium"
+                ).lower(),
+                "patterns": compiled_patterns,
+                "advice": raw.get("advice")
+                or raw.get("intent")
+                or (finding_section or {}).get("suggestion", {}).get("text")
+                or (finding_section or {}).get("message"),
+                "law_refs": list(
+                    raw.get("law_reference")
+                    or raw.get("law_refs")
+                    or (finding_section or {}).get("legal_basis")
+                    or []
+                ),
+                "suggestion": (finding_section or {}).get("suggestion"),
+                "conflict_with": list(raw.get("conflict_with") or []),
+                "ops": raw.get("ops") or [],
+                "pack": pack_rel,
+                "triggers": trig_map,
+                "requires_clause_hit": bool(raw.get("requires_clause_hit")),
+                "doc_types": doc_types,
+                "jurisdiction": jurisdiction,
+                "requires_clause": requires_clause,
+                "deprecated": deprecated,
+                "always_on": bool(raw.get("always_on")),
+                "generic": bool(raw.get("generic")),
+                "channel": channel,
+                "salience": salience,
+            }
+            if applies_to_spec:
+                spec["applies_to"] = applies_to_spec
+
+            # Валидация схемы правила (но не прерываем загрузку)
+            try:
+                RuleSchema.model_validate(
+                    {
+                        "id": spec["id"],
+                        "doc_types": doc_types,
+                        "jurisdiction": jurisdiction,
+                        "severity": spec["severity"],
+                        "triggers": {
+                            k: [p.pattern for p in trig_map.get(k, [])]
+                            for k in trig_map.keys()
+                        },
+                        "requires_clause": requires_clause,
+                        "advice": spec["advice"],
+                        "law_refs": spec["law_refs"],
+                        "deprecated": deprecated,
+                        "always_on": spec["always_on"],
+                        "generic": spec["generic"],
+                        "applies_to": applies_to_spec,
+                        "channel": channel,
+                        "salience": salience,
+                    }
+                )
+            except ValidationError:
+                pass
+
+            meta_obj = RuleMeta(
+                path=str(path),
+                sha256=file_sha,
+                title=title_val,
+                pack=pack_id,
+                priority=priority,
+            )
+            entries.append((spec, meta_obj))
+    return entries
+
+
+def _merge_packs(
+    files: List[Path], parsed: Dict[Path, _ParsedPack]
+) -> Tuple[
+    List[Dict[str, Any]],
+    List[Dict[str, Any]],
+    Dict[str, Tuple[int, RuleMeta, int]],
+    Dict[str, List[RuleMeta]],
+]:
+    """Combine parsed packs into the rule list, resolving ids by pack priority."""
+
+    rules: List[Dict[str, Any]] = []
+    packs: List[Dict[str, Any]] = []
+    picked: Dict[str, Tuple[int, RuleMeta, int]] = {}
+    shadowed: Dict[str, List[RuleMeta]] = {}
+    for path in files:
+        entries = parsed.get(path)
+        if entries is None:
+            continue
+        rule_count = 0
+        for spec, meta_obj in entries:
+            rid = spec.get("id")
+            priority = meta_obj.priority
+            prev = picked.get(rid)
+            if prev is not None:
+                prev_pri, prev_meta, idx = prev
+                if priority < prev_pri:
+                    shadowed.setdefault(rid, []).append(prev_meta)
+                    picked[rid] = (priority, meta_obj, idx)
+                    rules[idx] = spec
+                else:
+                    shadowed.setdefault(rid, []).append(meta_obj)
+                continue
+            picked[rid] = (priority, meta_obj, len(rules))
+            rules.append(spec)
+            rule_count += 1
+
+        try:
+            rel = path.relative_to(ROOT_DIR)
+        except ValueError:  # pragma: no cover
+            rel = path
+        packs.append({"path": str(rel), "rule_count": rule_count})
+
+    # Remove deprecated and duplicate rules by id
+    uniq: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    for r in rules:
+        rid = r.get("id") or r.get("rule_id")
+        if r.get("deprecated"):
+            continue
+        if rid in seen:
+            continue
+        seen.add(rid)
+        uniq.append(r)
+    return uniq, packs, picked, shadowed
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """One immutable version of the loaded rule base."""
+
+    version: int
+    fingerprint: Optional[str]
+    rules: List[Dict[str, Any]]
+    packs: List[Dict[str, Any]]
+    picked: Dict[str, Tuple[int, RuleMeta, int]]
+    shadowed: Dict[str, List[RuleMeta]]
+    base_dirs: Tuple[Path, ...] = ()
+    # loaded from the configured roots, i.e. backed by the on-disk snapshot
+    persistent: bool = False
+
+
+# parsed packs by path, reused while the file's SHA-256 is unchanged
+_PARSED: Dict[Path, Tuple[str, _ParsedPack]] = {}
+# (st_mtime_ns, st_size, sha256) of pack files seen by the last load/reload
+_FILE_STATS: Dict[Path, Tuple[int, int, str]] = {}
+_LOADER_SOURCE = Path(__file__).read_bytes()
+_ACTIVE = RuleSet(0, None, _RULES, _PACKS, PICKED, SHADOWED)
+_LOADED = False
+_LOAD_LOCK = threading.RLock()
+_RELOAD_HOOKS: List[Callable[[RuleSet], None]] = []
+PINNED_RULE_SET: contextvars.ContextVar[Optional[RuleSet]] = contextvars.ContextVar(
+    "pinned_rule_set", default=None
+)
+
+
+def _fingerprint(files: List[Path], digests: Dict[Path, str]) -> str:
+    return snapshot.digest(
+        _LOADER_SOURCE,
+        repr(sorted(PACK_PRIORITIES.items())),
+        *(f"{path}\0{digests[path]}" for path in files),
+    )
+
+
+def _parsed_packs(
+    files: List[Path], digests: Dict[Path, str], keep_broken: bool = False
+) -> Dict[Path, _ParsedPack]:
+    """Parsed form of ``files``; only files whose digest changed are parsed.
+
+    With ``keep_broken`` a pack that no longer parses keeps its previous
+    rules instead of disappearing.
+    """
+
+    parsed: Dict[Path, _ParsedPack] = {}
+    for path in files:
+        cached = _PARSED.get(path)
+        if cached is None or cached[0] != digests[path]:
+            entries = _parse_pack(path, digests[path])
+            if entries is None and keep_broken and cached is not None:
+                entries = cached[1]
+            cached = (digests[path], entries)
+            _PARSED[path] = cached
+        parsed[path] = cached[1]
+    return parsed
+
+
+def _install(
+    files: List[Path],
+    parsed: Dict[Path, _ParsedPack],
+    fingerprint: str,
+    base_dirs: List[Path],
+) -> RuleSet:
+    """Merge ``parsed`` and make it the active rule set in one swap."""
+
+    global _ACTIVE, _RULES, _PACKS, PICKED, SHADOWED, _LOADED
+    rules, packs, picked, shadowed = _merge_packs(files, parsed)
+    rule_set = RuleSet(
+        version=_ACTIVE.version + 1,
+        fingerprint=fingerprint,
+        rules=rules,
+        packs=packs,
+        picked=picked,
+        shadowed=shadowed,
+        base_dirs=tuple(base_dirs),
+        persistent=base_dirs == [_resolve_root(p) for p in RULE_ROOTS],
+    )
+    # readers pick up either the previous or the new lists, never a mix
+    _RULES, _PACKS, PICKED, SHADOWED = rules, packs, picked, shadowed
+    _ACTIVE = rule_set
+    _LOADED = True
+
+    if SHADOWED:
+        ids = list(SHADOWED.keys())
+        log.warning(
+            "Shadowed %d rule ids: %s",
+            len(ids),
+            ", ".join(ids[:20]),
+        )
+    meta.setdefault("debug", {})
+    meta["debug"]["duplicates"] = {
+        rid: [m.path for m in metas] for rid, metas in SHADOWED.items()
+    }
+    return rule_set
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_rule_packs(roots: Iterable[str | Path] | None = None) -> None:
+    """Load YAML rule packs from configured directories with deduplication.
+
+    Packs are parsed at most once per content digest.  For the configured
+    roots the parsed packs are also persisted as an on-disk snapshot (see
+    :mod:`.snapshot`) keyed by a fingerprint of all pack paths and digests,
+    so other workers load it instead of parsing YAML.
+    """
+    with _LOAD_LOCK:
+        base_dirs = [_resolve_root(p) for p in (roots or RULE_ROOTS)]
+        files = _pack_files(base_dirs)
+        digests: Dict[Path, str] = {}
+        for path in files:
+            digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            mtime_ns, size = _stat_key(path)
+            _FILE_STATS[path] = (mtime_ns, size, digests[path])
+
+        persist = base_dirs == [_resolve_root(p) for p in RULE_ROOTS]
+        fingerprint = _fingerprint(files, digests)
+        missing = any(_PARSED.get(path, ("",))[0] != digests[path] for path in files)
+        if persist and missing:
+            stored = snapshot.load("rules", fingerprint)
+            if stored is not None:
+                _PARSED.update((Path(p), entry) for p, entry in stored.items())
+                missing = False
+        parsed = _parsed_packs(files, digests)
+        if persist and missing:
+            snapshot.store(
+                "rules", fingerprint, {str(path): _PARSED[path] for path in files}
+            )
+        _install(files, parsed, fingerprint, base_dirs)
+
+
+def reload_changed_packs() -> bool:
+    """Re-parse the packs that changed since the last load and swap them in.
+
+    Files are compared by ``(mtime, size)`` first and by SHA-256 only when
+    those differ, so an unchanged pack set costs a directory scan.  Returns
+    ``True`` when a new rule set version was installed.
+    """
+    _ensure_loaded()
+    with _LOAD_LOCK:
+        base_dirs = list(_ACTIVE.base_dirs) or [_resolve_root(p) for p in RULE_ROOTS]
+        files = _pack_files(base_dirs)
+        digests: Dict[Path, str] = {}
+        for path in files:
+            try:
+                key = _stat_key(path)
+            except OSError:
+                continue
+            known = _FILE_STATS.get(path)
+            if known is not None and known[:2] == key:
+                digests[path] = known[2]
+                continue
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            _FILE_STATS[path] = (key[0], key[1], digest)
+            digests[path] = digest
+        files = [path for path in files if path in digests]
+        fingerprint = _fingerprint(files, digests)
+        if fingerprint == _ACTIVE.fingerprint:
+            return False
+        parsed = _parsed_packs(files, digests, keep_broken=True)
+        rule_set = _install(files, parsed, fingerprint, base_dirs)
+        if rule_set.persistent:
+            snapshot.store(
+                "rules", fingerprint, {str(path): _PARSED[path] for path in files}
+            )
+    log.info("Reloaded rule packs: version %d", rule_set.version)
+    for hook in list(_RELOAD_HOOKS):
+        try:
+            hook(rule_set)
+        except Exception:  # pragma: no cover - hooks only warm caches
+            log.exception("Rule reload hook failed")
+    return True
+
+
+def add_reload_hook(hook: Callable[[RuleSet], None]) -> None:
+    """Call ``hook`` with each rule set installed by :func:`reload_changed_packs`."""
+    _RELOAD_HOOKS.append(hook)
+
+
+class PackWatcher:
+    """Background thread that hot-reloads changed packs every ``interval_s``."""
+
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="rule-pack-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                reload_changed_packs()
+            except Exception:
+                log.exception("Rule pack reload failed")
+
+
+def active_rule_set() -> RuleSet:
+    """The rule set pinned for the current request, else the latest one."""
+    _ensure_loaded()
+    return PINNED_RULE_SET.get() or _ACTIVE
+
+
+def rules_version() -> int:
+    return active_rule_set().version
+
+
+@contextmanager
+def pinned_rule_set() -> Iterator[RuleSet]:
+    """Evaluate everything in the block against one rule set version."""
+    rule_set = active_rule_set()
+    token = PINNED_RULE_SET.set(rule_set)
+    try:
+        yield rule_set
+    finally:
+        PINNED_RULE_SET.reset(token)
+
+
+def _rules() -> List[Dict[str, Any]]:
+    pinned = PINNED_RULE_SET.get()
+    if pinned is not None and pinned is not _ACTIVE:
+        return pinned.rules
+    return _RULES
+
+
+def _ensure_loaded() -> None:
+    """Load the configured packs on first use.
+
+    Rules placed into ``_RULES`` directly (tests, tools) are left alone.
+    """
+    if _LOADED or _RULES:
+        return
+    with _LOAD_LOCK:
+        if not _LOADED and not _RULES:
+            load_rule_packs()
+
+
+# ---------------------------------------------------------------------------
+# Public helpers
+# ---------------------------------------------------------------------------
+
+
+def rules_count() -> int:
+    _ensure_loaded()
+    return len(_RULES)
+
+
+def loaded_packs() -> List[Dict[str, Any]]:
+    _ensure_loaded()
+    return list(_PACKS)
+
+
+def rules_fingerprint() -> Optional[str]:
+    """Content fingerprint of the currently loaded rule base."""
+    return active_rule_set().fingerprint
+
+
+def load_rules(base_dir: Path | None = None) -> List[Dict[str, Any]]:
+    """Convenience wrapper returning loaded rules.
+
+    If *base_dir* is provided, rules are loaded only from that directory for
+    the duration of the call.
+    """
+    roots = [base_dir] if base_dir is not None else RULE_ROOTS
+    load_rule_packs(roots)
+    return list(_RULES)
+
+
+def filter_rules(
+    text: str,
+    doc_type: str,
+    clause_types: Iterable[str],
+    jurisdiction: Optional[str] = None,
+    segment_labels: Optional[Set[str]] = None,
+    segment_kind: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Return (matched_rules, coverage).
+
+    matched_rules: [{ "rule": <rule>, "matches": [evidence...] }]
+    coverage: [{ "doc_type": ..., "jurisdiction": ..., "pack_id": ..., "rule_id": ...,
+                 "severity": ..., "evidence": [...], "spans": [{"start":..,"end":..}],
+                 "flags": <bitmask> }]
+    """
+    _ensure_loaded()
+    # Нормализация входа с сохранением \n; ошибки — в флаг
+    flags_norm = 0
+    try:
+        norm = normalize_for_intake(text or "")
+    except Exception:
+        norm = text or ""
+        flags_norm = TEXT_NORMALIZATION_ISSUE
+
+    doc_type_lc = (doc_type or "").lower()
+    juris_lc = (jurisdiction or "").lower()
+    clause_set: Set[str] = {c.lower() for c in (clause_types or [])}
+
+    filtered: List[Dict[str, Any]] = []
+    coverage: List[Dict[str, Any]] = []
+
+    segment_labels_lc: Optional[Set[str]] = None
+    if segment_labels is not None:
+        segment_labels_lc = {
+            str(lbl).strip().lower() for lbl in segment_labels if str(lbl).strip()
+        }
+    segment_kind_lc = str(segment_kind).strip().lower() if segment_kind else ""
+
+    candidate_ids = CANDIDATES_VAR.get()
+    candidate_active = bool(candidate_ids)
+    candidate_set: Set[str] = set(candidate_ids or [])
+
+    for rule in _rules():
+        rule_id = str(rule.get("id") or rule.get("rule_id") or "")
+        if candidate_active and rule_id not in candidate_set:
+            continue
+        rule_flags = flags_norm
+        matches: List[str] = []
+        spans: List[Dict[str, int]] = []
+
+        always_on = bool(rule.get("always_on"))
+        is_generic = bool(rule.get("generic"))
+        skip_scope_checks = always_on or is_generic
+
+        # Gate: doc_type
+        rule_doc_types = [d.lower() for d in rule.get("doc_types", [])]
+        if doc_type_lc and not skip_scope_checks:
+            if rule_doc_types and "any" not in rule_doc_types:
+                if doc_type_lc not in rule_doc_types:
+                    rule_flags |= DOC_TYPE_MISMATCH
+
+        # Gate: jurisdiction
+        rule_juris = [j.lower() for j in rule.get("jurisdiction", [])]
+        if juris_lc and not skip_scope_checks:
+            if rule_juris and "any" not in rule_juris:
+                if juris_lc not in rule_juris:
+                    rule_flags |= JURISDICTION_MISMATCH
+
+        # Gate: requires_clause
+        req_clauses = {c.lower() for c in rule.get("requires_clause", [])}
+        if req_clauses and clause_set.isdisjoint(req_clauses):
+            rule_flags |= NO_CLAUSE
+
+        applies_to = rule.get("applies_to") or {}
+        if isinstance(applies_to, dict):
+            rule_labels = applies_to.get("labels") or []
+            if rule_labels:
+                labels_provided = segment_labels_lc or set()
+                if not labels_provided.intersection(rule_labels):
+                    rule_flags |= SEGMENT_LABEL_MISMATCH
+
+            rule_kinds = applies_to.get("segment_kind") or []
+            if rule_kinds:
+                if not segment_kind_lc or segment_kind_lc not in rule_kinds:
+                    rule_flags |= SEGMENT_KIND_MISMATCH
+
+        # Triggers
+        ok = True
+        trig = rule.get("triggers") or {}
+
+        any_pats = trig.get("any")
+        if any_pats:
+            any_matches: List[str] = []
+            for p in any_pats:
+                for m in p.finditer(norm):
+                    any_matches.append(m.group(0))
+                    spans.append({"start": m.start(), "end": m.end()})
+            if not any_matches:
+                ok = False
+                rule_flags |= REGEX_MISS
+            else:
+                matches.extend(any_matches)
+
+        if ok:
+            all_pats = trig.get("all")
+            if all_pats:
+                all_matches: List[str] = []
+                for p in all_pats:
+                    m = p.search(norm)
+                    if not m:
+                        ok = False
+                        rule_flags |= REGEX_MISS
+                        break
+                    all_matches.append(m.group(0))
+                    spans.append({"start": m.start(), "end": m.end()})
+                if ok:
+                    matches.extend(all_matches)
+
+        if ok:
+            regex_pats = trig.get("regex")
+            if regex_pats:
+                regex_matches: List[str] = []
+                for p in regex_pats:
+                    for m in p.finditer(norm):
+                        regex_matches.append(m.group(0))
+                        spans.append({"start": m.start(), "end": m.end()})
+                if not regex_matches:
+                    ok = False
+                    rule_flags |= REGEX_MISS
+                else:
+                    matches.extend(regex_matches)
+
+        # Матч засчитываем только если нет gate-флагов и триггеры прошли
+        if ok and not rule_flags:
+            rule_flags |= FIRED
+            filtered.append({"rule": rule, "matches": matches})
+
+        coverage.append(
+            {
+                "doc_type": doc_type_lc,
+                "jurisdiction": juris_lc,
+                "pack_id": rule.get("pack"),
+                "rule_id": rule_id,
+                "severity": rule.get("severity"),
+                "evidence": matches,
+                "spans": spans,
+                "flags": rule_flags,
+            }
+        )
+
+    if not filtered:
+        baseline_rules = _get_baseline_rules()
+        if baseline_rules:
+            for rule in baseline_rules:
+                filtered.append({"rule": rule, "matches": []})
+                coverage.append(
+                    {
+                        "doc_type": doc_type_lc,
+                        "jurisdiction": juris_lc,
+                        "pack_id": rule.get("pack"),
+                        "rule_id": rule.get("id"),
+                        "severity": rule.get("severity"),
+                        "evidence": [],
+                        "spans": [],
+                        "flags": 0,
+                    }
+                )
+
+    return filtered, coverage
+
+
+@lru_cache(maxsize=1)
+def _get_baseline_rules() -> List[Dict[str, Any]]:
+    """Load baseline pattern rules used as a fallback when filtering yields none."""
+
+    if not BASELINE_FILE.exists():
+        return []
+
+    try:
+        raw_docs = list(yaml.safe_load_all(BASELINE_FILE.read_text(encoding="utf-8")))
+    except Exception as exc:  # pragma: no cover
+        log.error("Failed to load baseline patterns: %s", exc)
+        return []
+
+    specs: List[Dict[str, Any]] = []
+    try:
+        pack_id = str(BASELINE_FILE.relative_to(ROOT_DIR))
+    except ValueError:  # pragma: no cover
+        pack_id = str(BASELINE_FILE)
+
+    def _flatten(doc: Any) -> Iterable[Dict[str, Any]]:
+        if not doc:
+            return []
+        if isinstance(doc, dict) and doc.get("rules"):
+            return list(doc.get("rules") or [])
+        if isinstance(doc, dict) and doc.get("rule"):
+            return [doc.get("rule")]
+        if isinstance(doc, dict):
+            return [doc]
+        if isinstance(doc, list):
+            return list(doc)
+        return []
+
+    for doc in raw_docs:
+        for idx, raw in enumerate(_flatten(doc)):
+            if not isinstance(raw, dict):
+                continue
+            rid = str(raw.get("id") or raw.get("rule_id") or f"baseline-{idx}")
+            compiled = _compile(raw.get("patterns", []) or [])
+            specs.append(
+                {
+                    "id": rid,
+                    "rule_id": rid,
+                    "Title": raw.get("Title"),
+                    "title": raw.get("title"),
+                    "clause_type": raw.get("clause_type"),
+                    "severity": str(raw.get("severity") or "low").lower(),
+                    "patterns": compiled,
+                    "advice": raw.get("advice") or "",
+                    "law_refs": list(raw.get("law_refs") or []),
+                    "suggestion": raw.get("suggestion"),
+                    "conflict_with": list(raw.get("conflict_with") or []),
+                    "ops": raw.get("ops") or [],
+                    "pack": pack_id,
+                    "triggers": {},
+                    "requires_clause_hit": False,
+                    "doc_types": [],
+                    "jurisdiction": [],
+                    "requires_clause": [],
+                    "deprecated": False,
+                }
+            )
+
+    return specs
+
+
+def match_text(text: str) -> List[Dict[str, Any]]:
+    from . import engine
+
+    _ensure_loaded()
+    return engine.analyze(text or "", _rules())